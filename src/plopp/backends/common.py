@@ -7,6 +7,7 @@ from typing import Literal
 import numpy as np
 import scipp as sc
 
+from ..core.limits import find_numeric_limits, scratch_buffer
 from ..core.utils import merge_masks
 from ..graphics.bbox import BoundingBox, axis_bounds
 
@@ -32,6 +33,26 @@ def check_ndim(data: sc.DataArray, ndim: int, origin: str) -> None:
         )
 
 
+def parse_dicts_in_kwargs(kwargs: dict, name: str) -> dict:
+    """
+    Select the artist-specific values from keyword arguments. If the value of an
+    argument is a dict, the entry for the artist called ``name`` is used (and the
+    argument is dropped if there is none). Other values apply to all artists.
+
+    Parameters
+    ----------
+    kwargs:
+        The keyword arguments to parse.
+    name:
+        The name of the artist (the name of its data array).
+    """
+    return {
+        key: value[name] if isinstance(value, dict) else value
+        for key, value in kwargs.items()
+        if not isinstance(value, dict) or name in value
+    }
+
+
 def make_line_data(data: sc.DataArray, dim: str) -> dict:
     """
     Prepare data for plotting a line.
@@ -54,7 +75,8 @@ def make_line_data(data: sc.DataArray, dim: str) -> dict:
     xvalues = np.asarray(x.values)
     yvalues = np.asarray(y.values)
     values = {'x': xvalues, 'y': yvalues}
-    mask = {'x': xvalues, 'y': np.full(y.shape, np.nan), 'visible': False}
+    # Hidden masks do not need any data, so we avoid allocating arrays for them
+    mask = {'x': np.empty(0), 'y': np.empty(0), 'visible': False}
     if data.variances is not None:
         error = {
             'x': np.asarray(sc.midpoints(x).values) if hist else xvalues,
@@ -69,8 +91,9 @@ def make_line_data(data: sc.DataArray, dim: str) -> dict:
             'visible': True,
         }
     if hist:
-        for array in (values, mask):
-            array['y'] = np.concatenate([array['y'][0:1], array['y']])
+        values['y'] = np.concatenate([yvalues[0:1], yvalues])
+        if mask['visible']:
+            mask['y'] = np.concatenate([mask['y'][0:1], mask['y']])
     return {'values': values, 'stddevs': error, 'mask': mask, 'hist': hist}
 
 
@@ -80,6 +103,7 @@ def make_line_bbox(
     errorbars: bool,
     xscale: Literal['linear', 'log'],
     yscale: Literal['linear', 'log'],
+    buffers: dict[str, dict] | None = None,
 ) -> BoundingBox:
     """
     Calculate the bounding box of a line artist.
@@ -97,20 +121,70 @@ def make_line_bbox(
         The scale of the x-axis.
     yscale:
         The scale of the y-axis.
+    buffers:
+        Scratch arrays kept by the line between calls, with one dict for each of the
+        ``'x'`` and ``'y'`` axes. If ``None``, new arrays are allocated.
     """
+    if buffers is None:
+        buffers = {'x': None, 'y': None}
     line_x = data.coords[dim]
+    xlimits = find_numeric_limits(
+        line_x.values, scale=xscale, pad=True, buffers=buffers['x']
+    )
+    if xlimits is None:
+        xbounds = axis_bounds(('xmin', 'xmax'), line_x, xscale, pad=True)
+    else:
+        xbounds = dict(zip(('xmin', 'xmax'), xlimits, strict=True))
+
+    mask = _merge_line_masks(data, buffers['y']) if data.masks else None
     if errorbars:
-        stddevs = sc.stddevs(data.data)
-        line_y = sc.DataArray(
-            data=sc.concat(
-                [data.data - stddevs, data.data + stddevs], dim=uuid.uuid4().hex
-            ),
-            masks=data.masks,
+        # The lower and upper ends of the error bars are reduced separately, instead
+        # of concatenating them into a single scipp variable.
+        stddevs = sc.stddevs(data.data).values
+        yvalues = (data.values - stddevs, data.values + stddevs)
+    else:
+        yvalues = data.values
+    ylimits = find_numeric_limits(
+        yvalues, scale=yscale, pad=True, mask=mask, buffers=buffers['y']
+    )
+    if ylimits is None:
+        ybounds = axis_bounds(
+            ('ymin', 'ymax'),
+            _errorbar_ends(data) if errorbars else data,
+            yscale,
+            pad=True,
         )
     else:
-        line_y = data
+        ybounds = dict(zip(('ymin', 'ymax'), ylimits, strict=True))
+
+    return BoundingBox(**xbounds, **ybounds)
+
+
+def _merge_line_masks(data: sc.DataArray, buffers: dict | None) -> np.ndarray:
+    """
+    Combine the masks of a line into a single boolean array with the shape of the
+    data. The masks are OR-ed into a scratch array, instead of making a new scipp
+    variable for every mask.
+    """
+    masks = [np.broadcast_to(m.values, data.shape) for m in data.masks.values()]
+    if len(masks) == 1:
+        return masks[0]
+    out = scratch_buffer(buffers, 'mask', data.shape)
+    np.logical_or(masks[0], masks[1], out=out)
+    for m in masks[2:]:
+        np.logical_or(out, m, out=out)
+    return out
+
 
-    return BoundingBox(
-        **{**axis_bounds(('xmin', 'xmax'), line_x, xscale, pad=True)},
-        **{**axis_bounds(('ymin', 'ymax'), line_y, yscale, pad=True)},
+def _errorbar_ends(data: sc.DataArray) -> sc.DataArray:
+    """
+    Concatenate the lower and upper ends of the error bars of the data, keeping the
+    masks.
+    """
+    stddevs = sc.stddevs(data.data)
+    return sc.DataArray(
+        data=sc.concat(
+            [data.data - stddevs, data.data + stddevs], dim=uuid.uuid4().hex
+        ),
+        masks=data.masks,
     )
@@ -2,18 +2,23 @@
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
 import warnings
-from typing import Literal
+from typing import IO, Literal
 
 import matplotlib.pyplot as plt
 import numpy as np
 import scipp as sc
 from matplotlib import dates as mdates
-from mpl_toolkits.axes_grid1 import make_axes_locatable
 
-from ...core.utils import maybe_variable_to_number, scalar_to_string
+from ...core.utils import maybe_variable_to_number, value_to_string
 from ...graphics.bbox import BoundingBox
 from ...utils import parse_mutually_exclusive
-from .utils import fig_to_bytes, is_sphinx_build, make_figure, make_legend
+from .utils import (
+    fig_to_bytes,
+    is_interactive_backend,
+    is_sphinx_build,
+    make_figure,
+    make_legend,
+)
 
 
 def _cursor_value_to_variable(x: float, dtype: sc.DType, unit: str) -> sc.Variable:
@@ -27,10 +32,18 @@ def _cursor_value_to_variable(x: float, dtype: sc.DType, unit: str) -> sc.Variab
     return sc.scalar(x, unit=unit)
 
 
-def _cursor_formatter(x: float, dtype: sc.DType, unit: str) -> str:
+def _cursor_unit_suffix(dtype: sc.DType, unit: sc.Unit | None) -> str:
+    if (unit in (None, "")) or (dtype == sc.DType.datetime64):
+        return ""
+    return f" {unit}"
+
+
+def _cursor_formatter(x: float, dtype: sc.DType, unit_suffix: str) -> str:
+    # This is called on every mouse move, so we format the raw number and append a
+    # pre-computed unit string instead of going through a scipp scalar.
     if dtype == sc.DType.datetime64:
         return mdates.num2date(x).replace(tzinfo=None).isoformat()
-    return scalar_to_string(sc.scalar(x, unit=unit))
+    return value_to_string(x) + unit_suffix
 
 
 def _maybe_trim_polar_limits(
@@ -152,6 +165,14 @@ class Canvas:
         self.units = {}
         self.dims = {}
         self._legend = legend
+        # Cached pixels of the axes (without the blitted artists), used to redraw
+        # only the artists that changed, see ``blit``.
+        self._background = None
+        self._background_nchildren = None
+        self._blitted = False
+        # All the artists that have been updated with ``blit``. They are all hidden
+        # when capturing the background, and all redrawn on top of it.
+        self._blit_artists = []
 
         if self.ax is None:
             self.fig = make_figure(figsize=(6.0, 4.0) if figsize is None else figsize)
@@ -171,9 +192,19 @@ class Canvas:
                     [bounds[0] + bounds[2] + 0.1, 0.1, 0.03, 0.8]
                 )
             else:
+                from mpl_toolkits.axes_grid1 import make_axes_locatable
+
                 divider = make_axes_locatable(self.ax)
                 self.cax = divider.append_axes("right", "4%", pad="5%")
 
+        # Any change of the axes limits, the colorbar range, or the figure size makes
+        # the cached background obsolete.
+        for axes in (self.ax, self.cax):
+            if axes is not None:
+                axes.callbacks.connect('xlim_changed', self._invalidate_background)
+                axes.callbacks.connect('ylim_changed', self._invalidate_background)
+        self.fig.canvas.mpl_connect('resize_event', self._invalidate_background)
+
         self.ax.grid(grid)
         if title:
             self.ax.set_title(title)
@@ -218,9 +249,90 @@ class Canvas:
     def draw(self):
         """
         Make a draw call to the underlying figure.
-        """
+        If the only changes since the last draw were already rendered with ``blit``,
+        the full draw is skipped.
+        """
+        if self._blitted:
+            self._blitted = False
+            if self._only_blitted_changes():
+                return
+        self._background = None
         self.fig.canvas.draw_idle()
 
+    def _invalidate_background(self, *args, **kwargs):
+        self._background = None
+        self._blitted = False
+
+    def _only_blitted_changes(self) -> bool:
+        """
+        Return ``True`` if no artist other than the blitted ones has changed since the
+        background was captured. A change to any artist marks its direct parent as
+        stale, so it is enough to look at the direct children of each axes.
+        """
+        return not any(
+            child.stale
+            for axes in self.fig.axes
+            for child in axes.get_children()
+            if not any(child is a for a in self._blit_artists)
+        )
+
+    def can_blit(self) -> bool:
+        """
+        Return ``True`` if the figure can be updated by blitting.
+        This requires an interactive backend whose canvas supports blitting.
+        """
+        return self.fig.canvas.supports_blit and is_interactive_backend()
+
+    def capture_background(self):
+        """
+        Make a full draw of the figure with all the blitted artists hidden, and cache
+        the resulting pixels inside the axes as a background for ``blit``.
+        """
+        # Forget the artists that have been removed from the axes
+        self._blit_artists = [a for a in self._blit_artists if a.axes is self.ax]
+        visible = [a.get_visible() for a in self._blit_artists]
+        for a in self._blit_artists:
+            a.set_visible(False)
+        self.fig.canvas.draw()
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        self._background_nchildren = len(self.ax.get_children())
+        # Some artists are not marked as clean when drawn (e.g. empty texts). Clearing
+        # the flags makes any later change show up in ``_only_blitted_changes``.
+        for axes in self.fig.axes:
+            for child in axes.get_children():
+                child.stale = False
+        for a, vis in zip(self._blit_artists, visible, strict=True):
+            a.set_visible(vis)
+
+    def blit(self, artists: list):
+        """
+        Redraw the blitted artists on top of the cached background, instead of
+        re-rendering the entire figure. Nothing is drawn if blitting is not supported:
+        the artists are then rendered by the next call to ``draw``.
+
+        Parameters
+        ----------
+        artists:
+            The artists that have changed and need to be redrawn.
+        """
+        if not self.can_blit():
+            return
+        new = [a for a in artists if not any(a is b for b in self._blit_artists)]
+        if new:
+            # The new artists are part of the current background, which must be
+            # captured again without them.
+            self._blit_artists.extend(new)
+            self._background = None
+        if (self._background is None) or (
+            self._background_nchildren != len(self.ax.get_children())
+        ):
+            self.capture_background()
+        self.fig.canvas.restore_region(self._background)
+        for a in sorted(self._blit_artists, key=lambda a: a.get_zorder()):
+            self.ax.draw_artist(a)
+        self.fig.canvas.blit(self.ax.bbox)
+        self._blitted = True
+
     def update_legend(self):
         """
         Update the legend on the canvas.
@@ -231,8 +343,9 @@ class Canvas:
                 self.ax.legend(handles, labels, **make_legend(self._legend))
             elif (leg := self.ax.get_legend()) is not None:
                 leg.remove()
+            self._invalidate_background()
 
-    def save(self, filename: str, **kwargs):
+    def save(self, filename: str | IO[bytes], **kwargs):
         """
         Save the figure to file.
         The default directory for writing the file is the same as the
@@ -242,7 +355,10 @@ class Canvas:
         ----------
         filename:
             Name of the output file. Possible file extensions are ``.jpg``, ``.png``,
-            ``.svg``, and ``.pdf``.
+            ``.svg``, and ``.pdf``. A binary file-like object (e.g. ``io.BytesIO``) can
+            also be used, in which case the format must be given as ``format='png'``.
+        **kwargs:
+            Additional arguments are forwarded to Matplotlib's ``savefig``.
         """
         self.fig.savefig(filename, **{**{'bbox_inches': 'tight'}, **kwargs})
 
@@ -267,6 +383,10 @@ class Canvas:
         if 'y' in self.dims:
             self._cursor_x_prefix = self.dims['x'] + '='
             self._cursor_y_prefix = self.dims['y'] + '='
+        self._cursor_unit_suffixes = {
+            key: _cursor_unit_suffix(self.dtypes[key], unit)
+            for key, unit in self.units.items()
+        }
         self.ax.format_coord = self.format_coord
         key = 'y' if 'y' in self.units else 'data'
         self.bbox = BoundingBox(
@@ -294,9 +414,9 @@ class Canvas:
         y:
             The y coordinate of the mouse pointer.
         """
-        xstr = _cursor_formatter(x, self.dtypes['x'], self.units['x'])
+        xstr = _cursor_formatter(x, self.dtypes['x'], self._cursor_unit_suffixes['x'])
         key = 'y' if 'y' in self.dtypes else 'data'
-        ystr = _cursor_formatter(y, self.dtypes[key], self.units[key])
+        ystr = _cursor_formatter(y, self.dtypes[key], self._cursor_unit_suffixes[key])
         out = f"({self._cursor_x_prefix}{xstr}, {self._cursor_y_prefix}{ystr})"
         if not self._coord_formatters:
             return out
@@ -335,6 +455,7 @@ class Canvas:
     @title.setter
     def title(self, text: str):
         self.ax.set_title(text)
+        self._invalidate_background()
 
     @property
     def xlabel(self) -> str:
@@ -346,6 +467,7 @@ class Canvas:
     @xlabel.setter
     def xlabel(self, lab: str):
         self.ax.set_xlabel(lab)
+        self._invalidate_background()
 
     @property
     def ylabel(self) -> str:
@@ -357,6 +479,7 @@ class Canvas:
     @ylabel.setter
     def ylabel(self, lab: str):
         self.ax.set_ylabel(lab)
+        self._invalidate_background()
 
     @property
     def cblabel(self) -> str:
@@ -368,6 +491,7 @@ class Canvas:
     @cblabel.setter
     def cblabel(self, lab: str):
         self.cax.set_ylabel(lab)
+        self._invalidate_background()
 
     @property
     def xscale(self) -> Literal['linear', 'log']:
@@ -379,6 +503,7 @@ class Canvas:
     @xscale.setter
     def xscale(self, scale: Literal['linear', 'log']):
         self.ax.set_xscale(scale)
+        self._invalidate_background()
 
     @property
     def yscale(self) -> Literal['linear', 'log']:
@@ -390,6 +515,7 @@ class Canvas:
     @yscale.setter
     def yscale(self, scale: Literal['linear', 'log']):
         self.ax.set_yscale(scale)
+        self._invalidate_background()
 
     @property
     def xmin(self) -> float:
@@ -461,6 +587,31 @@ class Canvas:
     def yrange(self, value: tuple[float, float]):
         self.ax.set_ylim(value)
 
+    def set_ranges(
+        self,
+        xrange: tuple[float, float] | None = None,
+        yrange: tuple[float, float] | None = None,
+    ):
+        """
+        Set the ranges of the x and y axes in a single update of the axes.
+
+        Parameters
+        ----------
+        xrange:
+            The new range of the x-axis. If ``None``, the x-axis is left untouched.
+        yrange:
+            The new range of the y-axis. If ``None``, the y-axis is left untouched.
+        """
+        limits = {}
+        if xrange is not None:
+            limits['xlim'] = _maybe_trim_polar_limits(
+                axis_type=self.ax.name, limits=xrange
+            )
+        if yrange is not None:
+            limits['ylim'] = yrange
+        if limits:
+            self.ax.set(**limits)
+
     @property
     def logx(self) -> bool:
         """
@@ -493,6 +644,7 @@ class Canvas:
     @grid.setter
     def grid(self, visible: bool):
         self.ax.grid(visible)
+        self._invalidate_background()
 
     def reset_mode(self):
         """
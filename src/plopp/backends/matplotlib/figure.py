@@ -2,6 +2,8 @@
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 from __future__ import annotations
 
+from typing import IO
+
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure as MplFigure
 
@@ -48,7 +50,7 @@ class MplBaseFig(BaseFig):
         """
         return self.view.canvas.cax
 
-    def save(self, filename: str, **kwargs):
+    def save(self, filename: str | IO[bytes], **kwargs):
         """
         Save the figure to file.
         The default directory for writing the file is the same as the
@@ -58,7 +60,10 @@ class MplBaseFig(BaseFig):
         ----------
         filename:
             Name of the output file. Possible file extensions are ``.jpg``, ``.png``,
-            ``.svg``, and ``.pdf``.
+            ``.svg``, and ``.pdf``. A binary file-like object (e.g. ``io.BytesIO``) can
+            also be used, in which case the format must be given as ``format='png'``.
+        **kwargs:
+            Additional arguments are forwarded to Matplotlib's ``savefig``.
         """
         return self.view.canvas.save(filename, **kwargs)
 
@@ -11,9 +11,15 @@ from matplotlib.lines import Line2D
 from numpy.typing import ArrayLike
 
 from ...graphics.bbox import BoundingBox
-from ..common import check_ndim, make_line_bbox, make_line_data
+from ..common import (
+    check_ndim,
+    make_line_bbox,
+    make_line_data,
+    parse_dicts_in_kwargs,
+)
 from .canvas import Canvas
-from .utils import parse_dicts_in_kwargs
+
+_MARKERS = tuple(Line2D.markers.keys())
 
 
 def _to_float(x):
@@ -58,6 +64,8 @@ class Line:
         self._canvas = canvas
         self._ax = self._canvas.ax
         self._data = data
+        # Scratch arrays re-used when computing the bounding box
+        self._bbox_buffers = {'x': {}, 'y': {}}
 
         line_args = parse_dicts_in_kwargs(kwargs, name=data.name)
 
@@ -85,11 +93,10 @@ class Line:
             'color': f'C{artist_number}',
             'zorder': 2,
         }
-        markers = list(Line2D.markers.keys())
         default_plot_style = {
             'linestyle': 'none',
             'linewidth': 1.5,
-            'marker': markers[(artist_number + 2) % len(markers)],
+            'marker': _MARKERS[(artist_number + 2) % len(_MARKERS)],
             'color': f'C{artist_number}',
             'zorder': 2,
         }
@@ -170,10 +177,14 @@ class Line:
     def _change_segments_y(self, x: ArrayLike, y: ArrayLike, e: ArrayLike) -> ArrayLike:
         """
         Update the positions of the errorbars when `update_data` is called.
+        The (N, 2, 2) array of segments is filled directly, instead of stacking and
+        transposing intermediate arrays of the lower and upper ends.
         """
-        arr1 = np.repeat(x, 2)
-        arr2 = np.array([y - e, y + e]).T.flatten()
-        return np.array([arr1, arr2]).T.flatten().reshape(len(y), 2, 2)
+        segments = np.empty((len(y), 2, 2))
+        segments[:, :, 0] = np.asarray(x)[:, None]
+        np.subtract(y, e, out=segments[:, 0, 1])
+        np.add(y, e, out=segments[:, 1, 1])
+        return segments
 
     def remove(self):
         """
@@ -183,7 +194,6 @@ class Line:
         self._mask.remove()
         if self._error is not None:
             self._error.remove()
-        self._canvas.draw()
 
     @property
     def color(self) -> str:
@@ -289,4 +299,5 @@ class Line:
             errorbars=self._error is not None,
             xscale=xscale,
             yscale=yscale,
+            buffers=self._bbox_buffers,
         )
@@ -2,11 +2,13 @@
 # Copyright (c) 2025 Scipp contributors (https://github.com/scipp)
 
 import uuid
+from dataclasses import replace
 from typing import Literal
 
 import numpy as np
 import scipp as sc
 
+from ...core.limits import find_numeric_limits
 from ...core.utils import coord_as_bin_edges, merge_masks, repeat, scalar_to_string
 from ...graphics.bbox import BoundingBox, axis_bounds
 from ...graphics.colormapper import ColorMapper
@@ -57,6 +59,34 @@ def _from_data_array_to_pcolormesh(data, coords, dim_1d, dim_2d):
     return out['x'], out['y'], z
 
 
+def _mesh_axis_bounds(
+    keys: tuple[str, str],
+    coord: sc.Variable,
+    scale: Literal['linear', 'log'],
+    buffers: dict,
+) -> dict[str, float]:
+    """
+    Find the limits of a mesh coordinate using NumPy reductions on the raw values.
+    This avoids the construction of scipp variables in ``axis_bounds``, which is only
+    needed for non-numerical coordinates or when no valid values are found.
+
+    Parameters
+    ----------
+    keys:
+        The keys to use for constructing a bounding box.
+    coord:
+        The (bin-edge) coordinate of the mesh.
+    scale:
+        The scale of the axis (linear or log).
+    buffers:
+        Scratch arrays kept between calls, see ``find_numeric_limits``.
+    """
+    limits = find_numeric_limits(coord.values, scale=scale, buffers=buffers)
+    if limits is None:
+        return axis_bounds(keys, coord, scale)
+    return dict(zip(keys, limits, strict=True))
+
+
 class MeshImage:
     """
     Artist to represent two-dimensional data.
@@ -119,7 +149,18 @@ class MeshImage:
                 string_labels[k] = self._data.coords[self._data.dims[i]]
 
         self._dim_1d, self._dim_2d = _get_dims_of_1d_and_2d_coords(to_dim_search)
+        # With a 2d coordinate, the mesh has repeated values along the axis of the 1d
+        # coordinate. The colors are computed from the original values and repeated
+        # into a buffer that is re-used between updates.
+        self._repeat_axis = (
+            None if self._dim_2d is None else self._data.dims.index(self._dim_1d[1])
+        )
+        self._colors = None
         self._mesh = None
+        # Scratch arrays used when computing the bounding box, and bounding boxes
+        # already computed for a given pair of axis scales
+        self._scratch = {'x': {}, 'y': {}}
+        self._bbox_cache = {}
 
         x, y, z = _from_data_array_to_pcolormesh(
             data=self._data.data,
@@ -160,7 +201,11 @@ class MeshImage:
                 data=self._data.data, dim_1d=self._dim_1d, dim_2d=self._dim_2d
             )
         )
-        if self._data.masks:
+        if self._dim_2d is None:
+            # The masks are combined by the colormapper, there is no need to merge
+            # them here first.
+            out.masks.update(self._data.masks)
+        elif self._data.masks:
             out.masks['one_mask'] = _maybe_repeat_values(
                 data=sc.broadcast(
                     merge_masks(self._data.masks), sizes=self._data.sizes
@@ -185,9 +230,34 @@ class MeshImage:
     def _update_colors(self):
         """
         Update the mesh colors.
+        The colors are computed by the colormapper, instead of giving the values to
+        the mesh with ``set_array``: Matplotlib's own mapping is not faster, and it
+        cannot give masked values and NaNs different colors.
+        """
+        rgba = self._colormapper.rgba(self._data, key=self.uid)
+        if self._repeat_axis is not None:
+            rgba = self._repeat_colors(rgba)
+        self._mesh.set_facecolors(rgba.reshape(-1, 4))
+
+    def _repeat_colors(self, rgba: np.ndarray) -> np.ndarray:
         """
-        rgba = self._colormapper.rgba(self.data)
-        self._mesh.set_facecolors(rgba.reshape(np.prod(rgba.shape[:-1]), 4))
+        Repeat the colors along the axis of the 1d coordinate, in the same way as the
+        values are repeated in ``data`` (every value twice, except the last).
+        """
+        axis = self._repeat_axis
+        shape = list(rgba.shape)
+        shape[axis] = 2 * shape[axis] - 1
+        if (self._colors is None) or (self._colors.shape != tuple(shape)):
+            self._colors = np.empty(shape, dtype=rgba.dtype)
+        even = [slice(None)] * rgba.ndim
+        odd = list(even)
+        head = list(even)
+        even[axis] = slice(0, None, 2)
+        odd[axis] = slice(1, None, 2)
+        head[axis] = slice(None, -1)
+        self._colors[tuple(even)] = rgba
+        self._colors[tuple(odd)] = rgba[tuple(head)]
+        return self._colors
 
     def update(self, new_values: sc.DataArray):
         """
@@ -251,15 +321,24 @@ class MeshImage:
     def bbox(self, xscale: Literal['linear', 'log'], yscale: Literal['linear', 'log']):
         """
         The bounding box of the image.
+        The mesh coordinates are fixed when the artist is created (``update`` only
+        changes the values), so the bounds are computed once for each pair of scales.
         """
-        ydim, xdim = self._data.dims
-        image_x = self._data_with_bin_edges.coords[xdim]
-        image_y = self._data_with_bin_edges.coords[ydim]
-
-        return BoundingBox(
-            **{**axis_bounds(('xmin', 'xmax'), image_x, xscale)},
-            **{**axis_bounds(('ymin', 'ymax'), image_y, yscale)},
-        )
+        key = (xscale, yscale)
+        if key not in self._bbox_cache:
+            ydim, xdim = self._data.dims
+            bounds = {}
+            for xy, dim, scale in (('x', xdim, xscale), ('y', ydim, yscale)):
+                bounds.update(
+                    _mesh_axis_bounds(
+                        (f'{xy}min', f'{xy}max'),
+                        self._data_with_bin_edges.coords[dim],
+                        scale,
+                        self._scratch[xy],
+                    )
+                )
+            self._bbox_cache[key] = BoundingBox(**bounds)
+        return replace(self._bbox_cache[key])
 
     def remove(self):
         """
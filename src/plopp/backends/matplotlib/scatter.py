@@ -11,9 +11,10 @@ from matplotlib.lines import Line2D
 from ...core.utils import merge_masks
 from ...graphics.bbox import BoundingBox, axis_bounds
 from ...graphics.colormapper import ColorMapper
-from ..common import check_ndim
+from ..common import check_ndim, parse_dicts_in_kwargs
 from .canvas import Canvas
-from .utils import parse_dicts_in_kwargs
+
+_MARKERS = tuple(Line2D.markers.keys())
 
 
 class Scatter:
@@ -69,6 +70,8 @@ class Scatter:
         self._y = y
         self._size = size
         self._colormapper = colormapper
+        # The colormapper state used to compute the current colors
+        self._colors_state = None
 
         if 's' in kwargs:
             raise ValueError("Use 'size' instead of 's' for scatter plot.")
@@ -77,11 +80,9 @@ class Scatter:
 
         self.label = data.name if not cbar else None
         self._unit = self._data.unit
-        self._id = uuid.uuid4().hex
 
-        markers = list(Line2D.markers.keys())
         default_plot_style = {
-            'marker': markers[(artist_number + 2) % len(markers)],
+            'marker': _MARKERS[(artist_number + 2) % len(_MARKERS)],
         }
         if not cbar:
             default_plot_style['color'] = f'C{artist_number}'
@@ -104,25 +105,16 @@ class Scatter:
             self._colormapper.add_artist(self.uid, self)
             self._scatter.set_array(None)
 
-        xmask = self._data.coords[self._x].values.copy()
-        ymask = self._data.coords[self._y].values.copy()
-        visible_mask = False
-        if self._data.masks:
-            not_one_mask = ~merge_masks(self._data.masks).values
-            xmask[not_one_mask] = np.nan
-            ymask[not_one_mask] = np.nan
-            visible_mask = True
-        self._mask = self._ax.scatter(
-            xmask,
-            ymask,
-            s=marker_size,
-            marker=merged_kwargs['marker'],
-            edgecolors=mask_color or 'black',
-            facecolor="None",
-            linewidth=3.0,
-            zorder=self._scatter.get_zorder() + 1,
-            visible=visible_mask,
-        )
+        # The mask artist is only created when the data has masks
+        self._mask = None
+        self._mask_style = {
+            'marker': merged_kwargs['marker'],
+            'edgecolors': mask_color or 'black',
+            'facecolor': "None",
+            'linewidth': 3.0,
+            'zorder': self._scatter.get_zorder() + 1,
+        }
+        self._update_mask()
 
     def notify_artist(self, message: str) -> None:
         """
@@ -136,11 +128,55 @@ class Scatter:
         """
         self._update_colors()
 
-    def _update_colors(self):
+    def _update_colors(self, force: bool = False):
         """
         Update the colors of the scatter points.
+        Unless ``force`` is ``True``, the colors are only re-computed if the state of
+        the colormapper has changed since the last update.
+        """
+        mapper = self._colormapper
+        state = mapper.color_state()
+        if (not force) and (self._colors_state == state):
+            return
+        self._scatter.set_facecolors(mapper.rgba(self.data, key=self.uid))
+        self._colors_state = state
+
+    def _update_mask(self):
+        """
+        Update the positions of the masked points. The mask artist is created when
+        masks first appear in the data, and removed when there are no more masks.
         """
-        self._scatter.set_facecolors(self._colormapper.rgba(self.data))
+        if not self._data.masks:
+            if self._mask is not None:
+                self._mask.remove()
+                self._mask = None
+            return
+        # Only the masked points are given to the mask artist, so that its offsets,
+        # sizes and marker transforms scale with the number of masked points.
+        one_mask = np.broadcast_to(
+            merge_masks(self._data.masks).values, self._data.shape
+        )
+        offsets = np.column_stack(
+            [
+                self._data.coords[self._x].values[one_mask],
+                self._data.coords[self._y].values[one_mask],
+            ]
+        )
+        sizes = self._scatter.get_sizes()
+        if sizes.size > 1:
+            sizes = sizes[one_mask]
+        if self._mask is None:
+            self._mask = self._ax.scatter(
+                offsets[:, 0],
+                offsets[:, 1],
+                s=sizes,
+                visible=self._scatter.get_visible(),
+                alpha=self._scatter.get_alpha(),
+                **self._mask_style,
+            )
+        else:
+            self._mask.set_offsets(offsets)
+            self._mask.set_sizes(sizes)
 
     def update(self, new_values: sc.DataArray):
         """
@@ -153,23 +189,29 @@ class Scatter:
         """
         check_ndim(new_values, ndim=1, origin='Scatter')
         self._data = new_values
+        # ``set_offsets`` makes its own copy of the positions, so they are passed
+        # without filling an intermediate buffer first
         self._scatter.set_offsets(
-            np.stack(
-                [self._data.coords[self._x].values, self._data.coords[self._y].values],
-                axis=1,
+            np.column_stack(
+                [self._data.coords[self._x].values, self._data.coords[self._y].values]
             )
         )
         if isinstance(self._size, str):
             self._scatter.set_sizes(self._data.coords[self._size].values)
+        self._update_mask()
         if self._colormapper is not None:
-            self._update_colors()
+            # The data may have been modified in place, so the colors are always
+            # computed again
+            self._update_colors(force=True)
+        self._canvas.blit([a for a in (self._scatter, self._mask) if a is not None])
 
     def remove(self):
         """
         Remove the scatter and mask artists from the canvas.
         """
         self._scatter.remove()
-        self._mask.remove()
+        if self._mask is not None:
+            self._mask.remove()
         if self._colormapper is not None:
             self._colormapper.remove_artist(self.uid)
 
@@ -210,7 +252,8 @@ class Scatter:
     @opacity.setter
     def opacity(self, value: float):
         self._scatter.set_alpha(value)
-        self._mask.set_alpha(value)
+        if self._mask is not None:
+            self._mask.set_alpha(value)
 
     @property
     def visible(self) -> bool:
@@ -222,4 +265,5 @@ class Scatter:
     @visible.setter
     def visible(self, value: bool):
         self._scatter.set_visible(value)
-        self._mask.set_visible(value)
+        if self._mask is not None:
+            self._mask.set_visible(value)
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import IO, Any
 
 import numpy as np
 from matplotlib import gridspec
@@ -117,7 +117,7 @@ class Tiled:
             out.update(get_repr_maker(npoints=npoints)(self.fig))
             return out
 
-    def save(self, filename: str, **kwargs: Any) -> None:
+    def save(self, filename: str | IO[bytes], **kwargs: Any) -> None:
         """
         Save the figure to file.
         The default directory for writing the file is the same as the
@@ -127,7 +127,10 @@ class Tiled:
         ----------
         filename:
             Name of the output file. Possible file extensions are ``.jpg``, ``.png``,
-            ``.svg``, and ``.pdf``.
+            ``.svg``, and ``.pdf``. A binary file-like object (e.g. ``io.BytesIO``) can
+            also be used, in which case the format must be given as ``format='png'``.
+        **kwargs:
+            Additional arguments are forwarded to Matplotlib's ``savefig``.
         """
         self.fig.savefig(filename, **{**{'bbox_inches': 'tight'}, **kwargs})
 
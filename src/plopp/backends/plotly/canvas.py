@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
-from typing import Literal
+from typing import IO, Literal
 
 import scipp as sc
 
@@ -111,7 +111,7 @@ class Canvas:
     def to_widget(self):
         return self.fig
 
-    def save(self, filename: str):
+    def save(self, filename: str | IO[bytes], **kwargs):
         """
         Save the figure to file.
         The default directory for writing the file is the same as the
@@ -121,13 +121,16 @@ class Canvas:
         ----------
         filename:
             Name of the output file. Possible file extensions are ``.jpg``, ``.png``,
-            ``.svg``, ``.pdf``, and ``.html`.
+            ``.svg``, ``.pdf``, and ``.html`. Images can also be written to a binary
+            file-like object (e.g. ``io.BytesIO``), in which case the format must be
+            given as ``format='png'``.
+        **kwargs:
+            Additional arguments are forwarded to Plotly's ``write_image``.
         """
-        ext = filename.split('.')[-1]
-        if ext == 'html':
+        if isinstance(filename, str) and filename.split('.')[-1] == 'html':
             self.fig.write_html(filename)
         else:
-            self.fig.write_image(filename)
+            self.fig.write_image(filename, **kwargs)
 
     def set_axes(self, dims, units, dtypes):
         """
@@ -286,6 +289,28 @@ class Canvas:
     def yrange(self, value: tuple[float, float]):
         self.fig.layout.yaxis.range = value
 
+    def set_ranges(
+        self,
+        xrange: tuple[float, float] | None = None,
+        yrange: tuple[float, float] | None = None,
+    ):
+        """
+        Set the ranges of the x and y axes, sending a single layout update to the
+        front-end.
+
+        Parameters
+        ----------
+        xrange:
+            The new range of the x-axis. If ``None``, the x-axis is left untouched.
+        yrange:
+            The new range of the y-axis. If ``None``, the y-axis is left untouched.
+        """
+        with self.fig.batch_update():
+            if xrange is not None:
+                self.fig.layout.xaxis.range = xrange
+            if yrange is not None:
+                self.fig.layout.yaxis.range = yrange
+
     @property
     def logx(self) -> bool:
         """
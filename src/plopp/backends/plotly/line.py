@@ -10,19 +10,17 @@ import scipp as sc
 from plotly.colors import qualitative as plotly_colors
 
 from ...graphics.bbox import BoundingBox
-from ..common import check_ndim, make_line_bbox, make_line_data
+from ..common import (
+    check_ndim,
+    make_line_bbox,
+    make_line_data,
+    parse_dicts_in_kwargs,
+)
 from .canvas import Canvas
 
-
-def _parse_dicts_in_kwargs(kwargs, name):
-    out = {}
-    for key, value in kwargs.items():
-        if isinstance(value, dict):
-            if name in value:
-                out[key] = value[name]
-        else:
-            out[key] = value
-    return out
+_COLORS = tuple(plotly_colors.Plotly)
+# Plotly has 52 marker styles
+_NUMBER_OF_MARKERS = 52
 
 
 class Line:
@@ -52,6 +50,24 @@ class Line:
         The marker style to use.
     """
 
+    # Many lines can be created in a single figure, so we avoid a per-instance dict
+    __slots__ = (
+        '_bbox_buffers',
+        '_color',
+        '_coord',
+        '_data',
+        '_dim',
+        '_error',
+        '_fig',
+        '_line',
+        '_mask',
+        '_mask_style',
+        '_traces',
+        '_unit',
+        'label',
+        'uid',
+    )
+
     def __init__(
         self,
         canvas: Canvas,
@@ -68,8 +84,10 @@ class Line:
         self.uid = uid if uid is not None else uuid.uuid4().hex
         self._fig = canvas.fig
         self._data = data
+        # Scratch arrays re-used when computing the bounding box
+        self._bbox_buffers = {'x': {}, 'y': {}}
 
-        line_args = _parse_dicts_in_kwargs(kwargs, name=data.name)
+        line_args = parse_dicts_in_kwargs(kwargs, name=data.name)
 
         self._line = None
         self._mask = None
@@ -82,13 +100,8 @@ class Line:
 
         line_data = make_line_data(data=self._data, dim=self._dim)
 
-        default_colors = plotly_colors.Plotly
-        default_line_style = {
-            'color': default_colors[artist_number % len(default_colors)]
-        }
-        default_marker_style = {
-            'symbol': artist_number % 52  # Plotly has 52 marker styles
-        }
+        default_line_style = {'color': _COLORS[artist_number % len(_COLORS)]}
+        default_marker_style = {'symbol': artist_number % _NUMBER_OF_MARKERS}
 
         line_shape = None
 
@@ -101,10 +114,18 @@ class Line:
 
         marker_style = default_marker_style if marker is None else marker
         line_style = {**default_line_style, **line_args}
-
+        # Keep a copy of the color, to avoid going through the Plotly properties when
+        # reading it
+        self._color = line_style['color']
+
+        # `_validate=False` only skips the property checks made while constructing
+        # the standalone trace objects below. The figure still validates each trace
+        # in `add_traces`, so invalid style arguments (e.g. `colour='red'` or
+        # `width='thick'`) are still rejected with a ValueError.
         self._line = go.Scatter(
-            x=np.asarray(line_data['values']['x']),
-            y=np.asarray(line_data['values']['y']),
+            _validate=False,
+            x=line_data['values']['x'],
+            y=line_data['values']['y'],
             name=self.label,
             mode=mode,
             marker=marker_style,
@@ -114,8 +135,9 @@ class Line:
 
         if errorbars and (line_data['stddevs'] is not None):
             self._error = go.Scatter(
-                x=np.asarray(line_data['stddevs']['x']),
-                y=np.asarray(line_data['stddevs']['y']),
+                _validate=False,
+                x=line_data['stddevs']['x'],
+                y=line_data['stddevs']['y'],
                 line=line_style,
                 name=self.label,
                 mode='markers',
@@ -124,55 +146,92 @@ class Line:
                 showlegend=False,
             )
 
-        marker_line_style = {'width': 3, 'color': mask_color}
-        if 'line' in marker_style:
-            marker_style['line'].update(marker_line_style)
-        else:
-            marker_style['line'] = marker_line_style
-        if 'width' in line_style:
-            line_style['width'] *= 5
-        else:
-            line_style['width'] = 5
+        # The mask styles are new dicts, because the traces above hold on to the
+        # original ones (they are not copied when validation is skipped).
+        marker_style = {
+            **marker_style,
+            'line': {**marker_style.get('line', {}), 'width': 3, 'color': mask_color},
+        }
+        line_style = {**line_style, 'width': line_style.get('width', 1) * 5}
         if 'lines' in mode:
             line_style['color'] = mask_color
 
-        self._mask = go.Scatter(
-            x=np.asarray(line_data['mask']['x']),
-            y=np.asarray(line_data['mask']['y']),
-            name=self.label,
-            mode=mode,
-            marker=marker_style,
-            line_shape=line_shape,
-            line=line_style,
-            visible=line_data['mask']['visible'],
-            showlegend=False,
-        )
+        # The mask trace is only created when the data has masks, to avoid adding an
+        # invisible trace to the figure for every line.
+        self._mask_style = {
+            'name': self.label,
+            'mode': mode,
+            'marker': marker_style,
+            'line_shape': line_shape,
+            'line': line_style,
+            'showlegend': False,
+        }
 
-        # Below, we need to re-define the line because it seems that the Scatter trace
-        # that ends up in the figure is a copy of the one above.
         # Plotly has no concept of zorder, so we need to add the traces in a specific
-        # order
-        if 'lines' in mode:
-            self._fig.add_trace(self._mask)
-            self._mask = self._fig.data[-1]
-            self._fig.add_trace(self._line)
-            self._line = self._fig.data[-1]
-            if self._error is not None:
-                self._fig.add_trace(self._error)
-                self._error = self._fig.data[-1]
-        else:
-            self._fig.add_trace(self._line)
-            self._line = self._fig.data[-1]
-            if self._error is not None:
-                self._fig.add_trace(self._error)
-                self._error = self._fig.data[-1]
-            self._fig.add_trace(self._mask)
-            self._mask = self._fig.data[-1]
-
-        self._line._plopp_id = self.uid
-        self._mask._plopp_id = self.uid
+        # order. All traces are added in a single call, which avoids re-building the
+        # figure data and sending a message to the front-end for every trace.
+        traces = {'line': self._line}
         if self._error is not None:
-            self._error._plopp_id = self.uid
+            traces['error'] = self._error
+        if line_data['mask']['visible']:
+            traces['mask'] = self._make_mask_trace(line_data)
+        order = (
+            ('mask', 'line', 'error') if 'lines' in mode else ('line', 'error', 'mask')
+        )
+        keys = [key for key in order if key in traces]
+        self._fig.add_traces([traces[key] for key in keys])
+        # We need to re-define the traces because the Scatter traces that end up in
+        # the figure are copies of the ones above.
+        added = dict(zip(keys, self._fig.data[-len(keys) :], strict=True))
+        self._line = added['line']
+        self._mask = added.get('mask')
+        self._error = added.get('error')
+
+        # Keep track of the traces that belong to this line, to remove them later
+        self._traces = tuple(added.values())
+
+    def _make_mask_trace(self, line_data: dict) -> go.Scatter:
+        """
+        Make the trace that highlights the masked points of the line.
+
+        Parameters
+        ----------
+        line_data:
+            The line data, as returned by ``make_line_data``.
+        """
+        return go.Scatter(
+            _validate=False,
+            x=line_data['mask']['x'],
+            y=line_data['mask']['y'],
+            visible=self._mask_visibility(),
+            opacity=self._line.opacity,
+            **self._mask_style,
+        )
+
+    def _mask_visibility(self) -> bool | str:
+        """
+        The visibility of the mask trace, which follows that of the line.
+        """
+        return True if self._line.visible is None else self._line.visible
+
+    def _add_mask_trace(self, line_data: dict):
+        """
+        Add the mask trace to the figure, the first time masks appear in the data.
+        With lines, the mask is placed just below the line, otherwise it goes on top.
+
+        Parameters
+        ----------
+        line_data:
+            The line data, as returned by ``make_line_data``.
+        """
+        self._fig.add_traces([self._make_mask_trace(line_data)])
+        self._mask = self._fig.data[-1]
+        if 'lines' in self._mask_style['mode']:
+            data = list(self._fig.data[:-1])
+            index = next(i for i, t in enumerate(data) if t is self._line)
+            data.insert(index, self._mask)
+            self._fig.data = data
+        self._traces = (*self._traces, self._mask)
 
     def update(self, new_values: sc.DataArray):
         """
@@ -202,30 +261,37 @@ class Line:
                 )
 
             if line_data['mask']['visible']:
-                update = {'x': line_data['mask']['x'], 'y': line_data['mask']['y']}
-                self._mask.update(update)
-                self._mask.visible = True
-            else:
+                if self._mask is None:
+                    self._add_mask_trace(line_data)
+                else:
+                    update = {'x': line_data['mask']['x'], 'y': line_data['mask']['y']}
+                    self._mask.update(update)
+                    self._mask.visible = self._mask_visibility()
+            elif self._mask is not None:
                 self._mask.visible = False
 
     def remove(self):
         """
         Remove the line, masks and errorbar artists from the canvas.
         """
-        self._fig.data = [
-            trace for trace in list(self._fig.data) if trace._plopp_id != self.uid
-        ]
+        # Traces are compared by identity, which is also what Plotly uses internally,
+        # and the figure data is re-assigned only once.
+        mine = {id(trace) for trace in self._traces}
+        self._fig.data = tuple(
+            trace for trace in self._fig.data if id(trace) not in mine
+        )
 
     @property
     def color(self) -> str:
         """
         The line color.
         """
-        return self._line.line.color
+        return self._color
 
     @color.setter
     def color(self, val: str):
         self._line.line.color = val
+        self._color = val
 
     @property
     def style(self) -> str:
@@ -259,7 +325,9 @@ class Line:
     @marker.setter
     def marker(self, val: str):
         self._line.marker = val
-        self._mask.marker = val
+        self._mask_style['marker'] = val
+        if self._mask is not None:
+            self._mask.marker = val
 
     @property
     def visible(self) -> bool:
@@ -271,7 +339,8 @@ class Line:
     @visible.setter
     def visible(self, val: bool):
         self._line.visible = val
-        self._mask.visible = val
+        if self._mask is not None:
+            self._mask.visible = val
         if self._error is not None:
             self._error.visible = val
 
@@ -285,7 +354,8 @@ class Line:
     @opacity.setter
     def opacity(self, val: float):
         self._line.opacity = val
-        self._mask.opacity = val
+        if self._mask is not None:
+            self._mask.opacity = val
         if self._error is not None:
             self._error.opacity = val
 
@@ -309,6 +379,7 @@ class Line:
             errorbars=self._error is not None,
             xscale=xscale,
             yscale=yscale,
+            buffers=self._bbox_buffers,
         )
         if xscale == 'log':
             out.xmin = np.log10(out.xmin)
@@ -2,6 +2,7 @@
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
 import uuid
+from dataclasses import replace
 from typing import Literal
 
 import numpy as np
@@ -63,6 +64,8 @@ class Mesh3d:
 
         self.uid = uid if uid is not None else uuid.uuid4().hex
         self._data = data
+        # Bounding boxes already computed for a given set of axis scales
+        self._bbox_cache = {}
         self._canvas = canvas
         self._colormapper = colormapper
         self._artist_number = artist_number
@@ -88,7 +91,7 @@ class Mesh3d:
 
         if self._colormapper is not None:
             self._colormapper.add_artist(self.uid, self)
-            colors = self._colormapper.rgba(self.data)[..., :3].astype('float32')
+            colors = self._colormapper.rgb(self.data)
         else:
             colors = np.broadcast_to(
                 np.array(to_rgb(f'C{artist_number}' if color is None else color)),
@@ -140,11 +143,14 @@ class Mesh3d:
 
     def _update_colors(self):
         """
-        Set the point cloud's rgba colors:
+        Set the mesh's rgb colors.
+        Sending the colors to the front-end is much more expensive than comparing
+        them, so the colors are only sent if they have changed.
         """
-        self.geometry.attributes["color"].array = self._colormapper.rgba(self.data)[
-            ..., :3
-        ].astype('float32')
+        colors = self._colormapper.rgb(self.data)
+        attribute = self.geometry.attributes["color"]
+        if not np.array_equal(colors, attribute.array):
+            attribute.array = colors
 
     def update(self, new_values):
         """
@@ -172,19 +178,24 @@ class Mesh3d:
     ) -> BoundingBox:
         """
         The bounding box of the mesh.
-        """
-        coords = self._data.coords
-        xbounds = find_limits(coords['x'], scale=xscale)
-        ybounds = find_limits(coords['y'], scale=yscale)
-        zbounds = find_limits(coords['z'], scale=zscale)
-        return BoundingBox(
-            xmin=xbounds[0].value,
-            xmax=xbounds[1].value,
-            ymin=ybounds[0].value,
-            ymax=ybounds[1].value,
-            zmin=zbounds[0].value,
-            zmax=zbounds[1].value,
-        )
+        The vertex positions are fixed when the artist is created (``update`` only
+        changes the values), so the bounds are computed once for each set of scales.
+        """
+        key = (xscale, yscale, zscale)
+        if key not in self._bbox_cache:
+            coords = self._data.coords
+            xbounds = find_limits(coords['x'], scale=xscale)
+            ybounds = find_limits(coords['y'], scale=yscale)
+            zbounds = find_limits(coords['z'], scale=zscale)
+            self._bbox_cache[key] = BoundingBox(
+                xmin=xbounds[0].value,
+                xmax=xbounds[1].value,
+                ymin=ybounds[0].value,
+                ymax=ybounds[1].value,
+                zmin=zbounds[0].value,
+                zmax=zbounds[1].value,
+            )
+        return replace(self._bbox_cache[key])
 
     @property
     def opacity(self) -> float:
@@ -195,10 +206,12 @@ class Mesh3d:
 
     @opacity.setter
     def opacity(self, val: float):
-        self.material.opacity = val
+        # Send both material properties to the front-end in a single message
+        with self.material.hold_sync():
+            self.material.opacity = val
+            self.material.depthTest = val > 0.5
         if self.edges is not None:
             self.edges.material.opacity = val
-        self.material.depthTest = val > 0.5
 
     @property
     def visible(self) -> bool:
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
 import uuid
+from dataclasses import replace
 from typing import Literal
 
 import numpy as np
@@ -15,6 +16,13 @@ from ..common import check_ndim
 from .canvas import Canvas
 
 
+def _array_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    """
+    Compare two arrays, treating NaNs as equal if the arrays are floating point.
+    """
+    return np.array_equal(a, b, equal_nan=a.dtype.kind == 'f' and b.dtype.kind == 'f')
+
+
 class Scatter3d:
     """
     Artist to represent a three-dimensional point cloud/scatter plot.
@@ -73,6 +81,8 @@ class Scatter3d:
         self._canvas = canvas
         self._colormapper = colormapper
         self._data = data
+        # Bounding boxes already computed for a given set of axis scales
+        self._bbox_cache = {}
         self._x = x
         self._y = y
         self._z = z
@@ -91,29 +101,10 @@ class Scatter3d:
                     dtype=float, unit=self._data.coords[x].unit
                 ).value
 
+        self._color = to_rgb(f'C{artist_number}' if color is None else color)
         if self._colormapper is not None:
             self._colormapper.add_artist(self.uid, self)
-            colors = self._colormapper.rgba(self.data)[..., :3].astype('float32')
-        else:
-            colors = np.broadcast_to(
-                np.array(to_rgb(f'C{artist_number}' if color is None else color)),
-                (self._data.coords[self._x].shape[0], 3),
-            ).astype('float32')
-
-        self.geometry = p3.BufferGeometry(
-            attributes={
-                'position': p3.BufferAttribute(
-                    array=np.array(
-                        [
-                            self._data.coords[self._x].values.astype('float32'),
-                            self._data.coords[self._y].values.astype('float32'),
-                            self._data.coords[self._z].values.astype('float32'),
-                        ]
-                    ).T
-                ),
-                'color': p3.BufferAttribute(array=colors),
-            }
-        )
+        self.geometry = self._make_geometry()
 
         # TODO: a device pixel_ratio should probably be read from a config file
         pixel_ratio = 1.0
@@ -128,6 +119,40 @@ class Scatter3d:
         self.points = p3.Points(geometry=self.geometry, material=self.material)
         self._canvas.add(self.points)
 
+    def _make_geometry(self):
+        """
+        Make the geometry holding the positions and colors of the points.
+        """
+        import pythreejs as p3
+
+        if self._colormapper is not None:
+            colors = self._colormapper.rgb(self.data)
+        else:
+            colors = np.broadcast_to(
+                np.array(self._color), (self._data.coords[self._x].shape[0], 3)
+            ).astype('float32')
+        # Fill the (contiguous) float32 positions column by column, converting the
+        # coordinates in place instead of making temporary copies of them
+        positions = np.empty((self._data.shape[0], 3), dtype='float32')
+        for i, dim in enumerate((self._x, self._y, self._z)):
+            positions[:, i] = self._data.coords[dim].values
+        return p3.BufferGeometry(
+            attributes={
+                'position': p3.BufferAttribute(array=positions),
+                'color': p3.BufferAttribute(array=colors),
+            }
+        )
+
+    def _same_positions(self, old: sc.DataArray, new: sc.DataArray) -> bool:
+        """
+        Check if two data arrays have the same point positions. NaN positions are
+        considered equal, so that they do not cause a new geometry to be made.
+        """
+        return old.shape == new.shape and all(
+            _array_equal(old.coords[dim].values, new.coords[dim].values)
+            for dim in (self._x, self._y, self._z)
+        )
+
     def notify_artist(self, message: str) -> None:
         """
         Receive notification from the colormapper that its state has changed.
@@ -142,15 +167,19 @@ class Scatter3d:
 
     def _update_colors(self):
         """
-        Set the point cloud's rgba colors:
+        Set the point cloud's rgb colors.
+        Sending the colors to the front-end is much more expensive than comparing
+        them, so the colors are only sent if they have changed.
         """
-        self.geometry.attributes["color"].array = self._colormapper.rgba(self.data)[
-            ..., :3
-        ].astype('float32')
+        colors = self._colormapper.rgb(self.data)
+        attribute = self.geometry.attributes["color"]
+        if not np.array_equal(colors, attribute.array):
+            attribute.array = colors
 
     def update(self, new_values):
         """
-        Update point cloud array with new values.
+        Update point cloud array with new values. If the positions of the points
+        have changed, a new geometry is made.
 
         Parameters
         ----------
@@ -158,8 +187,15 @@ class Scatter3d:
             New data to update the point cloud values from.
         """
         check_ndim(new_values, ndim=1, origin='Scatter3d')
+        old = self._data
         self._data = new_values
-        if self._colormapper is not None:
+        if not self._same_positions(old, new_values):
+            # The points have moved, or their number has changed (e.g. a different
+            # selection of points from a larger cloud), so a new geometry is needed.
+            self._bbox_cache.clear()
+            self.geometry = self._make_geometry()
+            self.points.geometry = self.geometry
+        elif self._colormapper is not None:
             self._update_colors()
 
     @property
@@ -171,8 +207,10 @@ class Scatter3d:
 
     @opacity.setter
     def opacity(self, val: float):
-        self.material.opacity = val
-        self.material.depthTest = val > 0.5
+        # Send both material properties to the front-end in a single message
+        with self.material.hold_sync():
+            self.material.opacity = val
+            self.material.depthTest = val > 0.5
 
     @property
     def visible(self) -> bool:
@@ -200,19 +238,24 @@ class Scatter3d:
     ) -> BoundingBox:
         """
         The bounding box of the scatter points.
+        The bounds are computed once for each set of scales, and only computed again
+        if ``update`` changes the positions of the points.
         """
-        padding = 0.5 * self._size
-        xbounds = find_limits(self._data.coords[self._x], scale=xscale)
-        ybounds = find_limits(self._data.coords[self._y], scale=yscale)
-        zbounds = find_limits(self._data.coords[self._z], scale=zscale)
-        return BoundingBox(
-            xmin=xbounds[0].value - padding,
-            xmax=xbounds[1].value + padding,
-            ymin=ybounds[0].value - padding,
-            ymax=ybounds[1].value + padding,
-            zmin=zbounds[0].value - padding,
-            zmax=zbounds[1].value + padding,
-        )
+        key = (xscale, yscale, zscale)
+        if key not in self._bbox_cache:
+            padding = 0.5 * self._size
+            xbounds = find_limits(self._data.coords[self._x], scale=xscale)
+            ybounds = find_limits(self._data.coords[self._y], scale=yscale)
+            zbounds = find_limits(self._data.coords[self._z], scale=zscale)
+            self._bbox_cache[key] = BoundingBox(
+                xmin=xbounds[0].value - padding,
+                xmax=xbounds[1].value + padding,
+                ymin=ybounds[0].value - padding,
+                ymax=ybounds[1].value + padding,
+                zmin=zbounds[0].value - padding,
+                zmax=zbounds[1].value + padding,
+            )
+        return replace(self._bbox_cache[key])
 
     def remove(self) -> None:
         """
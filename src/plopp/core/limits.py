@@ -109,3 +109,112 @@ def fix_empty_range(
             # We decompose value and unit to avoid operation exceptions when unit=None.
             dx = sc.scalar(0.5 * abs(lims[0].value), unit=lims[0].unit)
     return (lims[0] - dx, lims[1] + dx)
+
+
+def scratch_buffer(
+    buffers: dict | None,
+    key: str,
+    shape: tuple[int, ...],
+    dtype: type | np.dtype = bool,
+):
+    """
+    Get an array of the requested shape and dtype (boolean by default) from
+    ``buffers``, re-allocating it only if it does not exist yet or if the shape or
+    dtype have changed.
+    If ``buffers`` is ``None``, a new array is returned.
+    """
+    if buffers is None:
+        return np.empty(shape, dtype=dtype)
+    buf = buffers.get(key)
+    if (buf is None) or (buf.shape != shape) or (buf.dtype != dtype):
+        buf = buffers[key] = np.empty(shape, dtype=dtype)
+    return buf
+
+
+def _valid_extrema(
+    values: np.ndarray,
+    scale: Literal['linear', 'log'],
+    mask: np.ndarray | None,
+    buffers: dict | None,
+) -> tuple[float, float] | None:
+    """
+    Find the minimum and maximum of the finite (and positive on a log scale) values
+    that are not masked. Return ``None`` if there are no such values.
+    """
+    valid = np.isfinite(values, out=scratch_buffer(buffers, 'finite', values.shape))
+    if (mask is not None) and not mask.all():
+        valid &= np.logical_not(
+            mask, out=scratch_buffer(buffers, 'unmasked', values.shape)
+        )
+    if scale == 'log':
+        valid &= np.greater(
+            values, 0, out=scratch_buffer(buffers, 'positive', values.shape)
+        )
+    if not valid.any():
+        return None
+    # Reduce with a ``where`` mask instead of extracting the valid values, which
+    # would make a copy of the (potentially large) array.
+    info = np.finfo if values.dtype.kind == 'f' else np.iinfo
+    vmin = np.min(values, initial=info(values.dtype).max, where=valid).item()
+    vmax = np.max(values, initial=info(values.dtype).min, where=valid).item()
+    return vmin, vmax
+
+
+def find_numeric_limits(
+    values: np.ndarray | tuple[np.ndarray, ...],
+    scale: Literal['linear', 'log'] = 'linear',
+    pad: bool = False,
+    mask: np.ndarray | None = None,
+    buffers: dict | None = None,
+) -> tuple[float, float] | None:
+    """
+    Fast equivalent of ``fix_empty_range(find_limits(...))`` working directly on the
+    NumPy values of an array, without making any scipp variables.
+    Only numerical arrays with at least one valid value are supported. In all other
+    cases (e.g. datetimes, or no positive values on a log scale), ``None`` is returned
+    and the caller should fall back to ``find_limits``.
+
+    Parameters
+    ----------
+    values:
+        The values for which to find the limits. If a tuple of arrays (of the same
+        shape) is given, the limits enclose the values of all of them.
+    scale:
+        The scale to use for the limits.
+    pad:
+        Whether to pad the limits.
+    mask:
+        Values where the mask is ``True`` are ignored, unless all values are masked.
+    buffers:
+        Scratch boolean arrays kept by the caller between calls, to avoid allocating
+        the masks of valid values every time.
+    """
+    arrays = values if isinstance(values, tuple) else (values,)
+    if not all(
+        isinstance(array, np.ndarray) and array.dtype.kind in 'fiu' for array in arrays
+    ):
+        return None
+    extrema = [
+        ext
+        for array in arrays
+        if (ext := _valid_extrema(array, scale=scale, mask=mask, buffers=buffers))
+        is not None
+    ]
+    if not extrema:
+        return None
+    vmin = min(ext[0] for ext in extrema)
+    vmax = max(ext[1] for ext in extrema)
+    if pad:
+        delta = 0.05
+        if scale == 'log':
+            p = (vmax / vmin) ** delta
+            vmin /= p
+            vmax *= p
+        else:
+            p = (vmax - vmin) * delta
+            vmin -= p
+            vmax += p
+    if vmin == vmax:
+        dx = 0.5 if vmin == 0 else 0.5 * abs(vmin)
+        vmin, vmax = vmin - dx, vmax + dx
+    return vmin, vmax
@@ -2,8 +2,8 @@
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
 import uuid
-from functools import reduce
 
+import numpy as np
 import scipp as sc
 
 
@@ -186,7 +186,58 @@ def merge_masks(masks: dict[str, sc.Variable]) -> sc.Variable:
     masks:
         The dict holding the masks to be combined.
     """
-    return reduce(lambda a, b: a | b, masks.values())
+    out = None
+    owned = False
+    for mask in masks.values():
+        if out is None:
+            out = mask
+        elif owned and set(mask.dims) <= set(out.dims):
+            # Accumulate in place, instead of allocating a new array for every mask
+            out |= mask
+        else:
+            # The first mask belongs to the caller and must not be modified, and
+            # masks with new dimensions need a larger output.
+            out = out | mask
+            owned = True
+    return out
+
+
+def merge_mask_values(
+    masks: dict[str, sc.Variable],
+    sizes: dict[str, int],
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Combine all masks into a single boolean NumPy array with the given sizes, using
+    the OR operation. The masks are transposed and broadcast as views, and OR-ed
+    into ``out`` in a single sweep per mask, without making intermediate scipp
+    variables. If there is only one mask, a read-only broadcast view of it is
+    returned and ``out`` is left untouched.
+
+    Parameters
+    ----------
+    masks:
+        The dict holding the masks to be combined.
+    sizes:
+        The sizes of the output. All the mask dims must be in ``sizes``.
+    out:
+        Optional array to store the result in. A new array is allocated if ``None``.
+    """
+    dims = tuple(sizes)
+    shape = tuple(sizes.values())
+    values = []
+    for mask in masks.values():
+        order = [mask.dims.index(dim) for dim in dims if dim in mask.dims]
+        expand = tuple(slice(None) if dim in mask.dims else None for dim in dims)
+        values.append(np.broadcast_to(np.transpose(mask.values, order)[expand], shape))
+    if len(values) == 1:
+        return values[0]
+    if out is None:
+        out = np.empty(shape, dtype=bool)
+    np.logical_or(values[0], values[1], out=out)
+    for v in values[2:]:
+        np.logical_or(out, v, out=out)
+    return out
 
 
 def coord_element_to_string(x: sc.Variable) -> str:
@@ -19,6 +19,11 @@ def _none_reduce(*args: float, op: Callable) -> float:
     return op(elems)
 
 
+# The reduction operations for the (xmin, xmax, ymin, ymax, zmin, zmax) bounds when
+# making the union of bounding boxes
+_UNION_OPS = (min, max) * 3
+
+
 @dataclass
 class BoundingBox:
     """
@@ -32,18 +37,24 @@ class BoundingBox:
     zmin: float | None = None
     zmax: float | None = None
 
-    def union(self, other: BoundingBox) -> BoundingBox:
+    def union(self, *others: BoundingBox) -> BoundingBox:
         """
-        Return the union of this bounding box with another one.
+        Return the union of this bounding box with one or more other ones.
         """
-        return BoundingBox(
-            xmin=_none_reduce(self.xmin, other.xmin, op=min),
-            xmax=_none_reduce(self.xmax, other.xmax, op=max),
-            ymin=_none_reduce(self.ymin, other.ymin, op=min),
-            ymax=_none_reduce(self.ymax, other.ymax, op=max),
-            zmin=_none_reduce(self.zmin, other.zmin, op=min),
-            zmax=_none_reduce(self.zmax, other.zmax, op=max),
+        # Gather the bounds of all the boxes in a single pass, and reduce each of the
+        # columns (xmin, xmax, ...) in turn.
+        columns = zip(
+            *[
+                (b.xmin, b.xmax, b.ymin, b.ymax, b.zmin, b.zmax)
+                for b in (self, *others)
+            ],
+            strict=True,
         )
+        bounds = []
+        for column, op in zip(columns, _UNION_OPS, strict=True):
+            elems = [x for x in column if x is not None]
+            bounds.append(op(elems) if elems else None)
+        return BoundingBox(*bounds)
 
     def intersection(self, other: BoundingBox) -> BoundingBox:
         """
@@ -18,6 +18,19 @@ def _vector_to_tuple(
         return tuple(v for v in vector)
 
 
+def _vector_to_numbers(
+    vector: sc.Variable | Sequence[sc.Variable] | Sequence[float],
+    units: tuple[str, str, str],
+) -> tuple[float, ...]:
+    if isinstance(vector, sc.Variable) and len(set(units)) == 1:
+        # Convert the whole vector at once, instead of each of its fields
+        return tuple(maybe_variable_to_number(vector, unit=units[0]).tolist())
+    return tuple(
+        maybe_variable_to_number(x, unit=u)
+        for x, u in zip(_vector_to_tuple(vector), units, strict=True)
+    )
+
+
 class Camera:
     """
     Camera configuration for three-dimensional plots.
@@ -39,6 +52,8 @@ class Camera:
         before they disappear), as a :func:`scipp.scalar` or a single number.
     """
 
+    __slots__ = ('_parsed_contents', '_raw_contents')
+
     def __init__(
         self,
         position: sc.Variable | Sequence[sc.Variable] | Sequence[float] | None = None,
@@ -49,9 +64,9 @@ class Camera:
         self._parsed_contents = None
         self._raw_contents = {}
         if position is not None:
-            self._raw_contents['position'] = _vector_to_tuple(position)
+            self._raw_contents['position'] = position
         if look_at is not None:
-            self._raw_contents['look_at'] = _vector_to_tuple(look_at)
+            self._raw_contents['look_at'] = look_at
         if near is not None:
             self._raw_contents['near'] = near
         if far is not None:
@@ -70,11 +85,11 @@ class Camera:
         default:
             The default value to return if the attribute is not set.
         """
-        return (
-            self._parsed_contents.get(key, default)
-            if self._parsed_contents is not None
-            else self._raw_contents.get(key, default)
-        )
+        if self._parsed_contents is not None:
+            return self._parsed_contents.get(key, default)
+        if key in ('position', 'look_at') and key in self._raw_contents:
+            return _vector_to_tuple(self._raw_contents[key])
+        return self._raw_contents.get(key, default)
 
     def set_units(self, xunit: str, yunit: str, zunit: str):
         """
@@ -92,11 +107,8 @@ class Camera:
         """
         self._parsed_contents = {}
         for key in set(self._raw_contents) & {'position', 'look_at'}:
-            self._parsed_contents[key] = tuple(
-                maybe_variable_to_number(x, unit=u)
-                for x, u in zip(
-                    self._raw_contents[key], [xunit, yunit, zunit], strict=True
-                )
+            self._parsed_contents[key] = _vector_to_numbers(
+                self._raw_contents[key], units=(xunit, yunit, zunit)
             )
 
         for key in set(self._raw_contents) & {'near', 'far'}:
@@ -1,8 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
-from copy import copy
-from functools import reduce
+from functools import lru_cache
 from typing import Any, Literal
 
 import matplotlib as mpl
@@ -13,8 +12,13 @@ from matplotlib.colorbar import ColorbarBase
 from matplotlib.colors import Colormap, LinearSegmentedColormap, LogNorm, Normalize
 
 from ..backends.matplotlib.utils import fig_to_bytes
-from ..core.limits import find_limits, fix_empty_range
-from ..core.utils import maybe_variable_to_number, merge_masks
+from ..core.limits import (
+    find_limits,
+    find_numeric_limits,
+    fix_empty_range,
+    scratch_buffer,
+)
+from ..core.utils import maybe_variable_to_number, merge_mask_values
 from ..utils import parse_mutually_exclusive
 
 
@@ -48,23 +52,38 @@ def _get_cmap(colormap: str | Colormap, nan_color: str | None = None) -> Colorma
 
     if isinstance(colormap, Colormap):
         return colormap
+    # The colormaps made from a name are cached, and a copy is returned because the
+    # caller is free to modify it (e.g. to set the 'bad' color of the mask colormap).
+    try:
+        cmap = _make_cmap(colormap, nan_color)
+    except TypeError:
+        # The nan color is not hashable (e.g. a list of RGB values)
+        cmap = _make_cmap.__wrapped__(colormap, nan_color)
+    return cmap.copy()
+
 
+@lru_cache(maxsize=32)
+def _make_cmap(colormap: str, nan_color: str | None) -> Colormap:
+    """
+    Make a colormap from a name, see ``_get_cmap``.
+    The table of colors of the colormap is computed here (accessing one of the
+    special colors initializes it), so that all the copies made from the cached
+    colormap share the result instead of interpolating the colors again.
+    """
     try:
-        if hasattr(mpl, 'colormaps'):
-            cmap = copy(mpl.colormaps[colormap])
-        else:
-            cmap = mpl.cm.get_cmap(colormap)
+        cmap = mpl.colormaps[colormap]
     except (KeyError, ValueError):
         # Case where we have just a single color
         cmap = LinearSegmentedColormap.from_list('tmp', [colormap, colormap])
         cmap.set_over(colormap)
         cmap.set_under(colormap)
         cmap.set_bad(colormap)
+        cmap.get_bad()
         return cmap
 
-    # Add under and over values to the cmap
+    # Add under and over values to the cmap. Note that the registry already returns
+    # a copy of the colormap, which can safely be modified.
     delta = 0.15
-    cmap = cmap.copy()
     over = cmap.get_over()
     under = cmap.get_under()
     # Note that we only shift the first 3 RGB values, leaving alpha unchanged.
@@ -80,6 +99,11 @@ def _get_cmap(colormap: str | Colormap, nan_color: str | None = None) -> Colorma
     return cmap
 
 
+# Below this fraction of masked values, it is cheaper to gather and scatter the
+# masked colors than to look up the mask colors for all the values (see ``rgba``).
+_SPARSE_MASK_FRACTION = 0.25
+
+
 def _get_normalizer(norm: str) -> Normalize:
     """
     Get an appropriate normalizer depending on the scaling.
@@ -87,6 +111,120 @@ def _get_normalizer(norm: str) -> Normalize:
     return Normalize(vmin=0, vmax=1) if norm == 'linear' else LogNorm(vmin=1, vmax=2)
 
 
+def _make_lut(cmap: Colormap) -> np.ndarray:
+    """
+    Make a lookup table of RGBA colors from a colormap. The ``N`` colors of the
+    colormap are followed by the 'over' and 'bad' colors, and the 'under' color is
+    placed last so that it can be reached with an index of -1.
+    """
+    return np.concatenate(
+        [
+            cmap(np.arange(cmap.N)),
+            [cmap.get_over(), cmap.get_bad(), cmap.get_under()],
+        ]
+    )
+
+
+def _cmap_state(cmap: Colormap) -> tuple:
+    """
+    The state of a colormap that goes into its lookup table. The extreme colors are
+    included because they can be changed in-place (e.g. with ``set_bad``).
+    """
+    return (
+        cmap,
+        cmap.N,
+        tuple(cmap.get_over()),
+        tuple(cmap.get_bad()),
+        tuple(cmap.get_under()),
+    )
+
+
+def _normalize(
+    normalizer: Normalize, values: np.ndarray, buffers: dict | None = None
+) -> np.ndarray:
+    """
+    Normalize values to the [0, 1] range, returning a floating point array where
+    invalid values are NaN. This performs the same operations as Matplotlib's
+    ``Normalize`` and ``LogNorm``, but without going through masked arrays, and the
+    result is written to an array from ``buffers`` (see ``scratch_buffer``).
+    """
+    values = np.asarray(values)
+    dtype = values.dtype
+    if dtype.kind != 'f':
+        dtype = np.promote_types(dtype, np.float32)
+    out = scratch_buffer(buffers, 'normalized', values.shape, dtype)
+    vmin = float(normalizer.vmin)
+    vmax = float(normalizer.vmax)
+    if vmin == vmax:
+        out.fill(0)
+        return out
+    np.copyto(out, values, casting='unsafe')
+    if isinstance(normalizer, LogNorm):
+        log_vmin, log_vmax = np.log10([vmin, vmax])
+        if not np.isfinite([log_vmin, log_vmax]).all():
+            raise ValueError("Invalid vmin or vmax")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.log10(out, out=out)
+        out -= log_vmin
+        out /= log_vmax - log_vmin
+        # Non-positive values, as well as infinities, are invalid on a log scale
+        invalid = np.isfinite(out, out=scratch_buffer(buffers, 'invalid', out.shape))
+        np.logical_not(invalid, out=invalid)
+        np.copyto(out, np.nan, where=invalid)
+    else:
+        out -= vmin
+        out /= vmax - vmin
+    return out
+
+
+def _lut_indices(
+    normalized: np.ndarray, n: int, buffers: dict | None = None
+) -> np.ndarray:
+    """
+    Convert normalized values to indices in a lookup table made by ``_make_lut``
+    from a colormap with ``n`` colors, with the same binning as Matplotlib's
+    ``Colormap``. The ``normalized`` array is modified in place, and the indices are
+    written to an array from ``buffers`` (see ``scratch_buffer``).
+    """
+    normalized *= n
+    # A value of 1 (n after multiplication) is not out of range
+    normalized[normalized == n] = n - 1
+    np.floor(normalized, out=normalized)
+    # Values below the range become -1 (the 'under' color), values above become n
+    # (the 'over' color), and NaNs become n + 1 (the 'bad' color).
+    np.clip(normalized, -1, n, out=normalized)
+    np.copyto(normalized, n + 1, where=np.isnan(normalized))
+    indices = scratch_buffer(buffers, 'indices', normalized.shape, np.intp)
+    np.copyto(indices, normalized, casting='unsafe')
+    return indices
+
+
+def _take_colors(
+    lut: np.ndarray,
+    indices: np.ndarray,
+    buffers: dict | None = None,
+    name: str = 'colors',
+) -> np.ndarray:
+    """
+    Gather the colors at the given indices of a lookup table made by ``_make_lut``.
+    The colors are written to the array called ``name`` in ``buffers``.
+    """
+    out = scratch_buffer(buffers, name, (*indices.shape, lut.shape[1]), lut.dtype)
+    # The 'wrap' mode makes the index of -1 point to the last entry (the 'under'
+    # color), and is faster than the default mode when an output array is given.
+    return lut.take(indices, axis=0, out=out, mode='wrap')
+
+
+def _lookup_colors(
+    lut: np.ndarray, normalized: np.ndarray, buffers: dict | None = None
+) -> np.ndarray:
+    """
+    Convert normalized values to RGBA colors using a lookup table made by
+    ``_make_lut``, see ``_lut_indices`` and ``_take_colors``.
+    """
+    return _take_colors(lut, _lut_indices(normalized, len(lut) - 3, buffers), buffers)
+
+
 class ColorMapper:
     """
     A class that handles conversion between data values and RGBA colors.
@@ -181,13 +319,35 @@ class ColorMapper:
 
         # Note that we need to set cmin/cmax for the LogNorm, if not an error is
         # raised when making the colorbar before any call to update is made.
-        self.normalizer = _get_normalizer('log' if self._logc else 'linear')
+        # One normalizer is kept for each norm, so that toggling the norm only swaps
+        # them (see ``toggle_norm``).
+        self._normalizers = {
+            'linear': _get_normalizer('linear'),
+            'log': _get_normalizer('log'),
+        }
+        self.normalizer = self._normalizers[self.norm]
         self.colorbar = None
         self._unit = None
         self.empty = True
         self.changed = False
         self.artists = {}
+        # The color state when the artists were last notified, and the artists added
+        # since then, see ``apply_limits``
+        self._notified_state = None
+        self._unnotified = set()
+        # The data limits of each artist, see ``_get_artist_limits``
+        self._artist_limits = {}
+        # Scratch arrays used when finding the limits, see ``find_numeric_limits``
+        self._limits_buffers = {}
         self.widget = None
+        # The state of the colorbar when the widget image was last rendered
+        self._colorbar_key = None
+        # Boolean array used to combine the masks in ``rgba`` when no key is given
+        self._mask_buffers = {}
+        # Color lookup tables for the colormap and the mask colormap
+        self._luts = {}
+        # Arrays re-used when computing the colors for a given key, see ``rgba``
+        self._color_buffers = {}
 
         if cbar:
             if self.cax is None:
@@ -202,9 +362,65 @@ class ColorMapper:
 
     def add_artist(self, key: str, artist: Any):
         self.artists[key] = artist
+        self._unnotified.add(key)
 
     def remove_artist(self, key: str):
         del self.artists[key]
+        self._unnotified.discard(key)
+        self._artist_limits.pop(key, None)
+        self._color_buffers.pop(key, None)
+
+    def invalidate_limits(self, key: str):
+        """
+        Discard the data limits stored for an artist, so that they are computed again
+        during the next autoscale. The limits are re-computed automatically when the
+        artist holds a new data array, so this is only needed when the data was
+        modified in place.
+
+        Parameters
+        ----------
+        key:
+            The key of the artist.
+        """
+        self._artist_limits.pop(key, None)
+
+    def _get_artist_limits(self, key: str, scale: Literal['linear', 'log']) -> tuple:
+        """
+        Get the (min, max) values of the data of an artist. The limits are kept for
+        each artist, and only computed again if the artist's data array or the scale
+        has changed, so that autoscaling does not scan the data of every artist when
+        only one of them was updated.
+        """
+        data = self.artists[key]._data
+        cached = self._artist_limits.get(key)
+        if (cached is None) or (cached[0] is not data) or (cached[1] != scale):
+            limits = self._find_limits(data, scale)
+            cached = self._artist_limits[key] = (data, scale, limits)
+        return cached[2]
+
+    def _find_limits(
+        self, data: sc.DataArray, scale: Literal['linear', 'log']
+    ) -> tuple[float, float]:
+        """
+        Find the limits of the values of a data array as plain floats, directly from
+        the NumPy arrays of the data and masks when possible.
+        """
+        mask = None
+        if data.masks:
+            mask = merge_mask_values(
+                data.masks,
+                sizes=data.sizes,
+                out=scratch_buffer(self._limits_buffers, 'mask', data.shape)
+                if len(data.masks) > 1
+                else None,
+            )
+        limits = find_numeric_limits(
+            data.values, scale=scale, mask=mask, buffers=self._limits_buffers
+        )
+        if limits is None:
+            lo, hi = fix_empty_range(find_limits(data, scale=scale))
+            limits = (lo.value, hi.value)
+        return limits
 
     def to_widget(self):
         """
@@ -213,17 +429,30 @@ class ColorMapper:
         import ipywidgets as ipw
 
         self.widget = ipw.HTML()
+        self._colorbar_key = None
         self._update_colorbar_widget()
         return self.widget
 
     def _update_colorbar_widget(self):
         """
         Upon an updated colorscale range, we need to update the image inside the widget.
+        Rendering the image is expensive, so it is skipped if the colormap, the range,
+        the normalization and the label are the same as for the current image.
         """
-        if self.widget is not None:
+        if self.widget is None:
+            return
+        key = (
+            self.cmap,
+            self.normalizer.vmin,
+            self.normalizer.vmax,
+            self.norm,
+            self.cax.get_ylabel(),
+        )
+        if key != self._colorbar_key:
             self.widget.value = fig_to_bytes(self.cax.get_figure(), form='svg').decode()
+            self._colorbar_key = key
 
-    def rgba(self, data: sc.DataArray) -> np.ndarray:
+    def rgba(self, data: sc.DataArray, key: str | None = None) -> np.ndarray:
         """
         Return rgba values given a data array.
 
@@ -231,13 +460,82 @@ class ColorMapper:
         ----------
         data:
             The data array to be converted to rgba colors, taking masks into account.
+        key:
+            If not ``None``, the colors are written to an array kept for this key
+            (usually the key of the artist), which is re-used in the next call with
+            the same key. The returned array is then only valid until that call.
         """
-        colors = self.cmap(self.normalizer(data.values))
-        if data.masks:
-            one_mask = sc.broadcast(merge_masks(data.masks), sizes=data.sizes).values
-            colors[one_mask] = self.mask_cmap(self.normalizer(data.values[one_mask]))
+        return self._map_colors(data, rgb=False, key=key)
+
+    def rgb(self, data: sc.DataArray, key: str | None = None) -> np.ndarray:
+        """
+        Return rgb values (without the alpha channel) as single precision floats,
+        given a data array. This is the format used for vertex colors in 3d scenes,
+        and the colors are gathered directly in that format.
+
+        Parameters
+        ----------
+        data:
+            The data array to be converted to rgb colors, taking masks into account.
+        key:
+            If not ``None``, the colors are written to an array kept for this key,
+            see ``rgba``.
+        """
+        return self._map_colors(data, rgb=True, key=key)
+
+    def _map_colors(self, data: sc.DataArray, rgb: bool, key: str | None) -> np.ndarray:
+        buffers = None if key is None else self._color_buffers.setdefault(key, {})
+        normalized = _normalize(self.normalizer, data.values, buffers)
+        lut = self._get_lut('cmap', rgb=rgb)
+        if not data.masks:
+            return _lookup_colors(lut, normalized, buffers)
+        one_mask = merge_mask_values(
+            data.masks,
+            sizes=data.sizes,
+            out=scratch_buffer(
+                self._mask_buffers if buffers is None else buffers, 'mask', data.shape
+            )
+            if len(data.masks) > 1
+            else None,
+        )
+        mask_lut = self._get_lut('mask_cmap', rgb=rgb)
+        if len(mask_lut) != len(lut) or (
+            np.count_nonzero(one_mask) < _SPARSE_MASK_FRACTION * one_mask.size
+        ):
+            masked_colors = _lookup_colors(mask_lut, normalized[one_mask])
+            colors = _lookup_colors(lut, normalized, buffers)
+            colors[one_mask] = masked_colors
+            return colors
+        # When both colormaps have the same number of colors, the indices are only
+        # computed once, and the masked colors are selected in a single pass instead
+        # of gathering and scattering the masked values.
+        indices = _lut_indices(normalized, len(lut) - 3, buffers)
+        colors = _take_colors(lut, indices, buffers)
+        masked_colors = _take_colors(mask_lut, indices, buffers, name='masked_colors')
+        np.copyto(colors, masked_colors, where=one_mask[..., None])
         return colors
 
+    def _get_lut(self, name: Literal['cmap', 'mask_cmap'], rgb: bool) -> np.ndarray:
+        """
+        Get the lookup table for the colormap or the mask colormap, either as float
+        rgba or as single precision rgb colors. The tables are made once, and only
+        re-made if the colormap is replaced or its extreme colors are changed.
+        """
+        cmap = getattr(self, name)
+        state = _cmap_state(cmap)
+        cached = self._luts.get((name, rgb))
+        if (cached is None) or (cached[0] != state):
+            if rgb:
+                lut = np.ascontiguousarray(
+                    self._get_lut(name, rgb=False)[:, :3], dtype='float32'
+                )
+            else:
+                lut = _make_lut(cmap)
+            # The tables are shared by all the artists and must not be modified
+            lut.flags.writeable = False
+            cached = self._luts[(name, rgb)] = (state, lut)
+        return cached[1]
+
     def autoscale(self):
         """
         Re-compute the global min and max range of values by iterating over all the
@@ -251,20 +549,15 @@ class ColorMapper:
             self.apply_limits()
             return
 
-        limits = [
-            fix_empty_range(
-                find_limits(artist._data, scale='log' if self._logc else 'linear')
-            )
-            for artist in self.artists.values()
-        ]
-        if "user" not in self._cmin:
-            self._cmin["data"] = reduce(min, [v[0] for v in limits]).value
-        else:
-            self._cmin["data"] = self._cmin["user"]
-        if "user" not in self._cmax:
-            self._cmax["data"] = reduce(max, [v[1] for v in limits]).value
-        else:
-            self._cmax["data"] = self._cmax["user"]
+        scale = 'log' if self._logc else 'linear'
+        # The limits of the artists are plain floats, and there are only a few of
+        # them, so they are reduced with the builtin min and max in a single sweep.
+        lows, highs = zip(
+            *(self._get_artist_limits(key, scale) for key in self.artists),
+            strict=True,
+        )
+        self._cmin["data"] = self._cmin.get("user", min(lows))
+        self._cmax["data"] = self._cmax.get("user", max(highs))
 
         if self._cmin["data"] >= self._cmax["data"]:
             if "user" in self._cmax:
@@ -287,12 +580,35 @@ class ColorMapper:
 
         if self.colorbar is not None:
             self._update_colorbar_widget()
-        self.notify_artists()
+        # The artists set their own colors when their data is updated, so they only
+        # need to be notified if the mapping from values to colors has changed.
+        # Artists added since the last notification still need their first colors.
+        if self.color_state() != self._notified_state:
+            self.notify_artists()
+        else:
+            for key in self._unnotified:
+                self.artists[key].notify_artist('colormap changed')
+            self._unnotified.clear()
+
+    def color_state(self) -> tuple:
+        """
+        The state that determines the mapping from data values to colors. Artists
+        can compare it to a previous state to know if their colors are out of date.
+        """
+        return (
+            self.normalizer,
+            self.normalizer.vmin,
+            self.normalizer.vmax,
+            _cmap_state(self.cmap),
+            _cmap_state(self.mask_cmap),
+        )
 
     def notify_artists(self):
         """
         Notify the artists that the state of the colormapper has changed.
         """
+        self._notified_state = self.color_state()
+        self._unnotified.clear()
         for artist in self.artists.values():
             artist.notify_artist('colormap changed')
 
@@ -393,7 +709,7 @@ class ColorMapper:
         Toggle the norm flag, between `linear` and `log`.
         """
         self._logc = not self._logc
-        self.normalizer = _get_normalizer('log' if self._logc else 'linear')
+        self.normalizer = self._normalizers[self.norm]
         self._cmin["data"] = np.inf
         self._cmax["data"] = -np.inf
         if self.colorbar is not None:
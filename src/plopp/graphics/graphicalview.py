@@ -1,7 +1,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Any, Literal
 
 import numpy as np
@@ -96,6 +97,10 @@ class GraphicalView(View):
         self._data_name = None
         self._data_axis = None
         self._autoscale = autoscale
+        # State of the batches of updates, see ``batch``
+        self._batch_depth = 0
+        self._pending_draw = False
+        self._pending_fit = False
 
         self.canvas = canvas_maker(
             cbar=cbar,
@@ -153,24 +158,43 @@ class GraphicalView(View):
         self.render()
 
     def autoscale(self):
-        bbox = BoundingBox()
         scales = {"xscale": self.canvas.xscale, "yscale": self.canvas.yscale}
         if hasattr(self.canvas, 'zscale'):
             scales['zscale'] = self.canvas.zscale
-        for artist in self.artists.values():
-            bbox = bbox.union(artist.bbox(**scales))
-        self.bbox = bbox
-        self.bbox = self.bbox.override(self.canvas.bbox)
-        self.canvas.xrange = _make_range(
-            old=self.canvas.xrange, new=(self.bbox.xmin, self.bbox.xmax)
+        bbox = BoundingBox().union(
+            *(artist.bbox(**scales) for artist in self.artists.values())
         )
-        self.canvas.yrange = _make_range(
-            old=self.canvas.yrange, new=(self.bbox.ymin, self.bbox.ymax)
+        self.bbox = bbox.override(self.canvas.bbox)
+        axes = ('x', 'y', 'z') if hasattr(self.canvas, 'zrange') else ('x', 'y')
+        ranges = {
+            f'{axis}range': new
+            for axis in axes
+            if (new := self._changed_range(axis)) is not None
+        }
+        if not ranges:
+            return
+        if hasattr(self.canvas, 'set_ranges'):
+            # Apply all new limits in one go, so that the canvas is only invalidated
+            # once.
+            self.canvas.set_ranges(**ranges)
+        else:
+            for key, value in ranges.items():
+                setattr(self.canvas, key, value)
+
+    def _changed_range(self, axis: str) -> tuple[float, float] | None:
+        """
+        Compute the range of the canvas along the given axis from the current bounding
+        box. If the range has not changed, ``None`` is returned, so that the canvas
+        can be left untouched, to avoid triggering redraws of axes that do not need it.
+        """
+        old = getattr(self.canvas, f'{axis}range')
+        new = _make_range(
+            old=old,
+            new=(getattr(self.bbox, f'{axis}min'), getattr(self.bbox, f'{axis}max')),
         )
-        if hasattr(self.canvas, 'zrange'):
-            self.canvas.zrange = _make_range(
-                old=self.canvas.zrange, new=(self.bbox.zmin, self.bbox.zmax)
-            )
+        if (old is None) or (tuple(old) != new):
+            return new
+        return None
 
     def update(self, *args, **kwargs) -> None:
         """
@@ -263,15 +287,46 @@ class GraphicalView(View):
                 need_legend_update = getattr(self.artists[key], "label", False)
             else:
                 self.artists[key].update(new_values=new_values)
+                if self.colormapper is not None:
+                    # The new values may be the same data array, modified in place
+                    self.colormapper.invalidate_limits(key)
 
         if need_legend_update:
             self.canvas.update_legend()
 
-        if self._autoscale:
-            self.fit_to_data()
+        self._fit_and_draw(fit=self._autoscale)
 
+    def _fit_and_draw(self, fit: bool) -> None:
+        """
+        Optionally fit the view to the data, and draw the canvas. Inside a ``batch``,
+        this is deferred until the end of the batch.
+        """
+        if self._batch_depth:
+            self._pending_draw = True
+            self._pending_fit |= fit
+            return
+        if fit:
+            self.fit_to_data()
         self.canvas.draw()
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager to make several updates to the view (adding, updating or
+        removing artists), while fitting the view to the data and drawing the canvas
+        only once, at the end of the batch.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if (not self._batch_depth) and self._pending_draw:
+                fit = self._pending_fit
+                self._pending_draw = False
+                self._pending_fit = False
+                self._fit_and_draw(fit=fit)
+
     def fit_to_data(self) -> None:
         """
         Autoscale axes and colormapper.
@@ -312,5 +367,4 @@ class GraphicalView(View):
         self.artists[key].remove()
         del self.artists[key]
         self.canvas.update_legend()
-        self.fit_to_data()
-        self.canvas.draw()
+        self._fit_and_draw(fit=True)
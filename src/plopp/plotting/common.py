@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import uuid
 import warnings
 from collections.abc import Callable, Iterable
 from typing import Any, Literal
@@ -133,6 +134,27 @@ def check_not_binned(da: sc.DataArray) -> None:
         )
 
 
+def make_scatter_data(da: sc.DataArray, coords: dict[str, sc.Variable]) -> sc.DataArray:
+    """
+    Make the one-dimensional data array given to the scatter plots, holding the values
+    and masks of the input and the selected coordinates. Multi-dimensional inputs are
+    flattened to a new dimension.
+
+    Parameters
+    ----------
+    da:
+        The input data array.
+    coords:
+        The coordinates of the points.
+    """
+    # Iterating over the masks of a data array is slow compared to the rest of the
+    # preprocessing, so they are only passed on if there are any.
+    out = sc.DataArray(data=da.data, masks=da.masks if da.masks else {}, coords=coords)
+    if out.ndim != 1:
+        out = out.flatten(to=uuid.uuid4().hex)
+    return out
+
+
 def to_allowed_dtypes(da: sc.DataArray) -> sc.DataArray:
     """
     Currently, Plopp cannot plot data that contains vector and matrix dtypes.
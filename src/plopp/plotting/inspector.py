@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+from collections.abc import Callable
+from functools import partial
 from typing import Literal
 
 import scipp as sc
@@ -16,22 +18,31 @@ def _to_bin_edges(da: sc.DataArray, dim: str) -> sc.DataArray:
     """
     Convert dimension coords to bin edges.
     """
-    for d in set(da.dims) - {dim}:
-        da.coords[d] = coord_as_bin_edges(da, d)
+    for d in da.dims:
+        # Coordinates that are already bin edges are left untouched
+        if d != dim and (da.coords[d].dtype == str or not da.coords.is_edges(d)):
+            da.coords[d] = coord_as_bin_edges(da, d)
     return da
 
 
-def _apply_op(da: sc.DataArray, op: str, dim: str) -> sc.DataArray:
-    out = getattr(sc, op)(da, dim=dim)
+def _apply_op(da: sc.DataArray, op: Callable, name: str, dim: str) -> sc.DataArray:
+    out = op(da, dim=dim)
     if out.name:
-        out.name = f'{op} of {out.name}'
+        out.name = f'{name} of {out.name}'
     return out
 
 
-def _slice_xy(da: sc.DataArray, xy: dict[str, dict[str, int]]) -> sc.DataArray:
-    x = xy['x']
-    y = xy['y']
-    return da[y['dim'], y['value']][x['dim'], x['value']]
+def _make_slicer(xdim: str, ydim: str) -> Callable:
+    """
+    Make a function that slices the data at the (x, y) position of a point.
+    The dims of the image axes are fixed for the lifetime of the inspector, so they
+    are bound once instead of being looked up on every event.
+    """
+
+    def _slice_xy(da: sc.DataArray, xy: dict[str, dict[str, int]]) -> sc.DataArray:
+        return da[ydim, xy['y']['value']][xdim, xy['x']['value']]
+
+    return _slice_xy
 
 
 def inspector(
@@ -185,7 +196,12 @@ def inspector(
     if dim is None:
         dim = data.dims[-1]
     bin_edges_node = Node(_to_bin_edges, in_node, dim=dim)
-    op_node = Node(_apply_op, da=bin_edges_node, op=operation, dim=dim)
+    # Resolve the operation once, instead of on every evaluation of the node
+    op_node = Node(
+        partial(_apply_op, op=getattr(sc, operation), name=operation, dim=dim),
+        da=bin_edges_node,
+    )
+    op_node.pretty_name = f'{operation}(da, dim={dim})'
     f2d = imagefigure(
         op_node,
         aspect=aspect,
@@ -213,7 +229,7 @@ def inspector(
     pts = PointsTool(
         figure=f2d,
         input_node=bin_edges_node,
-        func=_slice_xy,
+        func=_make_slicer(xdim=f2d.canvas.dims['x'], ydim=f2d.canvas.dims['y']),
         destination=f1d,
         tooltip="Activate inspector tool",
     )
@@ -1,14 +1,19 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
-import uuid
 from functools import partial
 from typing import Literal
 
 import scipp as sc
 
 from ..core.typing import FigureLike, PlottableMulti
-from .common import check_not_binned, check_size, from_compatible_lib, input_to_nodes
+from .common import (
+    check_not_binned,
+    check_size,
+    from_compatible_lib,
+    input_to_nodes,
+    make_scatter_data,
+)
 
 
 def _preprocess_scatter(
@@ -30,9 +35,7 @@ def _preprocess_scatter(
 
     if isinstance(size, str):
         coords[size] = da.coords[size]
-    out = sc.DataArray(data=da.data, masks=da.masks, coords=coords)
-    if out.ndim != 1:
-        out = out.flatten(to=uuid.uuid4().hex)
+    out = make_scatter_data(da, coords)
     if not ignore_size:
         check_size(out)
     if name is not None:
@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
-import uuid
 from functools import partial
 from typing import Literal
 
@@ -9,7 +8,12 @@ import scipp as sc
 
 from ..core.typing import FigureLike, PlottableMulti
 from ..graphics import Camera
-from .common import check_not_binned, from_compatible_lib, input_to_nodes
+from .common import (
+    check_not_binned,
+    from_compatible_lib,
+    input_to_nodes,
+    make_scatter_data,
+)
 
 
 def _preprocess_scatter(
@@ -28,9 +32,7 @@ def _preprocess_scatter(
     else:
         coords = {k: da.coords[k] for k in (x, y, z)}
 
-    out = sc.DataArray(data=da.data, masks=da.masks, coords=coords)
-    if out.ndim != 1:
-        out = out.flatten(to=uuid.uuid4().hex)
+    out = make_scatter_data(da, coords)
     if name is not None:
         out.name = name
     return out
@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
-import uuid
-from collections.abc import Callable
-from functools import partial, reduce
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache, partial
 from typing import Any, Literal
 
 import ipywidgets as ipw
@@ -11,34 +13,328 @@ import numpy as np
 import scipp as sc
 
 from ..core import Node
+from ..core.limits import scratch_buffer
 from ..graphics import BaseFig
-from .debounce import debounce
+from .debounce import debounce, throttle
 from .style import BUTTON_LAYOUT
 
 
-def _xor(x: list[sc.Variable]) -> sc.Variable:
-    dim = uuid.uuid4().hex
-    return sc.concat(x, dim).sum(dim) == sc.scalar(1, unit=None)
+def _xor(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    # A point is selected if it is inside exactly one of the cuts
+    return np.equal(np.count_nonzero(x, axis=0), 1, out=out)
 
 
+# Operations combining the selections of all the cuts, stacked as the rows of a
+# 2d boolean array, into a single selection.
 OPERATIONS = {
-    'or': partial(reduce, lambda x, y: sc.logical_or(x, y)),
-    'and': partial(reduce, lambda x, y: sc.logical_and(x, y)),
+    'or': partial(np.logical_or.reduce, axis=0),
+    'and': partial(np.logical_and.reduce, axis=0),
     'xor': _xor,
 }
 
 
-def select(da: sc.DataArray, s: tuple[str, sc.Variable]) -> sc.DataArray:
+# A selection of points: either a boolean mask, or a dimension and a slice for a
+# contiguous range of points
+Selection = sc.Variable | tuple[str, slice]
+
+
+def _merge_ranges(
+    ranges: list[tuple[str, float, float]], operation: str
+) -> list[tuple[str, float, float]]:
+    """
+    Combine the ``(dim, start, end)`` ranges of the cuts along the same dimension
+    before they are compared to the coordinates, so that each coordinate array is
+    scanned as few times as possible. With 'or', the overlapping ranges are merged,
+    and with 'and', the ranges are intersected (an empty intersection has
+    ``start >= end`` and selects nothing). The ranges are left unchanged for 'xor',
+    which needs the selection of every cut.
+    """
+    if operation == 'xor':
+        return ranges
+    by_dim = {}
+    for dim, start, end in ranges:
+        by_dim.setdefault(dim, []).append((start, end))
+    out = []
+    for dim, intervals in by_dim.items():
+        if operation == 'and':
+            out.append(
+                (dim, max(i[0] for i in intervals), min(i[1] for i in intervals))
+            )
+            continue
+        intervals.sort()
+        start, end = intervals[0]
+        for s, e in intervals[1:]:
+            if s > end:
+                out.append((dim, start, end))
+                start = s
+            end = max(end, e)
+        out.append((dim, start, end))
+    return out
+
+
+def _prune_ranges(
+    ranges: list[tuple[str, float, float]],
+    extents: dict[str, tuple[float, float]],
+    operation: str,
+) -> tuple[bool | None, list[tuple[str, float, float]]]:
+    """
+    Remove the ranges that do not change the selection, given the extents (min and
+    max) of the coordinates: empty ranges for 'or' and 'xor', and ranges covering
+    all the points for 'and'. If the operation selects either all or none of the
+    points, this is returned as ``True`` or ``False`` as the first item of the
+    result (``None`` otherwise), so that the coordinates do not need to be compared.
+    """
+
+    def covers(dim: str, start: float, end: float) -> bool:
+        # Coordinates with NaNs never cover, as NaNs are never in a range
+        low, high = extents[dim]
+        return start <= low and high < end
+
+    if operation == 'and':
+        if any(start >= end for _, start, end in ranges):
+            return False, []
+        ranges = [r for r in ranges if not covers(*r)]
+        return (True if not ranges else None), ranges
+    if operation == 'or' and any(covers(*r) for r in ranges):
+        return True, []
+    ranges = [r for r in ranges if r[1] < r[2]]
+    return (False if not ranges else None), ranges
+
+
+# Number of points for which the selections are computed at a time, so that the
+# intermediate arrays stay in the CPU cache (see ``_select_points``).
+_CHUNK_SIZE = 2**16
+
+
+def _select_points(
+    coords: list[np.ndarray],
+    ranges: list[tuple[str, float, float]],
+    operation: str,
+    buffers: dict,
+) -> np.ndarray:
+    """
+    Find the points that are selected by combining the ranges with the given
+    operation. ``coords`` holds the coordinate values compared to each range.
+    The points are processed in chunks: the selection of each range is written to
+    a row of a small array, and the rows are then combined into the output. This
+    makes a single pass over the (large) output array, while all the intermediate
+    results remain in the CPU cache.
+    """
+    size = len(coords[0])
+    chunk = max(min(size, _CHUNK_SIZE), 1)
+    rows = scratch_buffer(buffers, 'cuts', (len(ranges), chunk))
+    above = scratch_buffer(buffers, 'above', (chunk,))
+    out = scratch_buffer(buffers, 'selection', (size,))
+    combine = OPERATIONS[operation]
+    for start in range(0, size, chunk):
+        stop = min(start + chunk, size)
+        n = stop - start
+        for row, coord, (_, lo, hi) in zip(rows, coords, ranges, strict=True):
+            values = coord[start:stop]
+            np.greater_equal(values, lo, out=above[:n])
+            np.less(values, hi, out=row[:n])
+            row[:n] &= above[:n]
+        combine(rows[:, :n], out=out[start:stop])
+    return out
+
+
+# Fraction of the points below which the selections are built from the points found
+# in the sorted coordinates, instead of comparing all the coordinates to the ranges
+# (see ``_select_sorted_points``).
+_SORTED_FRACTION = 0.1
+
+
+# The maximum number of points in the point cloud of each cut while the sliders are
+# being dragged (see ``ClippingPlanes._update_on_move``)
+_PREVIEW_MAX_POINTS = 100_000
+
+
+def _thin_selection(selection: Selection, max_points: int) -> Selection:
+    """
+    Keep only every n-th selected point, so that at most ``max_points`` points are
+    selected.
+    """
+    if isinstance(selection, tuple):
+        dim, sl = selection
+        stride = -(-(sl.stop - sl.start) // max_points)
+        return (dim, slice(sl.start, sl.stop, stride)) if stride > 1 else selection
+    values = selection.values
+    selected = np.flatnonzero(values)
+    stride = -(-len(selected) // max_points)
+    if stride > 1:
+        values.fill(False)
+        values.reshape(-1)[selected[::stride]] = True
+    return selection
+
+
+def _sorted_indices(
+    perm: np.ndarray | None, start: int, end: int
+) -> slice | np.ndarray:
+    """
+    The indices of the points between ``start`` and ``end`` in the sorted order.
+    """
+    return slice(start, end) if perm is None else perm[start:end]
+
+
+def _select_sorted_points(
+    sorted_coords: list[tuple[np.ndarray, np.ndarray | None]],
+    ranges: list[tuple[str, float, float]],
+    operation: str,
+    buffers: dict,
+) -> np.ndarray | None:
+    """
+    Find the points that are selected by combining the ranges with the given
+    operation, like ``_select_points``. ``sorted_coords`` holds the sorted
+    coordinate values compared to each range, along with the permutations that
+    sort them (``None`` for coordinates that are already sorted). The points
+    inside each range are found with a binary search, and only those points are
+    written to the output. ``None`` is returned if the ranges contain too many
+    points for this to be faster than comparing all the coordinates.
+    """
+    size = len(sorted_coords[0][0])
+    bounds = [
+        np.searchsorted(values, (lo, hi))
+        for (values, _), (_, lo, hi) in zip(sorted_coords, ranges, strict=True)
+    ]
+    if sum(end - start for start, end in bounds) > _SORTED_FRACTION * size:
+        return None
+    out = scratch_buffer(buffers, 'selection', (size,))
+    if operation == 'or':
+        out.fill(False)
+        for (_, perm), (start, end) in zip(sorted_coords, bounds, strict=True):
+            out[_sorted_indices(perm, start, end)] = True
+        return out
+    # Count the number of ranges that contain each point
+    counts = scratch_buffer(
+        buffers, 'counts', (size,), dtype=np.min_scalar_type(len(ranges))
+    )
+    counts.fill(0)
+    for (_, perm), (start, end) in zip(sorted_coords, bounds, strict=True):
+        counts[_sorted_indices(perm, start, end)] += 1
+    return np.equal(counts, 1 if operation == 'xor' else len(ranges), out=out)
+
+
+@dataclass(frozen=True)
+class _SelectionInputs:
+    """
+    The inputs needed to compute the selection of points of the data of one original
+    node, see ``_compute_selection``. They only hold NumPy arrays and plain values,
+    so that the selection can be computed in a worker thread without touching the
+    nodes or the caches of the clipping planes.
+    """
+
+    key: str
+    dims: tuple[str, ...]
+    shape: tuple[int, ...]
+    # If not ``None``, all (``True``) or none (``False``) of the points are selected
+    trivial: bool | None
+    ranges: tuple[tuple[str, float, float], ...]
+    sorted_coords: tuple[tuple[np.ndarray, np.ndarray | None], ...]
+    coords: tuple[np.ndarray, ...]
+
+
+def _compute_selection(
+    inputs: _SelectionInputs, operation: str, buffers: dict
+) -> Selection | None:
+    """
+    Compute the selection of points of the data of one original node, or ``None``
+    if no points are selected. The selection is a boolean mask, or a slice if the
+    selected points are contiguous.
+    """
+    dims = list(inputs.dims)
+    if inputs.trivial is not None:
+        # All or none of the points are selected, there is no need to compare the
+        # coordinates with the ranges.
+        values = np.full(inputs.shape, inputs.trivial)
+        return sc.array(dims=dims, values=values) if inputs.trivial else None
+    ranges = list(inputs.ranges)
+    sorted_coords = list(inputs.sorted_coords)
+    if len(dims) == 1 and len(ranges) == 1 and sorted_coords[0][1] is None:
+        # The points inside a single range of a sorted coordinate are contiguous,
+        # so the data is sliced instead of selected with a mask, which avoids
+        # scanning and copying all of the data.
+        start, end = np.searchsorted(sorted_coords[0][0], ranges[0][1:])
+        return (dims[0], slice(int(start), int(end))) if end > start else None
+    values = _select_sorted_points(sorted_coords, ranges, operation, buffers)
+    if values is None:
+        values = _select_points(list(inputs.coords), ranges, operation, buffers)
+    # The selection is copied out of the scratch array
+    return sc.array(dims=dims, values=values) if values.any() else None
+
+
+def _compute_selections(
+    inputs: list[_SelectionInputs | None],
+    operation: str,
+    buffers: dict,
+    max_points: int | None = None,
+) -> list[Selection | None]:
+    """
+    Compute the selection of points of each original node, see
+    ``_compute_selection``. If ``max_points`` is given, the selections are thinned
+    out to keep at most about ``max_points`` points.
+    """
+    out = []
+    for node_inputs in inputs:
+        selection = (
+            None
+            if node_inputs is None
+            else _compute_selection(
+                node_inputs, operation, buffers.setdefault(node_inputs.key, {})
+            )
+        )
+        if selection is not None and max_points is not None:
+            selection = _thin_selection(selection, max_points)
+        out.append(selection)
+    return out
+
+
+@cache
+def _executor() -> ThreadPoolExecutor:
+    """
+    The worker thread computing the selections of all the clipping planes while
+    their sliders are moved, see ``ClippingPlanes._update_state_in_background``.
+    A single thread is shared by all the widgets, instead of keeping an idle thread
+    alive for each of them.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='plopp-clip3d')
+
+
+def _make_rect_geometry(width: float, height: float):
+    """
+    Make the geometry of the outline of a rectangle in the XY plane, centered on the
+    origin, to be drawn with ``LineSegments``. The four corners are given directly,
+    with an index listing the pairs of corners joined by the edges, instead of
+    making a plane and extracting its edges with an ``EdgesGeometry``.
+    """
+    import pythreejs as p3
+
+    w = 0.5 * width
+    h = 0.5 * height
+    corners = np.array(
+        [[-w, -h, 0], [w, -h, 0], [w, h, 0], [-w, h, 0]], dtype='float32'
+    )
+    edges = np.array([0, 1, 1, 2, 2, 3, 3, 0], dtype='uint16')
+    return p3.BufferGeometry(
+        index=p3.BufferAttribute(array=edges),
+        attributes={'position': p3.BufferAttribute(array=corners)},
+    )
+
+
+def select(da: sc.DataArray, s: Selection) -> sc.DataArray:
     return da[s]
 
 
+def _selection(s: Selection) -> Selection:
+    return s
+
+
 class Clip3dTool(ipw.HBox):
     """
     A tool that provides a slider to extract a slab of points in a three-dimensional
     scatter plot, and add it to the scene as an opaque cut. The slider controls the
     position and range of the slice. When the slider is dragged, the red outline of the
     cut is moved at the same time, while the actual point cloud gets updated less
-    frequently using a debounce mechanism.
+    frequently using a throttling mechanism.
 
     .. versionadded:: 24.04.0
 
@@ -54,6 +350,17 @@ class Clip3dTool(ipw.HBox):
         Color of the cut's outline.
     linewidth:
         Width of the line delineating the outline.
+    border_visible:
+        Show the outline of the cut if ``True``.
+    throttled_update:
+        The function to call when the slider is moved. If ``None``, ``update`` is
+        throttled by the tool itself. Several tools can share the same throttled
+        function, so that moving the sliders of different cuts at the same time
+        only triggers a single update.
+    outline_cache:
+        A dict in which the geometries and materials of the outlines are stored, to
+        be re-used by other tools with the same outline size, color and linewidth.
+        If ``None``, the outlines of the tool are not shared with other tools.
     """
 
     def __init__(
@@ -64,6 +371,8 @@ class Clip3dTool(ipw.HBox):
         color: str = 'red',
         linewidth: float = 1.5,
         border_visible: bool = True,
+        throttled_update: Callable | None = None,
+        outline_cache: dict | None = None,
     ):
         self._limits = limits
         self._direction = direction
@@ -72,6 +381,9 @@ class Clip3dTool(ipw.HBox):
         self._unit = self._limits[axis].unit
         self.visible = True
         self._update = update
+        self._throttled_update = (
+            throttle(0.1)(update) if throttled_update is None else throttled_update
+        )
         self._border_visible = border_visible
 
         w_axis = 2 if self._direction == 'x' else 0
@@ -81,19 +393,20 @@ class Clip3dTool(ipw.HBox):
 
         import pythreejs as p3
 
+        # Both outlines are the same rectangle, only placed at different positions,
+        # so they share their geometry and material (also with other tools through
+        # the cache).
+        cache = {} if outline_cache is None else outline_cache
+        geometry_key = ('geometry', width, height)
+        if geometry_key not in cache:
+            cache[geometry_key] = _make_rect_geometry(width, height)
+        material_key = ('material', color, linewidth)
+        if material_key not in cache:
+            cache[material_key] = p3.LineBasicMaterial(color=color, linewidth=linewidth)
+        geometry = cache[geometry_key]
+        material = cache[material_key]
         self.outlines = [
-            p3.LineSegments(
-                geometry=p3.EdgesGeometry(
-                    p3.PlaneBufferGeometry(width=width, height=height)
-                ),
-                material=p3.LineBasicMaterial(color=color, linewidth=linewidth),
-            ),
-            p3.LineSegments(
-                geometry=p3.EdgesGeometry(
-                    p3.PlaneBufferGeometry(width=width, height=height)
-                ),
-                material=p3.LineBasicMaterial(color=color, linewidth=linewidth),
-            ),
+            p3.LineSegments(geometry=geometry, material=material) for _ in range(2)
         ]
         if self._direction == 'x':
             for outline in self.outlines:
@@ -123,10 +436,11 @@ class Clip3dTool(ipw.HBox):
             layout={'width': '16px', 'padding': '0px'},
         )
 
+        # The outlines only move along the axis of the cut
+        self._axis = axis
+        self._center = center
         for outline, val in zip(self.outlines, self.slider.value, strict=True):
-            pos = list(center)
-            pos[axis] = val
-            outline.position = pos
+            outline.position = self._outline_position(val)
             outline.visible = self._border_visible
 
         self.unit_label = ipw.Label(f'[{self._unit}]')
@@ -164,28 +478,35 @@ class Clip3dTool(ipw.HBox):
         """
         # Early return if relative difference between new and old value is small.
         # This also prevents flickering of an existing cut when a new cut is added.
-        if (
-            np.abs(np.array(value['new']) - np.array(value['old'])).max()
-            < 0.01 * self.slider.step
-        ):
+        tolerance = 0.01 * self.slider.step
+        moved = [
+            abs(new - old) >= tolerance
+            for new, old in zip(value['new'], value['old'], strict=True)
+        ]
+        if not any(moved):
             return
-        for outline, val in zip(self.outlines, value['new'], strict=True):
-            pos = list(outline.position)
-            axis = 'xyz'.index(self._direction)
-            pos[axis] = val
-            outline.position = pos
+        # Dragging one end of the slider only moves one of the outlines
+        for outline, val, outline_moved in zip(
+            self.outlines, value['new'], moved, strict=True
+        ):
+            if outline_moved:
+                outline.position = self._outline_position(val)
         self._throttled_update()
 
+    def _outline_position(self, value: float) -> tuple[float, float, float]:
+        """
+        The position of an outline placed at ``value`` along the axis of the cut.
+        """
+        pos = list(self._center)
+        pos[self._axis] = value
+        return tuple(pos)
+
     @property
     def range(self):
         return sc.scalar(self.slider.value[0], unit=self._unit), sc.scalar(
             self.slider.value[1], unit=self._unit
         )
 
-    @debounce(0.3)
-    def _throttled_update(self):
-        self._update()
-
 
 class ClippingPlanes(ipw.HBox):
     """
@@ -229,6 +550,31 @@ class ClippingPlanes(ipw.HBox):
         self.tabs = ipw.Tab(layout={'width': '550px'})
         self._original_nodes = list(self._view.graph_nodes.values())
         self._nodes = {}
+        # Scratch arrays used to compute the selections, for each original node
+        self._buffers = {}
+        # The coordinate values of the data of each original node, see ``_coord``
+        self._coords = {}
+        # The cuts, operation and data used in the last update, see ``update_state``
+        self._last_state = None
+        # The units of the cuts along each dimension
+        self._units = {limits.dim: limits.unit for limits in self._limits}
+        # The scratch arrays of the worker thread computing the selections while the
+        # sliders are moved, see ``_update_state_in_background``
+        self._background_buffers = {}
+        self._computing = False
+        # Whether to start another computation once the current one has finished,
+        # and its ``max_points``
+        self._recompute = (False, None)
+        # The slider updates of all the cuts are throttled together, so that moving
+        # several cuts at once only triggers a single update of the state. They show
+        # a preview of the point clouds, and the full point clouds are shown when
+        # the sliders stop moving (see ``_update_on_move``).
+        self._preview_update = throttle(0.1)(
+            partial(self._update_state_in_background, max_points=_PREVIEW_MAX_POINTS)
+        )
+        self._full_update = debounce(0.3)(self._update_state_in_background)
+        # The outline geometries and materials shared by the cuts
+        self._outline_cache = {}
 
         self.add_cut_label = ipw.Label('Add cut:')
         layout = {'width': '45px', 'padding': '0px 0px 0px 0px'}
@@ -320,25 +666,48 @@ class ClippingPlanes(ipw.HBox):
         """
         Add a cut in the specified direction.
         """
-        cut = Clip3dTool(
-            direction=direction,
-            limits=self._limits,
-            update=self.update_state,
-            border_visible=self.cut_borders_visibility.value,
-        )
-        self._view.canvas.add(cut.outlines)
-        self.cuts.append(cut)
-        self.tabs.children = [*self.tabs.children, cut]
-        self.tabs.selected_index = len(self.cuts) - 1
-        self.update_controls()
+        self.add_cuts([direction])
+
+    def add_cuts(self, directions: Iterable[Literal['x', 'y', 'z']]):
+        """
+        Add cuts in the specified directions. The tabs and the state are only
+        updated once, after all the cuts have been made.
+
+        Parameters
+        ----------
+        directions:
+            The direction of each new cut.
+        """
+        cuts = [
+            Clip3dTool(
+                direction=direction,
+                limits=self._limits,
+                update=self.update_state,
+                border_visible=self.cut_borders_visibility.value,
+                throttled_update=self._update_on_move,
+                outline_cache=self._outline_cache,
+            )
+            for direction in directions
+        ]
+        if not cuts:
+            return
+        self._view.canvas.add([outline for cut in cuts for outline in cut.outlines])
+        self.cuts.extend(cuts)
+        # The children, selected index and titles of the tabs are sent to the
+        # frontend in a single message
+        with self.tabs.hold_sync():
+            self.tabs.children = [*self.tabs.children, *cuts]
+            self.tabs.selected_index = len(self.cuts) - 1
+            self.update_controls()
         self.update_state()
 
     def _remove_cut(self, _):
         cut = self.cuts.pop(self.tabs.selected_index)
         self._view.canvas.remove(cut.outlines)
-        self.tabs.children = self.cuts
+        with self.tabs.hold_sync():
+            self.tabs.children = self.cuts
+            self.update_controls()
         self.update_state()
-        self.update_controls()
 
     def update_controls(self):
         """
@@ -382,6 +751,98 @@ class ClippingPlanes(ipw.HBox):
         self._operation = change['new'].lower()
         self.update_state()
 
+    def _coord(
+        self, node_id: str, da: sc.DataArray, dim: str, unit: str | None
+    ) -> np.ndarray:
+        """
+        Get the values of a coordinate of the data of an original node, in the unit
+        of the cuts. The positions of the points do not change when the cuts are
+        moved, so the arrays are kept for as long as the node returns the same data.
+        The values are stored in a contiguous array, so that the coordinates of a
+        strided slice of the data are not read with a stride on every update.
+        """
+        values = self._node_cache(node_id, da)['values']
+        if dim not in values:
+            values[dim] = np.ascontiguousarray(
+                da.coords[dim].to(unit=unit, copy=False).values
+            )
+        return values[dim]
+
+    def _node_cache(self, node_id: str, da: sc.DataArray) -> dict:
+        """
+        Get the cache of the coordinate arrays of the data of an original node,
+        emptying it if the node has returned new data.
+        """
+        cache = self._coords.get(node_id)
+        if cache is None or cache['data'] is not da:
+            cache = self._coords[node_id] = {
+                'data': da,
+                'values': {},
+                'extents': {},
+                'sorted': {},
+            }
+        return cache
+
+    def _extent(
+        self, node_id: str, da: sc.DataArray, dim: str, unit: str | None
+    ) -> tuple[float, float]:
+        """
+        Get the min and max of a coordinate of the data of an original node, in the
+        unit of the cuts (NaN if the coordinate has NaNs). See ``_coord``.
+        """
+        coord = self._coord(node_id, da, dim, unit)
+        extents = self._coords[node_id]['extents']
+        if dim not in extents:
+            extents[dim] = (
+                (np.min(coord), np.max(coord)) if coord.size else (np.nan, np.nan)
+            )
+        return extents[dim]
+
+    def _sorted_coord(
+        self, node_id: str, da: sc.DataArray, dim: str, unit: str | None
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Get the values of a coordinate of the data of an original node, in the unit
+        of the cuts, sorted in ascending order (NaNs at the end), along with the
+        permutation that sorts them. The permutation is ``None`` if the coordinate
+        is already sorted. See ``_coord``.
+        """
+        coord = self._coord(node_id, da, dim, unit)
+        sorted_coords = self._coords[node_id]['sorted']
+        if dim not in sorted_coords:
+            if np.all(coord[1:] >= coord[:-1]):
+                sorted_coords[dim] = (coord, None)
+            else:
+                perm = np.argsort(coord, kind='stable')
+                sorted_coords[dim] = (coord[perm], perm)
+        return sorted_coords[dim]
+
+    def _current_state(self) -> tuple[tuple, list]:
+        """
+        The cuts and operation, and the data of the original nodes, which determine
+        the point clouds of the cuts.
+        """
+        state = (
+            self._operation,
+            tuple((cut.dim, cut.slider.value) for cut in self.cuts if cut.visible),
+        )
+        return state, [n.request_data() for n in self._original_nodes]
+
+    def _is_last_state(
+        self, state: tuple, data: list, max_points: int | None = None
+    ) -> bool:
+        """
+        Check if the point clouds of the cuts already show the given state. A
+        preview (with ``max_points``) is not needed if the state is shown at any
+        resolution, but the full point clouds are needed after a preview.
+        """
+        return (
+            self._last_state is not None
+            and state == self._last_state[0]
+            and all(a is b for a, b in zip(data, self._last_state[1], strict=True))
+            and (max_points is not None or self._last_state[2] is None)
+        )
+
     def update_state(self):
         """
         Update the state, combining all the active cuts, using the selected binary
@@ -389,35 +850,188 @@ class ClippingPlanes(ipw.HBox):
         second point cloud which is included in the scene.
         The original point cloud is then set to be semi-transparent.
         When the position/range of a cut is changed, this function is called via a
-        debounce mechanism to avoid updating the cloud too often. Only the outlines of
+        throttling mechanism to avoid updating the cloud too often. Only the outlines of
         the cuts are moved in real time, which is cheap.
+        Nothing is done if neither the cuts, the operation, nor the data of the
+        original nodes have changed since the last update.
         """
-        for nodes in self._nodes.values():
-            self._view.remove(nodes['slice'].id)
-            nodes['slice'].remove()
-        self._nodes.clear()
+        state, data = self._current_state()
+        if self._is_last_state(state, data):
+            return
+        self._apply_selections(
+            state,
+            data,
+            _compute_selections(
+                self._selection_inputs(state, data), state[0], self._buffers
+            ),
+        )
 
-        visible_cuts = [cut for cut in self.cuts if cut.visible]
-        if not visible_cuts:
+    def _update_on_move(self):
+        """
+        Update the point clouds of the cuts when a cut is moved. While the slider is
+        dragged, a preview with a limited number of points is shown, to limit the
+        amount of data sent to the frontend. The full point clouds are shown once
+        the slider has stopped moving.
+        """
+        self._preview_update()
+        self._full_update()
+
+    def _update_state_in_background(self, max_points: int | None = None):
+        """
+        Update the state like ``update_state``, but compute the selections in a
+        worker thread, so that the event loop (and the outlines of the cuts) stays
+        responsive while the coordinates of large point clouds are compared to the
+        cuts. The point clouds are then updated back in the event loop.
+        Only one computation runs at a time: if the state is updated while one is
+        running, another one is started with the latest state once it has finished.
+        Without a running event loop, the state is updated synchronously (at full
+        resolution).
+
+        Parameters
+        ----------
+        max_points:
+            If not ``None``, only show a subset of (at most about) ``max_points``
+            points in the point cloud of each cut.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.update_state()
             return
+        if self._computing:
+            self._recompute = (True, max_points)
+            return
+        state, data = self._current_state()
+        if self._is_last_state(state, data, max_points):
+            return
+        self._computing = True
+        self._recompute = (False, None)
+        # The caches of the coordinates are filled here, in the event loop, and the
+        # worker thread only receives the arrays it needs. It has its own scratch
+        # arrays, as ``update_state`` may be called from the event loop while the
+        # selections are being computed.
+        future = loop.run_in_executor(
+            _executor(),
+            _compute_selections,
+            self._selection_inputs(state, data),
+            state[0],
+            self._background_buffers,
+            max_points,
+        )
+        future.add_done_callback(
+            partial(
+                self._selections_computed, state, data, max_points, self._last_state
+            )
+        )
 
-        for n in self._original_nodes:
-            da = n.request_data()
-            selections = []
-            for cut in visible_cuts:
-                xmin, xmax = cut.range
-                selections.append(
-                    (da.coords[cut.dim] >= xmin) & (da.coords[cut.dim] < xmax)
-                )
-            selection = OPERATIONS[self._operation](selections)
-            if selection.sum().value > 0:
-                if n.id not in self._nodes:
+    def _selections_computed(
+        self,
+        state: tuple,
+        data: list,
+        max_points: int | None,
+        last_state: tuple,
+        future: asyncio.Future,
+    ):
+        """
+        Apply the selections computed in the worker thread, unless a newer state has
+        been applied (by ``update_state``) since the computation was started.
+        """
+        self._computing = False
+        if self._last_state is last_state:
+            self._apply_selections(state, data, future.result(), max_points)
+        recompute, max_points = self._recompute
+        if recompute:
+            self._update_state_in_background(max_points)
+
+    def _selection_inputs(
+        self, state: tuple, data: list
+    ) -> list[_SelectionInputs | None]:
+        """
+        Gather the inputs needed to compute the selection of points of each original
+        node (``None`` if there are no cuts), filling the caches of the coordinates
+        on the way. See ``_compute_selections``.
+        """
+        operation, cuts = state
+        if not cuts:
+            return [None] * len(data)
+        units = {dim: self._units[dim] for dim, _ in cuts}
+        ranges = _merge_ranges([(dim, *value) for dim, value in cuts], operation)
+        return [
+            self._node_selection_inputs(n.id, da, ranges, units, operation)
+            for n, da in zip(self._original_nodes, data, strict=True)
+        ]
+
+    def _node_selection_inputs(
+        self,
+        node_id: str,
+        da: sc.DataArray,
+        ranges: list[tuple[str, float, float]],
+        units: dict[str, str | None],
+        operation: str,
+    ) -> _SelectionInputs:
+        """
+        Gather the inputs needed to compute the selection of points of the data of
+        one original node, see ``_selection_inputs``.
+        """
+        trivial, ranges = _prune_ranges(
+            ranges,
+            {dim: self._extent(node_id, da, dim, unit) for dim, unit in units.items()},
+            operation,
+        )
+        # The coordinates are not needed if all or none of the points are selected
+        dims = [] if trivial is not None else [dim for dim, *_ in ranges]
+        return _SelectionInputs(
+            key=node_id,
+            dims=da.dims,
+            shape=da.shape,
+            trivial=trivial,
+            ranges=tuple(ranges),
+            sorted_coords=tuple(
+                self._sorted_coord(node_id, da, dim, unit=units[dim]) for dim in dims
+            ),
+            coords=tuple(
+                self._coord(node_id, da, dim, unit=units[dim]) for dim in dims
+            ),
+        )
+
+    def _apply_selections(
+        self,
+        state: tuple,
+        data: list,
+        selections: list[Selection | None],
+        max_points: int | None = None,
+    ):
+        """
+        Update the point clouds of the cuts. The nodes (and artists) of the existing
+        point clouds are kept, and only given their new selection. They are only
+        removed if no points are selected anymore.
+        The point clouds of the cuts are removed and added in a single batch, so that
+        the view is only fitted to the data and drawn once.
+        """
+        self._last_state = (state, data, max_points)
+        with self._view.batch():
+            for n, selection in zip(self._original_nodes, selections, strict=True):
+                if selection is None:
+                    if n.id in self._nodes:
+                        self._remove_cut_nodes(n.id)
+                elif n.id not in self._nodes:
                     select_node = Node(selection)
                     self._nodes[n.id] = {
                         'select': select_node,
-                        'slice': Node(lambda da, s: da[s], da=n, s=select_node),
+                        'slice': Node(select, da=n, s=select_node),
                     }
                     self._nodes[n.id]['slice'].add_view(self._view)
+                    select_node.notify_children("")
                 else:
-                    self._nodes[n.id]['select'].func = lambda: selection  # noqa: B023
-                self._nodes[n.id]['select'].notify_children("")
+                    # The selection is bound with a partial, instead of a lambda which
+                    # would refer to the selection of the last node of the loop.
+                    self._nodes[n.id]['select'].func = partial(_selection, selection)
+                    self._nodes[n.id]['select'].notify_children("")
+
+    def _remove_cut_nodes(self, node_id: str):
+        """
+        Remove the point cloud of the cut of an original node.
+        """
+        nodes = self._nodes.pop(node_id)
+        self._view.remove(nodes['slice'].id)
+        nodes['slice'].remove()
@@ -2,54 +2,101 @@
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
 import asyncio
+import time
 from collections.abc import Callable
+from functools import partial
 
 
-class Timer:
-    """
-    From:
-    https://ipywidgets.readthedocs.io/en/8.0.2/examples/Widget%20Events.html#Debouncing
-    """
-
-    def __init__(self, timeout: float, callback: Callable):
-        self._timeout = timeout
-        self._callback = callback
-
-    async def _job(self):
-        await asyncio.sleep(self._timeout)
-        self._callback()
-
-    def start(self):
-        self._task = asyncio.ensure_future(self._job())
-
-    def cancel(self):
-        self._task.cancel()
-
-
-def debounce(wait: float):
+def debounce(wait: float, max_wait: float | None = None):
     """
     Decorator that will postpone a function's
     execution until after `wait` seconds
     have elapsed since the last time it was invoked.
+    If ``max_wait`` is given, the function is also executed when it has been
+    postponed for at least ``max_wait`` seconds, so that there are regular updates
+    while it keeps being invoked.
 
-    From:
+    Adapted from:
     https://ipywidgets.readthedocs.io/en/8.0.2/examples/Widget%20Events.html#Debouncing
     """
 
     def decorator(fn: Callable):
-        timer = None
+        handle = None
+        # The time of the first invocation since the function was last executed
+        first_call = None
+
+        def execute(args, kwargs):
+            nonlocal handle, first_call
+            handle = None
+            first_call = None
+            fn(*args, **kwargs)
 
         def debounced(*args, **kwargs):
-            nonlocal timer
+            nonlocal handle, first_call
+            # Re-scheduling only needs a timer handle on the event loop, instead of
+            # a new task sleeping for ``wait`` which has to be cancelled.
+            if handle is not None:
+                handle.cancel()
+            now = time.monotonic()
+            if first_call is None:
+                first_call = now
+            elif max_wait is not None and now - first_call >= max_wait:
+                execute(args, kwargs)
+                return
+            handle = asyncio.get_event_loop().call_later(
+                wait, partial(execute, args, kwargs)
+            )
 
-            def call_it():
-                fn(*args, **kwargs)
+        return debounced
 
-            if timer is not None:
-                timer.cancel()
-            timer = Timer(wait, call_it)
-            timer.start()
+    return decorator
 
-        return debounced
+
+def throttle(interval: float):
+    """
+    Decorator that executes a function right away, and then at most once every
+    ``interval`` seconds while it keeps being invoked. If the function takes longer
+    than ``interval`` to run, the wait between two executions is the duration of
+    the last execution instead, so that the function runs as often as it can without
+    piling up. The invocations made while waiting are not lost: the last one is
+    executed at the end of the wait.
+
+    Unlike ``debounce``, this gives intermediate results while e.g. a slider is
+    being dragged, instead of only after it has been released.
+    """
+
+    def decorator(fn: Callable):
+        timer = None
+        pending = None
+        # The time after which the function can be executed again
+        ready = 0.0
+
+        def execute(args, kwargs):
+            nonlocal ready
+            start = time.perf_counter()
+            fn(*args, **kwargs)
+            end = time.perf_counter()
+            ready = end + max(interval, end - start)
+
+        def execute_pending():
+            nonlocal timer, pending
+            args, kwargs = pending
+            timer = None
+            pending = None
+            execute(args, kwargs)
+
+        def throttled(*args, **kwargs):
+            nonlocal timer, pending
+            now = time.perf_counter()
+            if timer is None and now >= ready:
+                execute(args, kwargs)
+                return
+            pending = (args, kwargs)
+            if timer is None:
+                timer = asyncio.get_event_loop().call_later(
+                    ready - now, execute_pending
+                )
+
+        return throttled
 
     return decorator
@@ -111,7 +111,9 @@ class DrawingTool(ToggleTool):
         n = self._draw_nodes[artist.nodeid]
         if self._get_artist_info_is_callable:
             n.func = self._get_artist_info(artist=artist, figure=self._figure)
-        else:
+        elif not isinstance(n.func, partial):
+            # The partial reads the current state of the artist every time it is
+            # called, so it only needs to be made once, not on every drag event.
             n.func = partial(self._get_artist_info, artist=artist, figure=self._figure)
         n.notify_children(artist)
 
@@ -5,10 +5,11 @@ from functools import partial
 from typing import Any
 
 import ipywidgets as ipw
+import numpy as np
 import scipp as sc
 
 from ..core import node
-from ..core.utils import coord_element_to_string
+from ..core.utils import coord_element_to_string, value_to_string
 from .box import VBar
 
 
@@ -42,9 +43,17 @@ class DimSlicer(ipw.VBox):
             indent=False,
             layout={"width": "20px"},
         )
-        self.label = ipw.Label(
-            value=coord_element_to_string(coord[dim, self.slider.value])
+        self.dim = dim
+        self.coord = coord
+        # The values of a 1d coordinate are read from a NumPy array when the slider
+        # is moved, instead of slicing the coordinate. Other coordinates (strings,
+        # vectors, multi-dimensional) are still sliced.
+        values = coord.values
+        self._values = (
+            values if isinstance(values, np.ndarray) and values.ndim == 1 else None
         )
+        self._unit_suffix = f" [{coord.unit}]" if coord.unit is not None else ""
+        self.label = ipw.Label(value=self._label_text(self.slider.value))
         ipw.jslink(
             (self.continuous_update, 'value'), (self.slider, 'continuous_update')
         )
@@ -62,8 +71,6 @@ class DimSlicer(ipw.VBox):
             ipw.jslink((self.player, 'value'), (self.slider, 'value'))
             children.insert(0, self.player)
 
-        self.dim = dim
-        self.coord = coord
         self.slider.observe(self._update_label, names='value')
 
         super().__init__([ipw.HBox(children)])
@@ -73,7 +80,19 @@ class DimSlicer(ipw.VBox):
         Update the readout label with the coordinate value, instead of the integer
         readout index.
         """
-        self.label.value = coord_element_to_string(self.coord[self.dim, change['new']])
+        self.label.value = self._label_text(change['new'])
+
+    def _label_text(self, index: int | tuple[int, int]) -> str:
+        """
+        The text of the readout label for a given slider value.
+        This gives the same text as ``coord_element_to_string`` on the slice of the
+        coordinate.
+        """
+        if self._values is None:
+            return coord_element_to_string(self.coord[self.dim, index])
+        indices = index if isinstance(index, tuple) else (index,)
+        text = ':'.join(value_to_string(self._values[i]) for i in indices)
+        return text + self._unit_suffix
 
     @property
     def value(self) -> int | tuple[int, int]:
@@ -178,8 +197,18 @@ def slice_dims(data_array: sc.DataArray, slices: dict[str, slice]) -> sc.DataArr
         Dict of slices to apply for each dimension.
     """
     out = data_array
-    for dim, sl in slices.items():
+    # Integer indices are applied first: they drop a dimension, so that the
+    # following slices have fewer coordinates and masks to slice. Ranges covering a
+    # whole dimension would leave the data unchanged and are skipped.
+    for dim, sl in sorted(
+        slices.items(), key=lambda item: not isinstance(item[1], int)
+    ):
         if isinstance(sl, tuple):
             sl = slice(*sl)
+        size = out.sizes[dim]
+        if isinstance(sl, slice) and sl.indices(size) == (0, size, 1):
+            continue
         out = out[dim, sl]
-    return out
+    # Never hand back the input itself: downstream nodes and views may modify the
+    # coordinates of their input, or detect new data by its identity.
+    return data_array.copy(deep=False) if out is data_array else out
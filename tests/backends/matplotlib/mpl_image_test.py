@@ -85,7 +85,40 @@ def test_bbox_binedges(linspace):
     assert bbox.ymax == da.coords['yy'].max().value
 
 
+def test_bbox_binedges_log_ignores_non_positive_values():
+    da = data_array(ndim=2, binedges=True, linspace=False)
+    fig = imagefigure(Node(da))
+    [artist] = fig.artists.values()
+    bbox = artist.bbox(xscale='log', yscale='linear')
+    xx = da.coords['xx'].values
+    assert bbox.xmin == xx[xx > 0].min()
+    assert bbox.xmax == xx.max()
+
+
 def test_pass_mpl_cmap_object():
     da = data_array(ndim=2)
     cmap = mpl.colormaps['plasma']
     imagefigure(Node(da), cmap=cmap)
+
+
+def test_bbox_unchanged_after_update():
+    da = data_array(ndim=2, linspace=False)
+    fig = imagefigure(Node(da))
+    [artist] = fig.artists.values()
+    bbox = artist.bbox(xscale='linear', yscale='linear')
+    artist.update(da * 3.3)
+    assert artist.bbox(xscale='linear', yscale='linear') == bbox
+    assert artist.bbox(xscale='log', yscale='linear').xmin > 0
+
+
+@pytest.mark.parametrize('transpose', [False, True])
+def test_mesh_colors_with_2d_coord_match_repeated_data(transpose):
+    da = data_array(ndim=2, ragged=True, masks=True)
+    if transpose:
+        da = da.transpose()
+    fig = imagefigure(Node(da))
+    [artist] = fig.artists.values()
+    for values in (da, da * 2.5):
+        artist.update(values)
+        expected = fig.view.colormapper.rgba(artist.data).reshape(-1, 4)
+        assert np.array_equal(artist._mesh.get_facecolors(), expected)
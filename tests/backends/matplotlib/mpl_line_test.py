@@ -88,6 +88,22 @@ def test_line_update():
     assert np.allclose(line._line.get_ydata(), da.values * 2.5)
 
 
+@pytest.mark.parametrize('binedges', [False, True])
+def test_line_update_adds_and_removes_masks(binedges):
+    da = data_array(ndim=1, binedges=binedges)
+    line = Line(canvas=Canvas(), data=da)
+    assert not line._mask.get_visible()
+    masked = data_array(ndim=1, binedges=binedges, masks=True)
+    line.update(masked)
+    assert line._mask.get_visible()
+    assert len(line._mask.get_xdata()) == len(line._line.get_xdata())
+    expected = masked.data[masked.masks['mask']].values
+    y = line._mask.get_ydata()
+    assert np.allclose(np.unique(y[~np.isnan(y)]), np.unique(expected))
+    line.update(da)
+    assert not line._mask.get_visible()
+
+
 def test_line_update_with_errorbars():
     da = data_array(ndim=1, variances=True)
     line = Line(canvas=Canvas(), data=da)
@@ -211,3 +227,21 @@ def test_kwarg_zorder_binedges_errorbars():
     assert line._line.get_zorder() == 14
     for artist in line._error.get_children():
         assert artist.get_zorder() == 14
+
+
+def test_line_bbox_with_two_masks_reuses_buffers():
+    da = data_array(ndim=1)
+    da.masks['low'] = da.coords['xx'] < sc.scalar(10.0, unit='m')
+    da.masks['high'] = da.coords['xx'] > sc.scalar(30.0, unit='m')
+    line = Line(canvas=Canvas(), data=da)
+    bbox = line.bbox(xscale='linear', yscale='linear')
+    visible = da.data[~(da.masks['low'] | da.masks['high'])]
+    vmin = visible.min().value
+    vmax = visible.max().value
+    pad = 0.05 * (vmax - vmin)
+    assert np.isclose(bbox.ymin, vmin - pad)
+    assert np.isclose(bbox.ymax, vmax + pad)
+    buffer = line._bbox_buffers['y']['mask']
+    line.update(da * 2.0)
+    line.bbox(xscale='linear', yscale='linear')
+    assert line._bbox_buffers['y']['mask'] is buffer
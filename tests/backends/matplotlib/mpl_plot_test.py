@@ -202,3 +202,50 @@ def test_aspect_ratio():
     da = data_array(ndim=2)
     fig = da.plot(aspect='equal')
     assert fig.canvas.ax.get_aspect() == 1.0
+
+
+def test_format_coord_1d():
+    da = data_array(ndim=1)
+    fig = da.plot()
+    assert fig.canvas.format_coord(1.5, 2.25) == '(1.5 m, 2.25 m/s)'
+
+
+@pytest.mark.parametrize('linspace', [True, False])
+def test_format_coord_2d(linspace):
+    da = data_array(ndim=2, linspace=linspace)
+    fig = da.plot()
+    out = fig.canvas.format_coord(1.5, 2.25)
+    assert out.startswith('(xx=1.5 m, yy=2.25 m)')
+
+
+def test_autoscale_does_not_reset_unchanged_limits():
+    da = data_array(ndim=1)
+    fig = da.plot()
+    changes = []
+    fig.canvas.ax.callbacks.connect('xlim_changed', changes.append)
+    fig.canvas.ax.callbacks.connect('ylim_changed', changes.append)
+    [key] = fig.artists.keys()
+    fig.update({key: da})
+    fig.view.autoscale()
+    assert not changes
+    fig.update({key: da * 2.5})
+    fig.view.autoscale()
+    assert len(changes) == 1
+
+
+def test_autoscale_sets_all_ranges_in_one_call(monkeypatch):
+    da = data_array(ndim=1)
+    fig = da.plot()
+    calls = []
+    set_ranges = fig.canvas.set_ranges
+    monkeypatch.setattr(
+        fig.canvas,
+        'set_ranges',
+        lambda **kwargs: calls.append(kwargs) or set_ranges(**kwargs),
+    )
+    [key] = fig.artists.keys()
+    fig.update({key: da.assign_coords(xx=da.coords['xx'] * 2.0) * 2.5})
+    fig.view.autoscale()
+    assert len(calls) == 1
+    assert set(calls[0]) == {'xrange', 'yrange'}
+    assert fig.canvas.xrange == calls[0]['xrange']
@@ -4,11 +4,14 @@
 import numpy as np
 import pytest
 import scipp as sc
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 import plopp as pp
+from plopp import Node
 from plopp.backends.matplotlib.canvas import Canvas
 from plopp.backends.matplotlib.scatter import Scatter
 from plopp.data.testing import scatter as scatter_data
+from plopp.graphics.colormapper import ColorMapper
 
 pytestmark = pytest.mark.usefixtures("_parametrize_mpl_backends")
 
@@ -21,7 +24,7 @@ def test_scatter_creation():
     x, y = scat._scatter.get_offsets().T
     assert np.allclose(x, da.coords['x'].values)
     assert np.allclose(y, da.coords['y'].values)
-    assert not scat._mask.get_visible()
+    assert scat._mask is None
 
 
 def test_scatter_with_mask():
@@ -31,8 +34,41 @@ def test_scatter_with_mask():
     assert scat._mask.get_visible()
     expected = da[da.masks['mask']]
     x, y = scat._mask.get_offsets().T
-    assert np.allclose(x[~np.isnan(x)], expected.coords['x'].values)
-    assert np.allclose(y[~np.isnan(y)], expected.coords['y'].values)
+    assert np.allclose(x, expected.coords['x'].values)
+    assert np.allclose(y, expected.coords['y'].values)
+
+
+def test_scatter_update_adds_and_removes_mask():
+    da = scatter_data()
+    scat = Scatter(canvas=Canvas(), data=da)
+    assert scat._mask is None
+    masked = da.copy()
+    masked.masks['mask'] = masked.coords['x'] > sc.scalar(5, unit='m')
+    scat.update(masked)
+    assert scat._mask is not None
+    expected = masked[masked.masks['mask']]
+    x, y = scat._mask.get_offsets().T
+    assert np.allclose(x, expected.coords['x'].values)
+    assert np.allclose(y, expected.coords['y'].values)
+    scat.update(da)
+    assert scat._mask is None
+
+
+def test_scatter_mask_only_holds_masked_points_and_sizes():
+    da = scatter_data()
+    da.coords['s'] = sc.arange('row', float(len(da)))
+    da.masks['mask'] = da.coords['x'] > sc.scalar(5, unit='m')
+    scat = Scatter(canvas=Canvas(), data=da, size='s')
+    expected = da[da.masks['mask']]
+    assert len(scat._mask.get_offsets()) == len(expected)
+    assert np.array_equal(scat._mask.get_sizes(), expected.coords['s'].values)
+
+
+def test_scatter_with_scalar_mask():
+    da = scatter_data()
+    da.masks['mask'] = sc.scalar(True)
+    scat = Scatter(canvas=Canvas(), data=da)
+    assert len(scat._mask.get_offsets()) == len(da)
 
 
 def test_scatter_update():
@@ -78,3 +114,149 @@ def test_scatter_has_legend_for_multiple_artists():
     assert texts[0].get_text() == 'a'
     assert texts[1].get_text() == 'b'
     assert texts[2].get_text() == 'c'
+
+
+def test_scatter_added_to_figure_with_fixed_limits_is_colored():
+    a = Node(scatter_data(npoints=20, seed=1))
+    fig = pp.scatterfigure(a, cbar=True, vmin=0, vmax=1)
+    b = Node(scatter_data(npoints=20, seed=2))
+    b.add_view(fig.view)
+    b.notify_children('new node')
+    for artist in fig.artists.values():
+        assert len(artist._scatter.get_facecolors()) == 20
+
+
+def test_scatter_colors_follow_in_place_data_changes():
+    da = scatter_data()
+    node = Node(lambda: da)
+    fig = pp.scatterfigure(node, cbar=True, vmin=0.0, vmax=50.0)
+    [artist] = fig.artists.values()
+    before = artist._scatter.get_facecolors().copy()
+    da.values = da.values[::-1].copy()
+    node.notify_children('values changed in place')
+    assert not np.array_equal(artist._scatter.get_facecolors(), before)
+
+
+def test_scatter_colors_follow_colormap_changes():
+    da = scatter_data()
+    fig = pp.scatterfigure(Node(da), cbar=True)
+    [artist] = fig.artists.values()
+    before = artist._scatter.get_facecolors().copy()
+    fig.view.colormapper.cmap = ColorMapper(cmap='magma').cmap
+    fig.view.colormapper.notify_artists()
+    assert not np.array_equal(artist._scatter.get_facecolors(), before)
+
+
+def test_scatter_colors_follow_in_place_colormap_changes():
+    da = scatter_data()
+    vmax = da.data.mean()
+    fig = pp.scatterfigure(Node(da), cbar=True, vmax=vmax)
+    [artist] = fig.artists.values()
+    fig.view.colormapper.cmap.set_over('red')
+    fig.view.colormapper.notify_artists()
+    over = (da.data > vmax).values
+    assert np.all(artist._scatter.get_facecolors()[over] == [1.0, 0.0, 0.0, 1.0])
+
+
+def test_scatter_update_uses_blitting(monkeypatch):
+    da = scatter_data()
+    canvas = Canvas()
+    FigureCanvasAgg(canvas.fig)
+    monkeypatch.setattr(canvas, 'can_blit', lambda: True)
+    scat = Scatter(canvas=canvas, data=da)
+    canvas.draw()
+    assert canvas._background is None
+    new = da.copy()
+    new.coords['y'] *= 2.3
+    scat.update(new)
+    assert canvas._background is not None
+    assert canvas._blitted
+    canvas.draw()
+    assert not canvas._blitted
+    # Changing the axes limits invalidates the background
+    canvas.yrange = (-1.0, 1.0)
+    assert canvas._background is None
+
+
+def _blitting_canvas(monkeypatch):
+    canvas = Canvas()
+    FigureCanvasAgg(canvas.fig)
+    monkeypatch.setattr(canvas, 'can_blit', lambda: True)
+    return canvas
+
+
+def test_scatter_blitting_several_artists_matches_full_draw(monkeypatch):
+    canvas = _blitting_canvas(monkeypatch)
+    a = scatter_data(seed=1)
+    b = scatter_data(seed=2)
+    scat_a = Scatter(canvas=canvas, data=a, color='red')
+    scat_b = Scatter(canvas=canvas, data=b, color='blue')
+    canvas.xrange = (-60.0, 60.0)
+    canvas.yrange = (-60.0, 60.0)
+    canvas.fig.canvas.draw()
+    new_a = a.copy()
+    new_a.coords['y'] *= 0.5
+    new_b = b.copy()
+    new_b.coords['x'] *= 0.5
+    scat_a.update(new_a)
+    scat_b.update(new_b)
+    blitted = np.array(canvas.fig.canvas.buffer_rgba())
+    canvas.fig.canvas.draw()
+    assert np.array_equal(blitted, np.array(canvas.fig.canvas.buffer_rgba()))
+
+
+def test_draw_after_blit_is_not_skipped_if_other_artists_changed(monkeypatch):
+    canvas = _blitting_canvas(monkeypatch)
+    da = scatter_data()
+    scat = Scatter(canvas=canvas, data=da)
+    [line] = canvas.ax.plot([0.0, 1.0], [0.0, 1.0])
+    canvas.fig.canvas.draw()
+    calls = []
+    monkeypatch.setattr(canvas.fig.canvas, 'draw_idle', lambda: calls.append(1))
+    scat.update(da.copy())
+    canvas.draw()
+    assert not calls
+    scat.update(da.copy())
+    line.set_ydata([1.0, 0.0])
+    canvas.draw()
+    assert len(calls) == 1
+
+
+def test_scatter_update_no_blitting_with_static_backend():
+    da = scatter_data()
+    canvas = Canvas()
+    scat = Scatter(canvas=canvas, data=da)
+    scat.update(da.copy())
+    assert canvas._background is None
+    assert not canvas._blitted
+
+
+def test_scatter_update_with_different_number_of_points():
+    da = scatter_data()
+    scat = Scatter(canvas=Canvas(), data=da)
+    scat.update(da.copy())
+    new = da[:10].copy()
+    scat.update(new)
+    x, y = scat._scatter.get_offsets().T
+    assert np.allclose(x, new.coords['x'].values)
+    assert np.allclose(y, new.coords['y'].values)
+
+
+def test_scatter_colors_not_recomputed_if_unchanged(monkeypatch):
+    da = scatter_data()
+    canvas = Canvas(cbar=True)
+    mapper = ColorMapper(canvas=canvas)
+    scat = Scatter(canvas=canvas, data=da, colormapper=mapper, cbar=True)
+    mapper.autoscale()
+    calls = []
+    rgba = mapper.rgba
+    monkeypatch.setattr(
+        mapper, 'rgba', lambda data, **kwargs: calls.append(1) or rgba(data, **kwargs)
+    )
+    scat.notify_artist('colormap changed')
+    assert not calls
+    mapper.cmax = mapper.cmax * 2
+    mapper.autoscale()
+    assert len(calls) == 1
+    scat.update(da.copy())
+    assert len(calls) == 2
@@ -21,7 +21,7 @@ def test_line_creation():
     assert np.allclose(line._line.x, da.coords['xx'].values)
     assert np.allclose(line._line.y, da.values)
     assert line._error is None
-    assert not line._mask.visible
+    assert line._mask is None
 
 
 def test_line_creation_bin_edges():
@@ -30,6 +30,26 @@ def test_line_creation_bin_edges():
     assert len(line._line.x) == da.sizes['xx'] + 1
 
 
+@pytest.mark.parametrize('binedges', [False, True])
+def test_line_style_not_modified_by_mask_style(binedges):
+    da = data_array(ndim=1, binedges=binedges, masks=True)
+    marker = {'symbol': 3, 'line': {'width': 1}}
+    line = Line(canvas=Canvas(), data=da, marker=marker, color='red', width=2)
+    assert line._line.line.color == 'red'
+    assert line._line.line.width == 2
+    assert line._line.marker.line.width == 1
+    assert line._mask.line.width == 10
+    assert line._mask.marker.line.width == 3
+    assert marker == {'symbol': 3, 'line': {'width': 1}}
+
+
+@pytest.mark.parametrize('style', [{'colour': 'red'}, {'width': 'thick'}])
+def test_line_invalid_style_raises(style):
+    da = data_array(ndim=1)
+    with pytest.raises(ValueError, match='Invalid'):
+        Line(canvas=Canvas(), data=da, **style)
+
+
 def test_line_with_errorbars():
     da = data_array(ndim=1, variances=True)
     line = Line(canvas=Canvas(), data=da)
@@ -69,6 +89,21 @@ def test_line_with_two_masks():
     assert np.allclose(y[~np.isnan(y)], expected)
 
 
+@pytest.mark.parametrize('binedges', [False, True])
+def test_line_traces_order(binedges):
+    da = data_array(ndim=1, variances=True, binedges=binedges, masks=True)
+    canvas = Canvas()
+    line = Line(canvas=canvas, data=da)
+    expected = (
+        [line._mask, line._line, line._error]
+        if binedges
+        else [line._line, line._error, line._mask]
+    )
+    assert len(canvas.fig.data) == len(expected)
+    assert all(a is b for a, b in zip(canvas.fig.data, expected, strict=True))
+    assert set(map(id, line._traces)) == set(map(id, canvas.fig.data))
+
+
 def test_line_update():
     da = data_array(ndim=1)
     line = Line(canvas=Canvas(), data=da)
@@ -79,6 +114,28 @@ def test_line_update():
     assert np.allclose(line._line.y, da.values * 2.5)
 
 
+@pytest.mark.parametrize('binedges', [False, True])
+def test_line_update_adds_masks(binedges):
+    da = data_array(ndim=1, binedges=binedges)
+    canvas = Canvas()
+    line = Line(canvas=canvas, data=da)
+    assert line._mask is None
+    assert len(canvas.fig.data) == 1
+    masked = data_array(ndim=1, binedges=binedges, masks=True)
+    line.update(masked)
+    assert line._mask.visible
+    expected = masked.data[masked.masks['mask']].values
+    y = line._mask.y
+    assert np.allclose(np.unique(y[~np.isnan(y)]), np.unique(expected))
+    # With lines, the mask is placed below the line
+    expected_order = [line._mask, line._line] if binedges else [line._line, line._mask]
+    assert all(a is b for a, b in zip(canvas.fig.data, expected_order, strict=True))
+    line.update(da)
+    assert not line._mask.visible
+    line.remove()
+    assert len(canvas.fig.data) == 0
+
+
 def test_line_update_with_errorbars():
     da = data_array(ndim=1, variances=True)
     line = Line(canvas=Canvas(), data=da)
@@ -111,3 +168,22 @@ def test_line_datetime_binedges_with_errorbars():
     line = Line(canvas=Canvas(), data=da)
     # Note that allclose does not work on datetime dtypes
     assert np.allclose(line._error.x.astype(int), expected.astype(int))
+
+
+def test_line_remove_only_removes_own_traces():
+    canvas = Canvas()
+    da = data_array(ndim=1, variances=True)
+    lines = [Line(canvas=canvas, data=da, artist_number=i) for i in range(3)]
+    canvas.fig.add_scatter(x=[1, 2], y=[3, 4])
+    lines[1].remove()
+    assert len(canvas.fig.data) == 5
+    removed = set(map(id, lines[1]._traces))
+    assert not any(id(trace) in removed for trace in canvas.fig.data)
+
+
+def test_line_color():
+    line = Line(canvas=Canvas(), data=data_array(ndim=1), color='red')
+    assert line.color == 'red'
+    line.color = 'blue'
+    assert line.color == 'blue'
+    assert line._line.line.color == 'blue'
@@ -8,14 +8,16 @@ import scipp as sc
 from plopp.backends.pythreejs.canvas import Canvas
 from plopp.backends.pythreejs.scatter3d import Scatter3d
 from plopp.data.testing import scatter
+from plopp.graphics.colormapper import ColorMapper
 
 
 def test_creation():
     da = scatter()
     scat = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z')
     assert sc.identical(scat._data, da)
-    assert np.allclose(
-        scat.geometry.attributes['position'].array, da.coords['position'].values
+    assert np.array_equal(
+        scat.geometry.attributes['position'].array,
+        da.coords['position'].values.astype('float32'),
     )
 
 
@@ -28,6 +30,55 @@ def test_update():
     assert sc.identical(scat._data, da * 2.5)
 
 
+def test_update_sends_colors_only_if_changed():
+    da = scatter()
+    mapper = ColorMapper()
+    scat = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z', colormapper=mapper)
+    mapper.autoscale()
+    colors = scat.geometry.attributes['color'].array
+    scat.update(da.copy())
+    assert scat.geometry.attributes['color'].array is colors
+    scat.update(da * 0.5)
+    assert scat.geometry.attributes['color'].array is not colors
+
+
+def test_update_with_nan_positions_keeps_geometry():
+    da = scatter()
+    da.coords['x'].values[3] = np.nan
+    scat = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z')
+    geometry = scat.geometry
+    scat.update(da.copy())
+    assert scat.geometry is geometry
+
+
+def test_opacity_sends_a_single_message():
+    scat = Scatter3d(canvas=Canvas(), data=scatter(), x='x', y='y', z='z')
+    messages = []
+    scat.material.send_state = lambda key=None: messages.append(key)
+    scat.opacity = 0.3
+    assert len(messages) == 1
+    assert scat.material.opacity == 0.3
+    assert not scat.material.depthTest
+
+
+def test_update_with_new_positions():
+    da = scatter()
+    scat = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z')
+    bbox = scat.bbox(xscale='linear', yscale='linear', zscale='linear')
+    subset = da[:100].copy()
+    subset.coords['x'] *= 2.0
+    scat.update(subset)
+    assert scat.points.geometry is scat.geometry
+    assert np.allclose(
+        scat.geometry.attributes['position'].array,
+        subset.coords['position'].values * [2.0, 1.0, 1.0],
+    )
+    assert scat.geometry.attributes['color'].array.shape == (100, 3)
+    new_bbox = scat.bbox(xscale='linear', yscale='linear', zscale='linear')
+    assert new_bbox != bbox
+    assert new_bbox.xmax == subset.coords['x'].max().value + 0.5
+
+
 def test_bounding_box():
     da = scatter()
     pix = 0.5
@@ -46,6 +97,17 @@ def test_bounding_box():
     )
 
 
+def test_bounding_box_unchanged_after_update():
+    da = scatter()
+    scat = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z')
+    bbox = scat.bbox(xscale='linear', yscale='linear', zscale='linear')
+    scat.update(da * 2.5)
+    assert scat.bbox(xscale='linear', yscale='linear', zscale='linear') == bbox
+    # The returned bounding box is a copy that can be modified by the caller
+    bbox.xmin = -1000.0
+    assert scat.bbox(xscale='linear', yscale='linear', zscale='linear') != bbox
+
+
 def test_get_limits_flat_panel():
     da = scatter()
     da.coords['z'] *= 0.0
@@ -65,46 +127,52 @@ def test_get_limits_flat_panel():
     )
 
 
-def test_pixel_size():
+@pytest.fixture(scope='module')
+def reference_size():
     """
     We make a reference points cloud because additional factors are potentially added to
     the size, depending on the device pixel ratio. Making a reference with a default
     size of 1 makes it easier to test.
     """
+    return Scatter3d(
+        canvas=Canvas(), data=scatter(), x='x', y='y', z='z', size=1
+    ).material.size
+
+
+def test_pixel_size(reference_size):
     da = scatter()
-    reference = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z', size=1)
     scat = Scatter3d(
         canvas=Canvas(), data=da, x='x', y='y', z='z', size=sc.scalar(2, unit='m')
     )
-    assert scat.material.size == 2.0 * reference.material.size
+    assert scat.material.size == 2.0 * reference_size
 
 
-def test_pixel_size_unit_conversion():
+def test_pixel_size_unit_conversion(reference_size):
     da = scatter()
-    reference = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z', size=1)
     scat = Scatter3d(
         canvas=Canvas(), data=da, x='x', y='y', z='z', size=sc.scalar(350, unit='cm')
     )
-    assert scat.material.size == 3.5 * reference.material.size
+    assert scat.material.size == 3.5 * reference_size
     with pytest.raises(sc.UnitError):
         Scatter3d(
             canvas=Canvas(), data=da, x='x', y='y', z='z', size=sc.scalar(350, unit='s')
         )
 
 
-def test_pixel_size_cannot_have_units_when_spatial_dimensions_have_different_units():
+def test_pixel_size_cannot_have_units_when_spatial_dimensions_have_different_units(
+    reference_size,
+):
     da = scatter()
     new_x = da.coords['x'].copy()
     new_x.unit = 's'
     da.coords['x'] = new_x
-    reference = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z', size=1)
     with pytest.raises(ValueError, match='The supplied size has unit'):
         Scatter3d(
             canvas=Canvas(), data=da, x='x', y='y', z='z', size=sc.scalar(2.5, unit='m')
         )
     # Ok if no unit supplied
     scat = Scatter3d(canvas=Canvas(), data=da, x='x', y='y', z='z', size=2.5)
-    assert scat.material.size == 2.5 * reference.material.size
+    assert scat.material.size == 2.5 * reference_size
 
 
 def test_creation_raises_when_data_is_not_1d():
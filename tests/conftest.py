@@ -4,6 +4,11 @@
 from importlib import util
 
 import matplotlib
+
+# Select the non-interactive backend before pyplot and plopp are imported, so that
+# Matplotlib never probes for a GUI backend while the test modules are collected.
+matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import pytest
 
@@ -24,8 +29,7 @@ def _close_figures():
     Otherwise, the figures consume a lot of memory and matplotlib complains.
     """
     yield
-    for fig in map(plt.figure, plt.get_fignums()):
-        plt.close(fig)
+    plt.close('all')
 
 
 @pytest.fixture
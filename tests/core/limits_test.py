@@ -5,7 +5,7 @@ import numpy as np
 import pytest
 import scipp as sc
 
-from plopp.core.limits import find_limits, fix_empty_range
+from plopp.core.limits import find_limits, find_numeric_limits, fix_empty_range
 
 
 def test_find_limits():
@@ -150,3 +150,37 @@ def test_fix_empty_range_zeros_values():
     lims = fix_empty_range((a, a))
     assert sc.identical(lims[0], sc.scalar(-0.5, unit='m'))
     assert sc.identical(lims[1], sc.scalar(0.5, unit='m'))
+
+
+@pytest.mark.parametrize('scale', ['linear', 'log'])
+@pytest.mark.parametrize('pad', [False, True])
+def test_find_numeric_limits_matches_find_limits(scale, pad):
+    x = sc.array(dims=['x'], values=[-2.0, 3.0, np.nan, 0.5, np.inf, 12.0])
+    da = sc.DataArray(
+        data=x, masks={'m': sc.array(dims=['x'], values=[False] * 5 + [True])}
+    )
+    expected = fix_empty_range(find_limits(da, scale=scale, pad=pad))
+    lims = find_numeric_limits(
+        da.values, scale=scale, pad=pad, mask=da.masks['m'].values
+    )
+    assert np.allclose(lims, [expected[0].value, expected[1].value])
+
+
+def test_find_numeric_limits_unsupported_returns_none():
+    assert find_numeric_limits(np.array(['a', 'b'])) is None
+    assert find_numeric_limits(np.array([np.nan, np.inf])) is None
+    assert find_numeric_limits(np.array([-1.0, 0.0]), scale='log') is None
+
+
+@pytest.mark.parametrize('scale', ['linear', 'log'])
+def test_find_numeric_limits_multiple_arrays(scale):
+    y = np.array([1.0, 5.0, 3.0, 8.0])
+    e = np.array([0.5, 2.0, 3.5, 1.0])
+    mask = np.array([False, False, False, True])
+    lims = find_numeric_limits((y - e, y + e), scale=scale, pad=True, mask=mask)
+    da = sc.DataArray(
+        data=sc.array(dims=['x'], values=np.concatenate([y - e, y + e])),
+        masks={'m': sc.array(dims=['x'], values=np.concatenate([mask, mask]))},
+    )
+    expected = fix_empty_range(find_limits(da, scale=scale, pad=True))
+    assert np.allclose(lims, [expected[0].value, expected[1].value])
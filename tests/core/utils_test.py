@@ -4,7 +4,12 @@
 import numpy as np
 import scipp as sc
 
-from plopp.core.utils import coord_as_bin_edges, coord_element_to_string
+from plopp.core.utils import (
+    coord_as_bin_edges,
+    coord_element_to_string,
+    merge_mask_values,
+    merge_masks,
+)
 
 
 def test_coord_as_bin_edges_midpoints_input():
@@ -83,3 +88,44 @@ def test_coord_element_to_string_datetime():
         coord_element_to_string(datetime)
         == '2021-06-01T17:00:00:2021-06-01T18:00:00 [s]'
     )
+
+
+def test_merge_masks_does_not_modify_inputs():
+    a = sc.array(dims=['x'], values=[True, False, False])
+    b = sc.array(dims=['x'], values=[False, True, False])
+    c = sc.array(dims=['x'], values=[False, False, False])
+    masks = {'a': a, 'b': b, 'c': c}
+    originals = {key: m.copy() for key, m in masks.items()}
+    result = merge_masks(masks)
+    assert sc.identical(result, sc.array(dims=['x'], values=[True, True, False]))
+    for key, m in masks.items():
+        assert sc.identical(m, originals[key])
+
+
+def test_merge_masks_broadcasts_dims():
+    x = sc.array(dims=['x'], values=[True, False])
+    y = sc.array(dims=['y'], values=[False, False, True])
+    xy = sc.zeros(sizes={'x': 2, 'y': 3}, dtype=bool)
+    result = merge_masks({'x': x, 'y': y, 'xy': xy})
+    expected = x | y
+    assert sc.identical(result, expected)
+    assert not xy.values.any()
+
+
+def test_merge_mask_values():
+    x = sc.array(dims=['x'], values=[True, False])
+    y = sc.array(dims=['y'], values=[False, False, True])
+    yx = sc.array(dims=['y', 'x'], values=[[False, True]] * 3)
+    sizes = {'x': 2, 'y': 3}
+    out = np.empty((2, 3), dtype=bool)
+    result = merge_mask_values({'x': x, 'y': y, 'yx': yx}, sizes=sizes, out=out)
+    assert result is out
+    expected = (x | y | yx).transpose(['x', 'y'])
+    assert np.array_equal(result, expected.values)
+    assert not yx.values[0, 0]
+
+
+def test_merge_mask_values_single_mask_is_broadcast():
+    x = sc.array(dims=['x'], values=[True, False])
+    result = merge_mask_values({'x': x}, sizes={'y': 3, 'x': 2})
+    assert np.array_equal(result, [[True, False]] * 3)
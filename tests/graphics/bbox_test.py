@@ -0,0 +1,18 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+
+from plopp.graphics.bbox import BoundingBox
+
+
+def test_union():
+    a = BoundingBox(xmin=0.0, xmax=2.0, ymin=-1.0, ymax=1.0)
+    b = BoundingBox(xmin=-1.0, xmax=1.0, ymin=0.0, ymax=3.0)
+    c = BoundingBox(xmin=0.5, xmax=5.0, ymin=-0.5, ymax=0.5)
+    assert a.union(b, c) == BoundingBox(xmin=-1.0, xmax=5.0, ymin=-1.0, ymax=3.0)
+
+
+def test_union_ignores_none_bounds():
+    a = BoundingBox(xmin=0.0, xmax=2.0, ymax=1.0)
+    b = BoundingBox(xmin=1.0, ymin=0.0, zmin=3.0)
+    assert a.union(b) == BoundingBox(xmin=0.0, xmax=2.0, ymin=0.0, ymax=1.0, zmin=3.0)
+    assert BoundingBox().union() == BoundingBox()
@@ -2,7 +2,6 @@
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
 from dataclasses import dataclass
-from difflib import SequenceMatcher
 from functools import partial
 
 import numpy as np
@@ -11,14 +10,11 @@ import scipp as sc
 from matplotlib.colors import LogNorm, Normalize
 
 from plopp import Node, imagefigure, scatter3dfigure
+from plopp.core.limits import find_limits, fix_empty_range
 from plopp.data.testing import data_array, scatter
 from plopp.graphics.colormapper import ColorMapper
 
 
-def string_similarity(a, b):
-    return SequenceMatcher(None, a, b).ratio()
-
-
 class DummyChild:
     def __init__(self, data, colormapper):
         self._data = data
@@ -40,6 +36,13 @@ class DummyChild:
         return self._data
 
 
+def mapper_with_artist(da, **kwargs):
+    mapper = ColorMapper(**kwargs)
+    artist = DummyChild(data=da, colormapper=mapper)
+    mapper.add_artist('data', artist)
+    return mapper, artist
+
+
 def test_creation():
     mapper = ColorMapper(
         cmap='magma',
@@ -63,81 +66,197 @@ def test_logc():
 
 def test_autoscale():
     da = data_array(ndim=2, unit='K')
-    mapper = ColorMapper()
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    vmin = da.min().value
+    vmax = da.max().value
+    mapper, artist = mapper_with_artist(da)
 
     mapper.autoscale()
-    assert mapper.vmin == da.min().value
-    assert mapper.vmax == da.max().value
+    assert mapper.vmin == vmin
+    assert mapper.vmax == vmax
 
     # Limits grow
     const = 2.3
     artist.update(da * const)
     mapper.autoscale()
-    assert mapper.vmin == (da.min() * const).value
-    assert mapper.vmax == (da.max() * const).value
+    assert mapper.vmin == vmin * const
+    assert mapper.vmax == vmax * const
 
     # Limits shrink
     const = 0.5
     artist.update(da * const)
     mapper.autoscale()
-    assert mapper.vmin == da.min().value * const
-    assert mapper.vmax == da.max().value * const
+    assert mapper.vmin == vmin * const
+    assert mapper.vmax == vmax * const
 
 
 def test_update_without_autoscale_does_not_change_limits():
     da = data_array(ndim=2, unit='K')
-    mapper = ColorMapper()
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    vmin = da.min().value
+    vmax = da.max().value
+    mapper, artist = mapper_with_artist(da)
 
     mapper.autoscale()
-    assert mapper.vmin == da.min().value
-    assert mapper.vmax == da.max().value
+    assert mapper.vmin == vmin
+    assert mapper.vmax == vmax
 
     backup = mapper.vmin, mapper.vmax
 
     # Limits grow
     const = 2.3
     artist.update(da * const)
-    assert mapper.vmin != (da.min() * const).value
+    assert mapper.vmin != vmin * const
     assert mapper.vmin == backup[0]
-    assert mapper.vmax != (da.max() * const).value
+    assert mapper.vmax != vmax * const
     assert mapper.vmax == backup[1]
 
     # Limits shrink
     const = 0.5
     artist.update(da * const)
-    assert mapper.vmin != da.min().value * const
+    assert mapper.vmin != vmin * const
     assert mapper.vmin == backup[0]
-    assert mapper.vmax != da.max().value * const
+    assert mapper.vmax != vmax * const
     assert mapper.vmax == backup[1]
 
 
-def test_correct_normalizer_limits():
-    da = sc.DataArray(data=sc.array(dims=['y', 'x'], values=[[1, 2], [3, 4]]))
+@pytest.mark.parametrize('logc', [False, True])
+@pytest.mark.parametrize(
+    'data',
+    [
+        data_array(ndim=2, unit='K', masks=True),
+        data_array(ndim=2, unit='K').to(dtype='int64'),
+        data_array(ndim=2, unit='K') * 0.0,
+        data_array(ndim=2, unit='K') - sc.scalar(1000.0, unit='K'),
+    ],
+)
+def test_autoscale_limits_match_find_limits(logc, data):
+    mapper = ColorMapper(logc=logc)
+    mapper.add_artist('a', DummyChild(data=data, colormapper=mapper))
+    mapper.autoscale()
+    lo, hi = fix_empty_range(find_limits(data, scale='log' if logc else 'linear'))
+    assert mapper.cmin == lo.value
+    assert mapper.cmax == hi.value
+
+
+def test_autoscale_only_scans_updated_artists(monkeypatch):
+    scanned = []
+    find_limits = ColorMapper._find_limits
+
+    def recording_find_limits(self, x, scale):
+        scanned.append(x)
+        return find_limits(self, x, scale)
+
+    monkeypatch.setattr(ColorMapper, '_find_limits', recording_find_limits)
+    da1 = data_array(ndim=2, unit='K')
+    da2 = data_array(ndim=2, unit='K') * 2.0
+    mapper = ColorMapper()
+    artist1 = DummyChild(data=da1, colormapper=mapper)
+    artist2 = DummyChild(data=da2, colormapper=mapper)
+    mapper.add_artist('a', artist1)
+    mapper.add_artist('b', artist2)
+    mapper.autoscale()
+    assert len(scanned) == 2
+    artist1.update(da1 * 3.0)
+    mapper.autoscale()
+    assert len(scanned) == 3
+    assert scanned[-1] is artist1._data
+    assert mapper.cmax == (da1 * 3.0).max().value
+    # Data modified in place needs to be invalidated
+    artist2._data.values *= 10.0
+    mapper.invalidate_limits('b')
+    mapper.autoscale()
+    assert len(scanned) == 4
+    assert mapper.cmax == da2.max().value
+    # Changing the norm scans all artists again
+    mapper.toggle_norm()
+    assert len(scanned) == 6
+
+
+def test_artists_notified_only_if_color_mapping_changed():
+    da = data_array(ndim=2, unit='K')
     mapper = ColorMapper()
+    artists = {
+        key: DummyChild(data=da * factor, colormapper=mapper)
+        for key, factor in (('a', 1.0), ('b', 2.0))
+    }
+    notified = []
+    for key, artist in artists.items():
+        mapper.add_artist(key, artist)
+        artist.notify_artist = lambda _, key=key: notified.append(key)
+    mapper.autoscale()
+    assert notified == ['a', 'b']
+    # The range of the data is unchanged
+    artists['a'].update(da * 1.5)
+    mapper.autoscale()
+    assert notified == ['a', 'b']
+    # The range of the data has increased
+    artists['a'].update(da * 3.0)
+    mapper.autoscale()
+    assert notified == ['a', 'b', 'a', 'b']
+    mapper.toggle_norm()
+    assert notified == ['a', 'b', 'a', 'b', 'a', 'b']
+
+
+def test_artist_added_with_unchanged_limits_is_notified():
+    da = data_array(ndim=2, unit='K')
+    mapper = ColorMapper(vmin=0.0, vmax=1.0)
+    notified = []
+    for key in ('a', 'b'):
+        artist = DummyChild(data=da, colormapper=mapper)
+        artist.notify_artist = lambda _, key=key: notified.append(key)
+        mapper.add_artist(key, artist)
+        mapper.autoscale()
+    assert notified == ['a', 'b']
+    mapper.autoscale()
+    assert notified == ['a', 'b']
+
+
+def test_artists_notified_after_in_place_colormap_change():
+    da = data_array(ndim=2, unit='K')
+    mapper = ColorMapper(vmin=0.0, vmax=1.0)
+    notified = []
     artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    artist.notify_artist = lambda _: notified.append('a')
+    mapper.add_artist('a', artist)
     mapper.autoscale()
-    assert mapper.vmin == da.min().value
-    assert mapper.vmax == da.max().value
+    mapper.cmap.set_under('green')
+    mapper.autoscale()
+    assert notified == ['a', 'a']
+
+
+def test_update_autoscale_and_toggle_norm_do_not_print(capsys):
+    da = data_array(ndim=2, unit='K')
+    a = Node(da)
+    fig = imagefigure(a)
+    a.func = lambda: da * 3.0
+    a.notify_children('updated a')
+    fig.view.colormapper.toggle_norm()
+    fig.view.colormapper.autoscale()
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert captured.err == ''
+
+
+def test_correct_normalizer_limits():
+    da = sc.DataArray(data=sc.array(dims=['y', 'x'], values=[[1, 2], [3, 4]]))
+    vmin = da.min().value
+    vmax = da.max().value
+    mapper, _ = mapper_with_artist(da)
+    mapper.autoscale()
+    assert mapper.vmin == vmin
+    assert mapper.vmax == vmax
     # The normalizer initially has limits [0, 1].
     # In Matplotlib, if we set the normalizer vmin value (1) equal to the current vmax,
     # it will silently set it to something smaller, e.g. 0.9.
     # Our implementation needs to work around this.
-    assert mapper.normalizer.vmin == da.min().value
-    assert mapper.normalizer.vmax == da.max().value
+    assert mapper.normalizer.vmin == vmin
+    assert mapper.normalizer.vmax == vmax
 
 
 def test_cmin_cmax():
     da = data_array(ndim=2, unit='K') * 100.0
     cmin = sc.scalar(-0.12, unit='K')
     cmax = sc.scalar(3.56, unit='K')
-    mapper = ColorMapper(cmin=cmin, cmax=cmax)
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    mapper, _ = mapper_with_artist(da, cmin=cmin, cmax=cmax)
     mapper.unit = 'K'
     mapper.autoscale()
     assert mapper.cmin == cmin.value
@@ -148,9 +267,7 @@ def test_vmin_vmax():
     da = data_array(ndim=2, unit='K') * 100.0
     vmin = sc.scalar(-0.1, unit='K')
     vmax = sc.scalar(3.5, unit='K')
-    mapper = ColorMapper(vmin=vmin, vmax=vmax)
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    mapper, _ = mapper_with_artist(da, vmin=vmin, vmax=vmax)
     mapper.unit = 'K'
     mapper.autoscale()
     assert mapper.vmin == vmin.value
@@ -161,9 +278,7 @@ def test_cmin_cmax_no_variable():
     da = data_array(ndim=2, unit='K') * 100.0
     cmin = -0.12
     cmax = 3.56
-    mapper = ColorMapper(cmin=cmin, cmax=cmax)
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    mapper, _ = mapper_with_artist(da, cmin=cmin, cmax=cmax)
     mapper.unit = 'K'
     mapper.autoscale()
     assert mapper.cmin == cmin
@@ -174,9 +289,7 @@ def test_vmin_vmax_no_variable():
     da = data_array(ndim=2, unit='K') * 100.0
     vmin = -0.1
     vmax = 3.5
-    mapper = ColorMapper(vmin=vmin, vmax=vmax)
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    mapper, _ = mapper_with_artist(da, vmin=vmin, vmax=vmax)
     mapper.unit = 'K'
     mapper.autoscale()
     assert mapper.vmin == vmin
@@ -186,35 +299,75 @@ def test_vmin_vmax_no_variable():
 def test_toggle_norm():
     mapper = ColorMapper()
     da = data_array(ndim=2, unit='K')
+    vmin = da.min().value
+    vmax = da.max().value
     mapper.add_artist('child1', DummyChild(data=da, colormapper=mapper))
     mapper.autoscale()
     assert mapper.norm == 'linear'
     assert isinstance(mapper.normalizer, Normalize)
-    assert mapper.vmin == da.min().value
-    assert mapper.vmax == da.max().value
+    assert mapper.vmin == vmin
+    assert mapper.vmax == vmax
 
     mapper.toggle_norm()
     assert mapper.norm == 'log'
     assert isinstance(mapper.normalizer, LogNorm)
     assert mapper.vmin > 0
-    assert mapper.vmax == da.max().value
+    assert mapper.vmax == vmax
+
+
+def test_toggle_norm_twice_reuses_normalizer():
+    mapper = ColorMapper()
+    da = data_array(ndim=2, unit='K')
+    vmin = da.min().value
+    vmax = da.max().value
+    mapper.add_artist('child1', DummyChild(data=da, colormapper=mapper))
+    mapper.autoscale()
+    linear = mapper.normalizer
+    expected = mapper.rgba(da)
+    mapper.toggle_norm()
+    mapper.toggle_norm()
+    assert mapper.normalizer is linear
+    assert mapper.vmin == vmin
+    assert mapper.vmax == vmax
+    assert np.array_equal(mapper.rgba(da), expected)
 
 
 def test_update_changes_limits():
     da = data_array(ndim=2, unit='K')
-    mapper = ColorMapper()
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    vmin = da.min().value
+    vmax = da.max().value
+    mapper, artist = mapper_with_artist(da)
 
     mapper.autoscale()
-    assert mapper.normalizer.vmin == da.min().value
-    assert mapper.normalizer.vmax == da.max().value
+    assert mapper.normalizer.vmin == vmin
+    assert mapper.normalizer.vmax == vmax
 
     const = 2.3
     artist.update(da * const)
     mapper.autoscale()
-    assert mapper.normalizer.vmin == (da.min() * const).value
-    assert mapper.normalizer.vmax == (da.max() * const).value
+    assert mapper.normalizer.vmin == vmin * const
+    assert mapper.normalizer.vmax == vmax * const
+
+
+def test_colormaps_from_the_same_name_are_independent():
+    a = ColorMapper(cmap='magma', nan_color='red')
+    b = ColorMapper(cmap='magma')
+    assert a.cmap is not b.cmap
+    assert np.allclose(a.cmap.get_bad(), [1, 0, 0, 1])
+    assert not np.allclose(b.cmap.get_bad(), [1, 0, 0, 1])
+    a.cmap.set_over('blue')
+    assert np.allclose(ColorMapper(cmap='magma').cmap.get_over(), b.cmap.get_over())
+
+
+def test_single_color_colormaps_are_independent():
+    a = ColorMapper(cmap='red', mask_color='blue')
+    b = ColorMapper(cmap='red', mask_color='green')
+    da = data_array(ndim=2, unit='K', masks=True)
+    colors = a.rgba(da).reshape(-1, 4)
+    assert np.array_equal(np.unique(colors, axis=0), [[0, 0, 1, 1], [1, 0, 0, 1]])
+    a.cmap.set_bad('black')
+    assert np.allclose(b.cmap.get_bad(), [1, 0, 0, 1])
+    assert np.allclose(b.mask_cmap.get_bad(), [0, 128 / 255, 0, 1])
 
 
 def test_rgba():
@@ -224,45 +377,194 @@ def test_rgba():
     assert colors.shape == (*da.data.shape, 4)
 
 
+@pytest.mark.parametrize('logc', [False, True])
+@pytest.mark.parametrize('dtype', ['float64', 'float32', 'int64'])
+def test_rgba_matches_matplotlib_colormap(logc, dtype):
+    da = data_array(ndim=2, unit='K')
+    da.data = (da.data * 100).to(dtype=dtype)
+    if dtype != 'int64':
+        da.values[0, :3] = [np.nan, np.inf, -np.inf]
+    mapper = ColorMapper(logc=logc, cmin=5.0, cmax=50.0, nan_color='red')
+    mapper.autoscale()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        expected = mapper.cmap(mapper.normalizer(da.values))
+    assert np.array_equal(mapper.rgba(da), expected)
+
+
+@pytest.mark.parametrize('fraction', [0.0, 0.1, 0.5, 1.0])
+@pytest.mark.parametrize('mask_cmap', ['gray', 'tab10'])
+def test_rgba_masked_colors_match_matplotlib_colormap(fraction, mask_cmap):
+    da = data_array(ndim=2, unit='K')
+    rng = np.random.default_rng(seed=12)
+    da.masks['m'] = sc.array(dims=da.dims, values=rng.random(da.shape) < fraction)
+    mapper = ColorMapper(mask_cmap=mask_cmap, cmin=5.0, cmax=50.0)
+    mapper.autoscale()
+    normalized = mapper.normalizer(da.values)
+    expected = np.where(
+        da.masks['m'].values[..., None],
+        mapper.mask_cmap(normalized),
+        mapper.cmap(normalized),
+    )
+    assert np.array_equal(mapper.rgba(da), expected)
+    assert np.array_equal(mapper.rgba(da, key='a'), expected)
+
+
+def test_rgba_uses_new_colormap_when_replaced():
+    da = data_array(ndim=2, unit='K')
+    mapper = ColorMapper()
+    colors = mapper.rgba(da)
+    mapper.cmap = ColorMapper(cmap='magma').cmap
+    assert not np.array_equal(mapper.rgba(da), colors)
+    assert np.array_equal(mapper.rgba(da), mapper.cmap(mapper.normalizer(da.values)))
+
+
+@pytest.mark.parametrize('rgb', [False, True])
+def test_rgba_follows_in_place_changes_to_colormap_extremes(rgb):
+    da = sc.DataArray(data=sc.array(dims=['x'], values=[np.nan, 0.5, 2.0]))
+    mapper = ColorMapper(vmin=0.0, vmax=1.0)
+    mapper.autoscale()
+    to_colors = mapper.rgb if rgb else mapper.rgba
+    to_colors(da)
+    mapper.cmap.set_bad('red')
+    mapper.cmap.set_over('blue')
+    colors = to_colors(da)
+    assert np.array_equal(colors[0, :3], [1.0, 0.0, 0.0])
+    assert np.array_equal(colors[2, :3], [0.0, 0.0, 1.0])
+
+
+def test_rgba_log_non_positive_values_use_nan_color():
+    da = sc.DataArray(data=sc.array(dims=['x'], values=[-1.0, 0.0, 10.0, 100.0]))
+    mapper = ColorMapper(logc=True, cmin=1.0, cmax=1000.0, nan_color='red')
+    mapper.autoscale()
+    colors = mapper.rgba(da)
+    assert np.array_equal(colors[:2], [[1.0, 0.0, 0.0, 1.0]] * 2)
+    assert np.array_equal(colors[2:], mapper.cmap([1 / 3, 2 / 3]))
+
+
+def test_rgb_matches_rgba():
+    da = data_array(ndim=2, unit='K', masks=True)
+    mapper = ColorMapper()
+    colors = mapper.rgb(da)
+    assert colors.dtype == np.float32
+    assert colors.shape == (*da.data.shape, 3)
+    assert np.array_equal(colors, mapper.rgba(da)[..., :3].astype('float32'))
+
+
+@pytest.mark.parametrize('logc', [False, True])
+def test_rgba_with_key_reuses_output_array(logc):
+    da = data_array(ndim=2, unit='K', masks=True)
+    mapper = ColorMapper(logc=logc)
+    mapper.add_artist('a', DummyChild(data=da, colormapper=mapper))
+    mapper.autoscale()
+    first = mapper.rgba(da, key='a')
+    assert np.array_equal(first, mapper.rgba(da))
+    expected = mapper.rgba(da * 0.5)
+    second = mapper.rgba(da * 0.5, key='a')
+    assert second is first
+    assert np.array_equal(second, expected)
+    mapper.remove_artist('a')
+    assert 'a' not in mapper._color_buffers
+
+
 def test_rgba_with_masks():
     da1 = data_array(ndim=2, unit='K')
     da2 = data_array(ndim=2, unit='K', masks=True)
     mapper = ColorMapper()
-    assert not np.allclose(mapper.rgba(da1), mapper.rgba(da2))
+    colors1 = mapper.rgba(da1)
+    colors2 = mapper.rgba(da2)
+    # Only the colors of the masked pixels change
+    mask = da2.masks['mask'].values
+    assert (colors1[mask] != colors2[mask]).any()
+    assert np.array_equal(colors1[~mask], colors2[~mask])
 
 
-def test_colorbar_updated_on_rescale():
+def test_rgba_with_masks_does_not_keep_a_buffer_per_shape():
+    mapper = ColorMapper()
+    for n in range(5, 10):
+        da = data_array(ndim=2, unit='K', masks=True)['xx', :n].copy()
+        da.masks['other'] = ~da.masks['mask']
+        mapper.rgba(da)
+        mapper.rgba(da, key='a')
+    assert len(mapper._mask_buffers) == 1
+    assert np.array_equal(
+        mapper.rgba(da), mapper.mask_cmap(mapper.normalizer(da.values))
+    )
+
+
+def test_rgba_with_masks_of_different_dims():
     da = data_array(ndim=2, unit='K')
+    ydim, xdim = da.dims
+    da.masks['x'] = da.coords[xdim] > sc.scalar(30.0, unit='m')
+    da.masks['y'] = da.coords[ydim] < sc.scalar(10.0, unit='m')
+    da.masks['xy'] = (da.data > sc.scalar(0.9, unit='K')).transpose([xdim, ydim])
     mapper = ColorMapper()
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    mapper.autoscale = lambda: None
+    expected = mapper.cmap(mapper.normalizer(da.values))
+    one_mask = (da.masks['x'] | da.masks['y'] | da.masks['xy']).transpose(da.dims)
+    expected[one_mask.values] = mapper.mask_cmap(
+        mapper.normalizer(da.values[one_mask.values])
+    )
+    assert np.array_equal(mapper.rgba(da), expected)
+    # The masks are not modified
+    assert not da.masks['y'].values[-1]
+
+
+def test_colorbar_updated_on_rescale():
+    da = data_array(ndim=2, unit='K')
+    mapper, artist = mapper_with_artist(da)
 
     mapper.autoscale()
     _ = mapper.to_widget()
     old_image = mapper.widget.value
-    old_image_array = old_image
 
     # Update with the same values should not make a new colorbar image
     artist.update(da)
     mapper.autoscale()
-    assert string_similarity(old_image_array, mapper.widget.value) > 0.9
+    assert mapper.widget.value == old_image
 
     # Update with a smaller range should make a new colorbar image
     artist.update(da * 0.6)
     mapper.autoscale()
-    assert string_similarity(old_image_array, mapper.widget.value) < 0.9
+    assert mapper.widget.value != old_image
 
     # Update with larger range should make a new colorbar image
     artist.update(da * 3.1)
     mapper.autoscale()
-    assert string_similarity(old_image_array, mapper.widget.value) < 0.9
+    assert mapper.widget.value != old_image
+
+
+def test_colorbar_image_not_rendered_again_if_unchanged(monkeypatch):
+    import plopp.graphics.colormapper as colormapper_module
+
+    renders = []
+    fig_to_bytes = colormapper_module.fig_to_bytes
+
+    def counting_fig_to_bytes(*args, **kwargs):
+        renders.append(True)
+        return fig_to_bytes(*args, **kwargs)
+
+    monkeypatch.setattr(colormapper_module, 'fig_to_bytes', counting_fig_to_bytes)
+    da = data_array(ndim=2, unit='K')
+    mapper, artist = mapper_with_artist(da)
+    mapper.autoscale()
+    mapper.to_widget()
+    assert len(renders) == 1
+    mapper.autoscale()
+    mapper.apply_limits()
+    assert len(renders) == 1
+    artist.update(da * 2.0)
+    mapper.autoscale()
+    assert len(renders) == 2
+    mapper.toggle_norm()
+    assert len(renders) == 3
+    mapper.clabel = 'New label'
+    mapper.apply_limits()
+    assert len(renders) == 4
 
 
 def test_colorbar_does_not_update_if_no_autoscale():
     da = data_array(ndim=2, unit='K')
-    mapper = ColorMapper()
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    mapper, artist = mapper_with_artist(da)
 
     mapper.autoscale()
     _ = mapper.to_widget()
@@ -299,9 +601,7 @@ def test_colorbar_cbar_false_overrides_cax():
 
 def test_autoscale_vmin_set():
     da = data_array(ndim=2, unit='K')
-    mapper = ColorMapper(vmin=-0.5)
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    mapper, artist = mapper_with_artist(da, vmin=-0.5)
     mapper.autoscale()
     assert mapper.vmin == -0.5
     assert mapper.vmax == da.max().value
@@ -314,9 +614,7 @@ def test_autoscale_vmin_set():
 
 def test_autoscale_vmax_set():
     da = data_array(ndim=2, unit='K')
-    mapper = ColorMapper(vmax=0.5)
-    artist = DummyChild(data=da, colormapper=mapper)
-    mapper.add_artist('data', artist)
+    mapper, artist = mapper_with_artist(da, vmax=0.5)
     mapper.autoscale()
     assert mapper.vmax == 0.5
     assert mapper.vmin == da.min().value
@@ -141,3 +141,18 @@ def test_raises_for_new_data_with_incompatible_coordinate(
     b.coords['t'] = b.coords.pop('x')
     with pytest.raises(KeyError):
         figure(Node(a), Node(b))
+
+
+def test_batch_draws_once():
+    a = data1d()
+    fig = linefigure(Node(a))
+    draws = []
+    fig.canvas.draw = lambda: draws.append(1)
+    with fig.view.batch():
+        fig.view.update(b=a * 2.0)
+        fig.view.update(c=a * 3.0)
+        fig.view.remove('b')
+        assert not draws
+    assert len(draws) == 1
+    assert set(fig.artists) == {*fig.view.graph_nodes, 'c'}
+    assert fig.canvas.yrange[1] > (a * 3.0).max().value
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
+import numpy as np
 import pytest
 import scipp as sc
 
@@ -112,3 +113,36 @@ def test_kwargs_propagation():
     # Log norm is applied to the 2D figure
     assert fig1d.canvas.yscale == "linear"
     assert fig2d.view.colormapper.norm == "log"
+
+
+@pytest.mark.usefixtures('_use_ipympl')
+def test_line_values_match_slice():
+    da = pp.data.data3d()
+    ip = pp.inspector(da, operation='max')
+    fig2d = ip[0][0]
+    fig1d = ip[0][1]
+    fig2d.toolbar['inspect'].value = True
+    fig2d.toolbar['inspect']._tool.click(10, 15)
+    [line] = fig1d.artists.values()
+    dims = fig2d.canvas.dims
+    units = fig2d.canvas.units
+    expected = da[dims['y'], sc.scalar(15.0, unit=units['y'])][
+        dims['x'], sc.scalar(10.0, unit=units['x'])
+    ]
+    assert np.allclose(line._line.get_ydata(), expected.values)
+
+
+@pytest.mark.usefixtures('_use_ipympl')
+def test_with_bin_edges_coords():
+    da = pp.data.data3d()
+    xdim, ydim, zdim = da.dims
+    edges = {
+        d: sc.linspace(d, 0.0, 1.0, da.sizes[d] + 1, unit=da.coords[d].unit)
+        for d in (xdim, ydim)
+    }
+    da = da.assign_coords(edges)
+    ip = pp.inspector(da, dim=zdim)
+    fig2d = ip[0][0]
+    bbox = fig2d.view.bbox
+    assert (bbox.xmin, bbox.xmax) == (0.0, 1.0)
+    assert (bbox.ymin, bbox.ymax) == (0.0, 1.0)
@@ -1,9 +1,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
-import os
-import tempfile
-
 import numpy as np
 import pytest
 import scipp as sc
@@ -72,13 +69,14 @@ def test_raises_ValueError_when_given_ax_kwarg():
 
 
 def test_scatter3d_from_xarray():
-    import xarray as xr
+    xr = pytest.importorskip('xarray')
+    rng = np.random.default_rng(seed=12)
 
     N = 200
-    data = np.random.random(N)
-    x = np.random.normal(size=N)
-    y = np.random.normal(size=N)
-    z = np.random.normal(size=N)
+    data = rng.random(N)
+    x = rng.normal(size=N)
+    y = rng.normal(size=N)
+    z = rng.normal(size=N)
     da = xr.DataArray(
         data,
         coords={'x': ('pixel', x), 'y': ('pixel', y), 'z': ('pixel', z)},
@@ -114,12 +112,11 @@ def test_scatter3d_mixing_raw_data_and_nodes():
     pp.scatter3d({'a': pp.Node(a), 'b': b})
 
 
-def test_save_to_html():
+def test_save_to_html(tmp_path):
     fig = pp.scatter3d(scatter())
-    with tempfile.TemporaryDirectory() as path:
-        fname = os.path.join(path, 'plopp_fig3d.html')
-        fig.save(filename=fname)
-        assert os.path.isfile(fname)
+    fname = tmp_path / 'plopp_fig3d.html'
+    fig.save(filename=str(fname))
+    assert fname.is_file()
 
 
 def test_save_to_html_with_bad_extension_raises():
@@ -93,6 +93,31 @@ def test_scatter_flattens_2d_data():
     pp.scatter(data_array(ndim=2), x='xx', y='yy', cbar=True)
 
 
+def test_preprocess_scatter_keeps_masks_and_does_not_modify_input():
+    from plopp.plotting.scatter import _preprocess_scatter
+
+    a = scatter_data()
+    out = _preprocess_scatter(a, x='x', y='y', pos=None, size=None)
+    assert not out.masks
+    assert set(out.coords) == {'x', 'y'}
+    a.masks['m'] = a.coords['x'] > sc.scalar(10, unit='m')
+    out = _preprocess_scatter(a, x='x', y='y', pos=None, size=None)
+    assert sc.identical(out.masks['m'], a.masks['m'])
+    out.coords['x'] = out.coords['x'] * 2.0
+    assert not sc.identical(out.coords['x'], a.coords['x'])
+    assert set(a.coords) == {'position', 'x', 'y', 'z'}
+
+
+def test_preprocess_scatter_flattens_to_a_new_dim():
+    from plopp.plotting.scatter import _preprocess_scatter
+
+    da = data_array(ndim=2)
+    out = _preprocess_scatter(da, x='xx', y='yy', pos=None, size=None)
+    assert out.ndim == 1
+    assert out.dim not in da.dims
+    assert out.sizes[out.dim] == da.size
+
+
 def test_scatter_with_norm():
     a = scatter_data()
     scat = pp.scatter(a, cbar=True, norm='linear')
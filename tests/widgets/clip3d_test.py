@@ -1,12 +1,22 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 
+import asyncio
+import threading
+
+import numpy as np
+import pytest
 import scipp as sc
 
 from plopp import Node
 from plopp.data.testing import data_array, scatter
 from plopp.graphics import scatter3dfigure
-from plopp.widgets import ClippingPlanes
+from plopp.widgets import ClippingPlanes, clip3d
+from plopp.widgets.clip3d import _merge_ranges, _prune_ranges
+
+
+def last_artist(fig):
+    return next(reversed(fig.artists.values()))
 
 
 def test_add_remove_cuts():
@@ -16,25 +26,25 @@ def test_add_remove_cuts():
     assert len(fig.artists) == 1
     clip.add_x_cut.click()
     assert len(fig.artists) == 2
-    npoints_in_cutx = list(fig.artists.values())[-1]._data.shape[0]
+    npoints_in_cutx = last_artist(fig)._data.shape[0]
     clip.add_y_cut.click()
     assert len(fig.artists) == 2
-    npoints_in_cutxy = list(fig.artists.values())[-1]._data.shape[0]
+    npoints_in_cutxy = last_artist(fig)._data.shape[0]
     assert npoints_in_cutxy > npoints_in_cutx
     clip.add_z_cut.click()
     assert len(fig.artists) == 2
-    npoints_in_cutxyz = list(fig.artists.values())[-1]._data.shape[0]
+    npoints_in_cutxyz = last_artist(fig)._data.shape[0]
     assert npoints_in_cutxyz > npoints_in_cutxy
     clip.delete_cut.click()
     # If the tool is not displayed, the tab selected index does not update when a cut
     # is deleted, so we need to manually set it to the correct value
     clip.tabs.selected_index = 1
-    assert list(fig.artists.values())[-1]._data.shape[0] == npoints_in_cutxy
+    assert last_artist(fig)._data.shape[0] == npoints_in_cutxy
     clip.delete_cut.click()
     # If the tool is not displayed, the tab selected index does not update when a cut
     # is deleted, so we need to manually set it to the correct value
     clip.tabs.selected_index = 0
-    assert list(fig.artists.values())[-1]._data.shape[0] == npoints_in_cutx
+    assert last_artist(fig)._data.shape[0] == npoints_in_cutx
     clip.delete_cut.click()
     assert len(fig.artists) == 1
 
@@ -47,13 +57,13 @@ def test_move_cut():
     xcut = clip.cuts[-1]
     assert xcut.outlines[0].position[0] == xcut.slider.value[0]
     assert xcut.outlines[1].position[0] == xcut.slider.value[1]
-    pts = list(fig.artists.values())[-1]
+    pts = last_artist(fig)
     npoints = pts._data.shape[0]
     xcut.slider.value = [xcut.slider.min, xcut.slider.value[1]]
     assert xcut.outlines[0].position[0] == xcut.slider.value[0]
     assert xcut.outlines[1].position[0] == xcut.slider.value[1]
     clip.update_state()  # Need to manually update state due to debounce mechanism
-    new_pts = list(fig.artists.values())[-1]
+    new_pts = last_artist(fig)
     assert npoints < new_pts._data.shape[0]
 
 
@@ -165,3 +175,402 @@ def test_operation_xor():
         (xsel | ysel | zsel) & ~(xsel & ysel) & ~(xsel & zsel) & ~(ysel & zsel)
     ].flatten(to=dim)
     assert sc.identical(expected, data_in_xyzcut)
+
+
+def test_move_cut_reuses_coordinates():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    xcut = clip.cuts[-1]
+    node_id = clip._original_nodes[0].id
+    coord = clip._coords[node_id]['values']['x']
+    xcut.slider.value = [xcut.slider.min, xcut.slider.value[1]]
+    clip.update_state()
+    assert clip._coords[node_id]['values']['x'] is coord
+
+
+def test_cut_on_strided_data_stores_contiguous_coordinates():
+    da = scatter()
+    da = da[da.dim, ::2]
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    node_id = clip._original_nodes[0].id
+    assert clip._coords[node_id]['values']['x'].flags['C_CONTIGUOUS']
+    xmin, xmax = clip.cuts[-1].range
+    x = da.coords['x']
+    expected = da[(x >= xmin) & (x < xmax)]
+    assert sc.identical(last_artist(fig)._data, expected)
+
+
+def test_cut_follows_new_data_in_original_node():
+    da = scatter()
+    node = Node(da)
+    fig = scatter3dfigure(node, x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    xmin, xmax = clip.cuts[-1].range
+    shifted = da.copy()
+    shifted.coords['x'] += xmin - shifted.coords['x'].min()
+    node.func = lambda: shifted
+    node.notify_children('new data')
+    clip.update_state()
+    x = shifted.coords['x']
+    expected = shifted[(x >= xmin) & (x < xmax)]
+    assert sc.identical(list(clip._nodes.values())[-1]['slice'](), expected)
+
+
+@pytest.mark.parametrize('operation', ['OR', 'AND', 'XOR'])
+@pytest.mark.parametrize(
+    'ranges', [[(0.1, 0.4), (0.3, 0.6)], [(0.1, 0.2), (0.5, 0.6)], [(0.1, 0.6)] * 2]
+)
+def test_cuts_along_the_same_dimension(operation, ranges):
+    dim = 'pix'
+    da = data_array(ndim=3).flatten(to=dim)
+    fig = scatter3dfigure(Node(da), x='xx', y='yy', z='zz', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.cut_operation.value = operation
+    selections = []
+    x = da.coords['xx']
+    for start, end in ranges:
+        clip.add_x_cut.click()
+        xcut = clip.cuts[-1]
+        xmin = xcut.slider.min + start * (xcut.slider.max - xcut.slider.min)
+        xmax = xcut.slider.min + end * (xcut.slider.max - xcut.slider.min)
+        xcut.slider.value = [xmin, xmax]
+        xmin, xmax = xcut.slider.value
+        selections.append(
+            (x >= sc.scalar(xmin, unit='m')) & (x < sc.scalar(xmax, unit='m'))
+        )
+    clip.update_state()
+    a, b = selections
+    expected = {'OR': a | b, 'AND': a & b, 'XOR': a ^ b}[operation]
+    if expected.values.any():
+        data_in_cuts = list(clip._nodes.values())[-1]['slice']()
+        assert sc.identical(data_in_cuts, da[expected])
+    else:
+        assert not clip._nodes
+
+
+def test_merge_ranges():
+    ranges = [('x', 3.0, 4.0), ('y', 0.0, 1.0), ('x', 0.0, 2.0), ('x', 1.0, 3.0)]
+    assert _merge_ranges(ranges, 'or') == [('x', 0.0, 4.0), ('y', 0.0, 1.0)]
+    assert _merge_ranges(ranges, 'and') == [('x', 3.0, 2.0), ('y', 0.0, 1.0)]
+    assert _merge_ranges(ranges, 'xor') == ranges
+    disjoint = [('x', 2.0, 3.0), ('x', 0.0, 1.0)]
+    assert _merge_ranges(disjoint, 'or') == [('x', 0.0, 1.0), ('x', 2.0, 3.0)]
+
+
+@pytest.mark.parametrize('operation', ['or', 'and', 'xor'])
+@pytest.mark.parametrize('chunk_size', [7, 100, 1000])
+def test_select_points_in_chunks(monkeypatch, operation, chunk_size):
+    monkeypatch.setattr(clip3d, '_CHUNK_SIZE', chunk_size)
+    rng = np.random.default_rng(seed=3)
+    x, y = rng.random(500), rng.random(500)
+    ranges = [('x', 0.1, 0.5), ('y', 0.3, 0.9), ('x', 0.4, 0.7)]
+    sel = [
+        (c >= lo) & (c < hi) for c, (_, lo, hi) in zip([x, y, x], ranges, strict=True)
+    ]
+    expected = {
+        'or': sel[0] | sel[1] | sel[2],
+        'and': sel[0] & sel[1] & sel[2],
+        'xor': np.sum(sel, axis=0) == 1,
+    }[operation]
+    selected = clip3d._select_points([x, y, x], ranges, operation, buffers={})
+    assert np.array_equal(selected, expected)
+
+
+@pytest.mark.parametrize('operation', ['or', 'and', 'xor'])
+def test_select_sorted_points(monkeypatch, operation):
+    monkeypatch.setattr(clip3d, '_SORTED_FRACTION', 2.0)
+    rng = np.random.default_rng(seed=4)
+    x, y = rng.random(500), rng.random(500)
+    x[::10] = np.nan
+    ranges = [('x', 0.1, 0.5), ('y', 0.3, 0.9), ('x', 0.4, 0.7)]
+    coords = [x, y, x]
+    sorted_coords = [(np.sort(c), np.argsort(c)) for c in coords]
+    expected = clip3d._select_points(coords, ranges, operation, buffers={})
+    selected = clip3d._select_sorted_points(
+        sorted_coords, ranges, operation, buffers={}
+    )
+    assert np.array_equal(selected, expected)
+
+
+def test_select_sorted_points_gives_up_on_large_ranges():
+    x = np.linspace(0.0, 1.0, 100)
+    sorted_coords = [(x, np.arange(100))]
+    assert (
+        clip3d._select_sorted_points(sorted_coords, [('x', 0.0, 0.5)], 'or', {}) is None
+    )
+    selected = clip3d._select_sorted_points(sorted_coords, [('x', 0.2, 0.25)], 'or', {})
+    assert np.array_equal(selected, (x >= 0.2) & (x < 0.25))
+
+
+def test_update_state_does_nothing_if_cuts_unchanged():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    cut_data = last_artist(fig)._data
+    clip.update_state()
+    assert last_artist(fig)._data is cut_data
+    xcut = clip.cuts[-1]
+    xcut.slider.value = [xcut.slider.min, xcut.slider.value[1]]
+    clip.update_state()
+    assert last_artist(fig)._data is not cut_data
+
+
+def test_move_cut_keeps_cut_nodes_and_artist():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    nodes = dict(list(clip._nodes.values())[-1])
+    artist = last_artist(fig)
+    xcut = clip.cuts[-1]
+    xcut.slider.value = [xcut.slider.min, xcut.slider.value[1]]
+    clip.update_state()
+    assert list(clip._nodes.values())[-1] == nodes
+    assert last_artist(fig) is artist
+    xmin, xmax = xcut.range
+    x = da.coords['x']
+    expected = da[(x >= xmin) & (x < xmax)]
+    assert sc.identical(artist._data, expected)
+    assert artist.geometry.attributes['position'].array.shape == (
+        expected.shape[0],
+        3,
+    )
+
+
+def test_each_cut_node_keeps_its_own_selection():
+    a = scatter()
+    b = scatter(npoints=300, seed=2)
+    fig = scatter3dfigure(Node(a), Node(b), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    xcut = clip.cuts[-1]
+    xcut.slider.value = [xcut.slider.min, xcut.slider.value[1]]
+    clip.update_state()
+    for n in clip._original_nodes:
+        select = clip._nodes[n.id]['select']
+        assert select.func().shape == n().shape
+
+
+def test_prune_ranges():
+    extents = {'x': (0.0, 10.0), 'y': (0.0, np.nan)}
+    full = ('x', 0.0, 11.0)
+    part = ('x', 2.0, 5.0)
+    empty = ('x', 5.0, 5.0)
+    assert _prune_ranges([part, full], extents, 'or') == (True, [])
+    assert _prune_ranges([part, empty], extents, 'or') == (None, [part])
+    assert _prune_ranges([empty], extents, 'or') == (False, [])
+    assert _prune_ranges([part, full], extents, 'and') == (None, [part])
+    assert _prune_ranges([full], extents, 'and') == (True, [])
+    assert _prune_ranges([part, empty], extents, 'and') == (False, [])
+    assert _prune_ranges([part, full, empty], extents, 'xor') == (None, [part, full])
+    # The max of the coordinate must be strictly inside the range
+    assert _prune_ranges([('x', 0.0, 10.0)], extents, 'or') == (
+        None,
+        [('x', 0.0, 10.0)],
+    )
+    # Coordinates with NaNs are never covered
+    nan_range = ('y', -1.0, 100.0)
+    assert _prune_ranges([nan_range], extents, 'or') == (None, [nan_range])
+
+
+def test_cut_covering_all_points_selects_everything():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    xcut = clip.cuts[-1]
+    xcut.slider.value = [xcut.slider.min, xcut.slider.max]
+    clip.update_state()
+    assert sc.identical(last_artist(fig)._data, da)
+
+
+def test_move_one_end_of_cut_only_moves_one_outline():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_y_cut.click()
+    ycut = clip.cuts[-1]
+    messages = []
+    ycut.outlines[1].send_state = lambda key=None: messages.append(key)
+    position = ycut.outlines[1].position
+    ycut.slider.value = [ycut.slider.min, ycut.slider.value[1]]
+    assert ycut.outlines[0].position[1] == ycut.slider.min
+    assert ycut.outlines[1].position == position
+    assert not messages
+
+
+def test_cuts_share_throttled_update():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    clip.add_y_cut.click()
+    xcut, ycut = clip.cuts
+    assert xcut._throttled_update == ycut._throttled_update
+    other = ClippingPlanes(scatter3dfigure(Node(da), x='x', y='y', z='z'))
+    other.add_x_cut.click()
+    assert other.cuts[0]._throttled_update != xcut._throttled_update
+
+
+def test_move_cut_computes_selection_in_background():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    artist = last_artist(fig)
+    xcut = clip.cuts[-1]
+
+    async def main():
+        xcut.slider.value = [xcut.slider.min, xcut.slider.value[1]]
+        # The selection is being computed in the worker thread
+        assert clip._computing
+        while clip._computing:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    xmin, xmax = xcut.range
+    x = da.coords['x']
+    assert sc.identical(artist._data, da[(x >= xmin) & (x < xmax)])
+
+
+def test_background_worker_does_not_touch_coordinate_caches(monkeypatch):
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    xcut = clip.cuts[-1]
+    threads = set()
+    coord = ClippingPlanes._coord
+
+    def recording_coord(self, *args, **kwargs):
+        threads.add(threading.current_thread())
+        return coord(self, *args, **kwargs)
+
+    monkeypatch.setattr(ClippingPlanes, '_coord', recording_coord)
+
+    async def main():
+        xcut.slider.value = [xcut.slider.min, xcut.slider.value[1]]
+        while clip._computing:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    assert threads == {threading.main_thread()}
+
+
+def test_cut_outlines_share_geometry():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_z_cut.click()
+    first, second = clip.cuts[-1].outlines
+    assert first.geometry is second.geometry
+    corners = first.geometry.attributes['position'].array
+    bbox = fig.view.bbox
+    assert np.allclose(
+        np.ptp(corners, axis=0), [bbox.xmax - bbox.xmin, bbox.ymax - bbox.ymin, 0]
+    )
+
+
+def test_add_several_cuts_at_once():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_cuts(['x', 'y', 'z'])
+    assert [cut._direction for cut in clip.cuts] == ['x', 'y', 'z']
+    assert list(clip.tabs.children) == clip.cuts
+    assert clip.tabs.selected_index == 2
+    for cut in clip.cuts:
+        for outline in cut.outlines:
+            assert outline in fig.canvas.scene.children
+    expected = ClippingPlanes(scatter3dfigure(Node(da), x='x', y='y', z='z'))
+    for direction in 'xyz':
+        expected._add_cut(direction)
+    assert sc.identical(
+        last_artist(fig)._data,
+        list(expected._view.artists.values())[-1]._data,
+    )
+
+
+def test_cuts_share_outline_geometry_and_material():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_cuts(['x', 'x', 'z'])
+    xcut1, xcut2, zcut = (cut.outlines[0] for cut in clip.cuts)
+    assert xcut1.geometry is xcut2.geometry
+    assert xcut1.material is xcut2.material is zcut.material
+
+
+def test_add_and_remove_cut_update_tabs_in_one_message():
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    messages = []
+    clip.tabs.send_state = lambda key=None: messages.append(key)
+    clip.add_x_cut.click()
+    clip.add_y_cut.click()
+    assert len(messages) == 2
+    clip.delete_cut.click()
+    assert len(messages) == 3
+
+
+def test_cut_on_sorted_coordinate_slices_the_data():
+    da = scatter()
+    da = da[np.argsort(da.coords['x'].values)]
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    selection = clip._nodes[clip._original_nodes[0].id]['select']()
+    assert isinstance(selection, tuple)
+    xmin, xmax = clip.cuts[-1].range
+    x = da.coords['x']
+    expected = da[(x >= xmin) & (x < xmax)]
+    assert sc.identical(last_artist(fig)._data, expected)
+    # With a second cut, the selection is a mask
+    clip.add_y_cut.click()
+    selection = clip._nodes[clip._original_nodes[0].id]['select']()
+    assert isinstance(selection, sc.Variable)
+
+
+def test_move_cut_shows_preview_then_full_point_cloud(monkeypatch):
+    monkeypatch.setattr(clip3d, '_PREVIEW_MAX_POINTS', 10)
+    da = scatter()
+    fig = scatter3dfigure(Node(da), x='x', y='y', z='z', cbar=True)
+    clip = ClippingPlanes(fig)
+    clip.add_x_cut.click()
+    artist = last_artist(fig)
+    xcut = clip.cuts[-1]
+
+    async def main():
+        xcut.slider.value = [xcut.slider.min, xcut.slider.value[1]]
+        while clip._computing:
+            await asyncio.sleep(0.01)
+        assert artist._data.shape[0] <= 10
+        await asyncio.sleep(0.5)
+
+    asyncio.run(main())
+    xmin, xmax = xcut.range
+    x = da.coords['x']
+    assert sc.identical(artist._data, da[(x >= xmin) & (x < xmax)])
+
+
+def test_thin_selection():
+    mask = sc.array(dims=['x'], values=np.arange(100) % 3 == 0)
+    thinned = clip3d._thin_selection(mask.copy(), max_points=10)
+    assert thinned.values.sum() == 9
+    assert np.array_equal(np.flatnonzero(thinned.values), np.arange(0, 100, 12))
+    assert clip3d._thin_selection(mask.copy(), max_points=50).values.sum() == 34
+    assert clip3d._thin_selection(('x', slice(5, 45)), max_points=10) == (
+        'x',
+        slice(5, 45, 4),
+    )
+    assert clip3d._thin_selection(('x', slice(5, 45)), max_points=40) == (
+        'x',
+        slice(5, 45),
+    )
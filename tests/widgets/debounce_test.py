@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+
+import asyncio
+
+from plopp.widgets.debounce import debounce, throttle
+
+
+def test_throttle_executes_first_call_right_away():
+    calls = []
+
+    @throttle(0.05)
+    def f(x):
+        calls.append(x)
+
+    async def main():
+        f(1)
+        assert calls == [1]
+
+    asyncio.run(main())
+
+
+def test_throttle_executes_last_call_after_wait():
+    calls = []
+
+    @throttle(0.05)
+    def f(x):
+        calls.append(x)
+
+    async def main():
+        f(1)
+        f(2)
+        f(3)
+        assert calls == [1]
+        await asyncio.sleep(0.1)
+        assert calls == [1, 3]
+        await asyncio.sleep(0.1)
+        f(4)
+        assert calls == [1, 3, 4]
+
+    asyncio.run(main())
+
+
+def test_debounce_executes_last_call_after_wait():
+    calls = []
+
+    @debounce(0.05)
+    def f(x, y=0):
+        calls.append(x + y)
+
+    async def main():
+        f(1)
+        f(2, y=10)
+        assert calls == []
+        await asyncio.sleep(0.1)
+        assert calls == [12]
+
+    asyncio.run(main())
+
+
+def test_debounce_with_max_wait_executes_while_invoked():
+    calls = []
+
+    @debounce(0.05, max_wait=0.1)
+    def f(x):
+        calls.append(x)
+
+    async def main():
+        for x in range(8):
+            f(x)
+            await asyncio.sleep(0.03)
+        assert calls  # Executed before the calls stopped
+        assert len(calls) < 8
+        await asyncio.sleep(0.1)
+        assert calls[-1] == 7
+
+    asyncio.run(main())
@@ -44,6 +44,22 @@ def test_slice_label_updates():
     assert sw.controls['yy'].label.value == '49.5 [m]'
 
 
+def test_range_slice_label_updates():
+    da = data_array(ndim=3)
+    da.coords['xx'] *= 1.1
+    sw = RangeSliceWidget(da, dims=['xx'])
+    sw.controls['xx'].value = (2, 10)
+    assert sw.controls['xx'].label.value == '2.2:11.0 [m]'
+
+
+def test_slice_label_updates_without_coord():
+    da = data_array(ndim=3)
+    del da.coords['xx']
+    sw = SliceWidget(da, dims=['xx'])
+    sw.controls['xx'].value = 7
+    assert sw.controls['xx'].label.value == '7'
+
+
 def test_make_slice_widget_with_player():
     da = data_array(ndim=3)
     sw = SliceWidget(da, dims=['zz'], enable_player=True)
@@ -62,3 +78,20 @@ def test_range_slice_dims():
     slices = {'xx': (8, 9), 'yy': (7, 10)}
     expected = da['xx', slice(*slices['xx'])]['yy', slice(*slices['yy'])]
     assert identical(slice_dims().func(da, slices=slices), expected)
+
+
+def test_slice_dims_mixed_indices_and_ranges():
+    da = data_array(ndim=3)
+    slices = {'xx': (0, da.sizes['xx']), 'yy': (7, 10), 'zz': 4}
+    expected = da['xx', 0 : da.sizes['xx']]['yy', 7:10]['zz', 4]
+    assert identical(slice_dims().func(da, slices=slices), expected)
+
+
+def test_slice_dims_full_ranges_do_not_return_the_input():
+    da = data_array(ndim=2)
+    slices = {dim: (0, size) for dim, size in da.sizes.items()}
+    out = slice_dims().func(da, slices=slices)
+    assert out is not da
+    assert identical(out, da)
+    out.coords['xx'] = out.coords['xx'] * 2.0
+    assert identical(da.coords['xx'], data_array(ndim=2).coords['xx'])